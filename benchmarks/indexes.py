@@ -0,0 +1,182 @@
+"""Latency of the hot queries before and after the composite indexes.
+
+Seeds a SQLite database with a million player rows, times the queries the
+bot issues while running games and answering commands, then applies the
+index migration and times them again:
+
+    python -m benchmarks.indexes --players 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+import os
+import random
+import statistics
+import tempfile
+import time
+from typing import Awaitable, Callable
+
+from tortoise import Tortoise, connections
+from tortoise.functions import Max
+
+from utils.models import GameModel, PlayerModel
+
+INDEX_MIGRATION = "migrations.models.2_20261017120100_indexes"
+INDEXES = (
+    "idx_gamemodel_guild_i_be8428",
+    "idx_gamemodel_is_star_06f07d",
+    "idx_playermodel_game_id_59f8b3",
+)
+
+
+async def seed(players: int, players_per_game: int, guilds: int) -> int:
+    """Inserts ended games full of players and a few running ones."""
+    connection = connections.get("default")
+    games = max(players // players_per_game, 1)
+    rng = random.Random(0)
+
+    await connection.execute_many(
+        'INSERT INTO "gamemodel" ("id", "guild_id", "channel_id", "owner_id", '
+        '"is_started", "is_ended", "current_day", "current_day_choices", '
+        "\"invited_users\") VALUES (?, ?, ?, ?, 1, ?, ?, '[]', '[]')",
+        [
+            (game_id, game_id % guilds, game_id % guilds, game_id, game_id % 50 != 0, 9)
+            for game_id in range(1, games + 1)
+        ],
+    )
+
+    rows = []
+    for player_id in range(1, games * players_per_game + 1):
+        game_id = (player_id - 1) // players_per_game + 1
+        slot = (player_id - 1) % players_per_game
+        rows.append(
+            (
+                player_id,
+                game_id,
+                rng.getrandbits(60),
+                slot >= players_per_game // 2,
+                slot == 0,
+                rng.randint(1, 9),
+                game_id if slot == 0 and game_id % 50 != 0 else None,
+            )
+        )
+        if len(rows) == 100_000:
+            await insert_players(rows)
+            rows = []
+    await insert_players(rows)
+    return games
+
+
+async def insert_players(rows: list[tuple]) -> None:
+    await connections.get("default").execute_many(
+        'INSERT INTO "playermodel" ("id", "game_id", "user_id", "is_bot", '
+        '"is_alive", "current_day", "winner_of_id", "inventory") '
+        "VALUES (?, ?, ?, ?, ?, ?, ?, '[]')",
+        rows,
+    )
+
+
+def hot_queries(games: int, guilds: int) -> dict[str, Callable[[], Awaitable]]:
+    """Returns the queries of GamesManager and the cog, on random games."""
+    rng = random.Random(1)
+
+    def game_id() -> int:
+        return rng.randint(1, games)
+
+    return {
+        "resume running games": lambda: GameModel.filter(
+            is_started=True, is_ended=False
+        ),
+        "load game state": lambda: PlayerModel.filter(game_id=game_id()).order_by("id"),
+        "hginfo players": lambda: PlayerModel.filter(game_id=game_id()).order_by(
+            "-is_alive", "-current_day", "is_injured"
+        ),
+        "alive players": lambda: PlayerModel.filter(
+            game_id=game_id(), is_alive=True
+        ).count(),
+        "hgbots last bot": lambda: PlayerModel.filter(game_id=game_id(), is_bot=True)
+        .annotate(m=Max("user_id"))
+        .first()
+        .values_list("m", flat=True),
+        "game winner": lambda: PlayerModel.get_or_none(winner_of_id=game_id()),
+        "guild finished games": lambda: GameModel.filter(
+            guild_id=rng.randrange(guilds), is_ended=True
+        ).count(),
+    }
+
+
+async def measure(queries: dict, runs: int) -> dict[str, float]:
+    """Returns the median latency of every query in milliseconds."""
+    results = {}
+    for name, query in queries.items():
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            await query()
+            timings.append((time.perf_counter() - start) * 1000)
+        results[name] = statistics.median(timings)
+    return results
+
+
+async def run(players: int, players_per_game: int, guilds: int, runs: int) -> None:
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    await Tortoise.init(db_url=f"sqlite://{path}", modules={"models": ["utils.models"]})
+    try:
+        await Tortoise.generate_schemas()
+        connection = connections.get("default")
+        for index in INDEXES:
+            await connection.execute_script(f'DROP INDEX "{index}"')
+
+        start = time.perf_counter()
+        games = await seed(players, players_per_game, guilds)
+        print(
+            f"Seeded {games * players_per_game} players in {games} games "
+            f"in {time.perf_counter() - start:.1f}s"
+        )
+
+        before = await measure(hot_queries(games, guilds), runs)
+
+        migration = importlib.import_module(INDEX_MIGRATION)
+        start = time.perf_counter()
+        await connection.execute_script(await migration.upgrade(connection))
+        print(f"Applied the index migration in {time.perf_counter() - start:.1f}s")
+
+        after = await measure(hot_queries(games, guilds), runs)
+    finally:
+        await connections.close_all()
+        os.remove(path)
+
+    print(f"\n{'query':<24} {'before':>11} {'after':>11} {'speedup':>9}")
+    for name in before:
+        print(
+            f"{name:<24} {before[name]:>9.3f}ms {after[name]:>9.3f}ms "
+            f"{before[name] / after[name]:>8.1f}x"
+        )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.indexes",
+        description="Time the hot queries without and with the indexes.",
+    )
+    parser.add_argument("--players", type=int, default=1_000_000)
+    parser.add_argument("--players-per-game", type=int, default=24)
+    parser.add_argument("--guilds", type=int, default=500)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    asyncio.run(
+        run(
+            players=args.players,
+            players_per_game=args.players_per_game,
+            guilds=args.guilds,
+            runs=args.runs,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,415 @@
+"""Benchmarks of the engine hot paths, compared against a saved baseline.
+
+Times event sampling, every event callback against in-memory players, the
+/hginfo rendering, whole game days through `GamesManager.run_day` with a fake
+channel, and the stats queries on a seeded database. Save a baseline before
+a change and compare the same machine against it afterwards:
+
+    python -m benchmarks.suite --save baseline.json
+    python -m benchmarks.suite --compare baseline.json
+
+The comparison prints a regression report and exits with status 1 if any
+benchmark got slower than the threshold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Optional
+
+from tortoise import connections
+
+import cogs.HungerGames as hunger_games
+from benchmarks.indexes import seed
+from cogs.HungerGames import HungerGames
+from game_utils.events_data import event_list, get_random_event
+from game_utils.GamesManager import GamesManager
+from game_utils.GameState import GameState
+from game_utils.simulate import create_state
+from utils import stats, storage
+from utils.items import items
+from utils.models import GameModel, GuildStatsModel, PlayerModel, PlayerStatsModel
+
+THRESHOLD = 1.25
+
+
+@dataclass
+class Result:
+    """Per-operation latency of a benchmark in microseconds."""
+
+    runs: int
+    median_us: float
+    p90_us: float
+
+
+@dataclass
+class Case:
+    """Benchmark timing `run` on the output of `prepare`, which is not timed."""
+
+    run: Callable[[Any], Awaitable]
+    prepare: Callable[[], Awaitable[Any]]
+    runs: int
+    operations: int = 1  # per run, results are per operation
+
+
+async def nothing() -> None:
+    return None
+
+
+async def measure(case: Case, runs: int) -> list[float]:
+    """Returns the sorted timings of the case in microseconds per operation.
+
+    Like timeit, the garbage collector is off while timing.
+    """
+    timings = []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(runs):
+            args = await case.prepare()
+            start = time.perf_counter_ns()
+            await case.run(args)
+            elapsed = time.perf_counter_ns() - start
+            timings.append(elapsed / 1e3 / case.operations)
+    finally:
+        gc.enable()
+    return sorted(timings)
+
+
+async def measure_rounds(cases: dict[str, Case], rounds: int) -> dict[str, Result]:
+    """Measures the cases in interleaved rounds and keeps their fastest round.
+
+    A slow phase of the machine then only hurts a single round of every case
+    instead of a whole run of some cases.
+    """
+    best: dict[str, list[float]] = {}
+    for _ in range(rounds):
+        for name, case in cases.items():
+            timings = await measure(case, max(case.runs // rounds, 1))
+            if name not in best or statistics.median(timings) < statistics.median(
+                best[name]
+            ):
+                best[name] = timings
+
+    return {
+        name: Result(
+            runs=cases[name].runs,
+            median_us=statistics.median(timings),
+            p90_us=timings[min(int(len(timings) * 0.9), len(timings) - 1)],
+        )
+        for name, timings in best.items()
+    }
+
+
+class FakeScheduler(object):
+    """Message scheduler that drops the messages."""
+
+    def send(self, *_args, **_kwargs) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(None)
+        return future
+
+
+class FakePaginator(object):
+    def __init__(self, *_args, **_kwargs):
+        pass
+
+    async def respond(self, *_args, **_kwargs):
+        pass
+
+
+def fake_client() -> SimpleNamespace:
+    return SimpleNamespace(
+        get_guild=lambda *_args: None,
+        user=SimpleNamespace(display_avatar=SimpleNamespace(url=None)),
+        message_scheduler=FakeScheduler(),
+    )
+
+
+def fake_context(guild_id: int) -> SimpleNamespace:
+    async def respond(*_args, **_kwargs):
+        pass
+
+    return SimpleNamespace(
+        guild=SimpleNamespace(id=guild_id),
+        bot=fake_client(),
+        interaction=None,
+        respond=respond,
+        defer=respond,
+    )
+
+
+async def event_cases(runs: int) -> dict[str, Case]:
+    rng = random.Random(0)
+
+    async def sample_events(count: int) -> None:
+        for _ in range(count):
+            get_random_event(rng=rng)
+
+    async def prepare_count() -> int:
+        return 1000
+
+    cases = {"sample event": Case(sample_events, prepare_count, runs, 1000)}
+
+    names = list(items.labels)
+    seeds = iter(range(sys.maxsize))
+
+    async def prepare() -> GameState:
+        state = create_state(players=10, seed=next(seeds))
+        # Some players carry items, so the item branches run too
+        for player in state.players.values():
+            if state.rng.random() < 0.5:
+                player.items = items.mask(state.rng.choice(names))
+        return state
+
+    for event in event_list:
+
+        async def run(state: GameState, event=event) -> None:
+            event.execute(player=state.players[1], state=state)
+
+        cases[f"event {event.name}"] = Case(run, prepare, runs)
+    return cases
+
+
+async def rendering_cases(runs: int, large: int) -> dict[str, Case]:
+    cog = HungerGames(SimpleNamespace(load_extension=None))
+    cog.GamesManager = GamesManager(client=fake_client())
+    hunger_games.Paginator = FakePaginator
+    names = list(items.labels)
+
+    cases = {}
+    for size in (24, large):
+        game = await GameModel.create(
+            guild_id=size, channel_id=size, owner_id=0, is_started=True
+        )
+        state = create_state(players=size, seed=size, game_id=game.id)
+        state.game = game
+        rng = random.Random(size)
+        for player in state.players.values():
+            player.is_alive = rng.random() < 0.5
+            player.is_injured = rng.random() < 0.2
+            player.current_day = rng.randint(0, 8)
+            player.death_by = "benchmark"
+            player.items = items.mask(*rng.sample(names, rng.randint(0, 3)))
+        cog.GamesManager.states[game.id] = state
+        players = list(state.players.values())
+
+        async def format_players(_args, players=players) -> None:
+            for player in players:
+                cog.format_player(player, None)
+
+        async def hginfo(_args, game=game) -> None:
+            await cog.hginfo.callback(cog, fake_context(game.guild_id), game_id=game.id)
+
+        cases[f"format_player x{size}"] = Case(format_players, nothing, runs)
+        cases[f"hginfo {size} players"] = Case(
+            hginfo, nothing, runs if size <= 24 else 3
+        )
+    return cases
+
+
+async def day_cases(runs: int) -> dict[str, Case]:
+    manager = GamesManager(client=fake_client(), batch_days=False)
+    seeds = iter(range(sys.maxsize))
+
+    async def prepare() -> GameState:
+        game = await GameModel.create(
+            guild_id=0, channel_id=0, owner_id=0, is_started=True, seed=next(seeds)
+        )
+        await PlayerModel.bulk_create(
+            [PlayerModel(game=game, user_id=index, is_bot=True) for index in range(24)]
+        )
+        return await GameState.load(game=game)
+
+    async def run_day(state: GameState) -> None:
+        players = state.alive_players()
+        state.rng.shuffle(players)
+        async for _ in manager.run_day(state=state, players=players, remaining_time=0):
+            pass
+
+    return {"run_day 24 players": Case(run_day, prepare, runs)}
+
+
+async def stats_cases(runs: int, players: int) -> dict[str, Case]:
+    connection = connections.get(storage.WRITER)
+    games = await seed(players=players, players_per_game=24, guilds=500)
+
+    # The first player of every game killed the rest of it
+    await connection.execute_many(
+        'INSERT INTO "playermodel_playermodel" ("playermodel_rel_id", '
+        '"playermodel_id") VALUES (?, ?)',
+        [
+            ((game - 1) * 24 + 1, (game - 1) * 24 + slot)
+            for game in range(1, games + 1)
+            for slot in range(13, 25)
+        ],
+    )
+
+    rng = random.Random(2)
+    db = storage.read_db()
+
+    async def prepare() -> int:
+        return rng.randint(1, games * 24)
+
+    async def backfill(_args) -> None:
+        await stats.backfill()
+
+    async def player_stats(user_id: int) -> None:
+        await PlayerStatsModel.filter(user_id=user_id, guild_id=stats.GLOBAL).using_db(
+            db
+        ).get_or_none()
+
+    async def guild_stats(player_id: int) -> None:
+        await GuildStatsModel.filter(guild_id=player_id % 500).using_db(
+            db
+        ).get_or_none()
+
+    async def count_kills(player_id: int) -> None:
+        first = player_id - (player_id - 1) % 24
+        await stats.count_kills(list(range(first, first + 24)), using_db=db)
+
+    # The backfill goes first, it builds the rows the other cases read
+    return {
+        "stats backfill": Case(backfill, nothing, 1),
+        "stats hgplayer": Case(player_stats, prepare, runs),
+        "stats hgserver": Case(guild_stats, prepare, runs),
+        "stats count_kills": Case(count_kills, prepare, runs),
+    }
+
+
+async def run_suite(
+    runs: int,
+    rounds: int,
+    large: int,
+    seed_players: int,
+    only: Optional[str] = None,
+) -> dict[str, Result]:
+    """Runs the benchmarks on a fresh temporary database."""
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    await storage.init(db_url=f"sqlite://{path}")
+    try:
+        await storage.generate_schemas()
+
+        results = {}
+        # The stats seed inserts its own ids, it goes first
+        groups = {
+            "stats": lambda: stats_cases(runs, seed_players),
+            "events": lambda: event_cases(runs),
+            "rendering": lambda: rendering_cases(runs, large),
+            "days": lambda: day_cases(max(runs // 10, rounds)),
+        }
+        for group, cases in groups.items():
+            if only and only != group:
+                continue
+            start = time.perf_counter()
+            results.update(await measure_rounds(await cases(), rounds))
+            print(f"{group}: {time.perf_counter() - start:.1f}s", file=sys.stderr)
+    finally:
+        await connections.close_all()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+    return results
+
+
+def compare(
+    baseline: dict[str, dict], results: dict[str, Result], threshold: float
+) -> tuple[list[str], list[str]]:
+    """Returns the report lines and the names of the regressed benchmarks."""
+    lines = [f"{'benchmark':<36} {'baseline':>11} {'current':>11} {'change':>8}"]
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if not before:
+            lines.append(f"{name:<36} {'-':>11} {result.median_us:>9.1f}us {'new':>8}")
+            continue
+
+        ratio = result.median_us / before["median_us"]
+        flag = ""
+        if ratio > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 / threshold:
+            flag = "  faster"
+        lines.append(
+            f"{name:<36} {before['median_us']:>9.1f}us {result.median_us:>9.1f}us "
+            f"{(ratio - 1) * 100:>+7.1f}%{flag}"
+        )
+
+    for name in baseline.keys() - results.keys():
+        lines.append(f"{name:<36} {baseline[name]['median_us']:>9.1f}us {'-':>11}")
+    return lines, regressions
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite",
+        description="Benchmark the engine hot paths against a baseline.",
+    )
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--large", type=int, default=10_000, help="players of hginfo")
+    parser.add_argument("--seed-players", type=int, default=240_000)
+    parser.add_argument("--only", choices=["stats", "events", "rendering", "days"])
+    parser.add_argument("--save", metavar="PATH", help="write results as baseline")
+    parser.add_argument("--compare", metavar="PATH", help="baseline to compare to")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=THRESHOLD,
+        help="slowdown ratio reported as a regression",
+    )
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(
+        run_suite(
+            runs=args.runs,
+            rounds=args.rounds,
+            large=args.large,
+            seed_players=args.seed_players,
+            only=args.only,
+        )
+    )
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "results": {
+                        name: asdict(result) for name, result in results.items()
+                    },
+                },
+                file,
+                indent=2,
+            )
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["results"]
+        lines, regressions = compare(baseline, results, args.threshold)
+        print("\n".join(lines))
+        if regressions:
+            print(f"\n{len(regressions)} regressions over {args.threshold}x")
+            sys.exit(1)
+    else:
+        print(f"{'benchmark':<36} {'median':>11} {'p90':>11}")
+        for name, result in results.items():
+            print(f"{name:<36} {result.median_us:>9.1f}us {result.p90_us:>9.1f}us")
+
+
+if __name__ == "__main__":
+    main()
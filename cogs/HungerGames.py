@@ -1,21 +1,30 @@
-import asyncio
-from typing import Any, Optional
+from functools import partial
+from typing import Any, Awaitable, Callable, Optional, Union
 
 import discord
 from discord.ext import commands
-from tortoise.queryset import Count, Q
+from tortoise.functions import Max
+from tortoise.backends.base.client import BaseDBAsyncClient
 
 from game_utils.GamesManager import GamesManager
+from game_utils.ShardManager import ShardManager
+from utils import settings, stats, storage
 from utils.client import HungerGamesBot
-from utils.models import GameModel, PlayerModel
+from utils.items import items
+from utils.models import GameModel, GuildStatsModel, PlayerModel, PlayerStatsModel
 from utils.Paginator import Paginator
+from utils.profiling import profiler
 from utils.Views import JoinGameView
 
 
 class HungerGames(commands.Cog):
     def __init__(self, client):
         self.client: HungerGamesBot = client
-        self.GamesManager: GamesManager = GamesManager(client=self.client)
+        self.GamesManager: Union[GamesManager, ShardManager] = (
+            ShardManager(client=self.client)
+            if settings.GAME_SHARDS > 0
+            else GamesManager(client=self.client)
+        )
 
     @commands.Cog.listener()
     async def on_ready(self):
@@ -54,19 +63,12 @@ class HungerGames(commands.Cog):
                     "❌ This game does not have enough players.", ephemeral=True
                 )
 
-            try:
-                await interaction.message.edit(view=None)
-            except (discord.NotFound, discord.Forbidden):
-                game.is_ended = True
-                return await game.save()
-
-            game.is_started = True
-            await game.save()
-
-            await interaction.response.send_message(
-                f"✅ The game **{game}** has started.", ephemeral=True
+            await self.launch_game(
+                game=game,
+                channel=interaction.channel,
+                message=interaction.message,
+                respond=partial(interaction.response.send_message, ephemeral=True),
             )
-            asyncio.ensure_future(self.GamesManager.run_game(game=game))
 
         elif custom_id.startswith("join_game_"):
             game_id = int(custom_id.split("join_game_")[1])
@@ -104,7 +106,7 @@ class HungerGames(commands.Cog):
                     "❌ This game is full.", ephemeral=True
                 )
 
-            await PlayerModel.create(game=game, user_id=interaction.user.id)
+            await storage.create(PlayerModel, game=game, user_id=interaction.user.id)
             current_players = len(game.players) + 1
 
             await interaction.response.send_message(
@@ -180,6 +182,10 @@ class HungerGames(commands.Cog):
         channel: discord.Option(
             discord.TextChannel, "Channel to create the game in."
         ) = None,
+        digest: discord.Option(
+            bool, "Post the events of each day in one message with the summary?"
+        ) = False,
+        thread: discord.Option(bool, "Run the game in its own thread?") = False,
     ) -> Any:
         if max_players < 2 or (
             max_players > 24 and not await ctx.bot.is_owner(ctx.author)
@@ -194,12 +200,14 @@ class HungerGames(commands.Cog):
             )
 
         channel = channel or ctx.channel
-        game = await GameModel.create(
+        game = await self.create_game(
             guild_id=ctx.guild.id,
             channel_id=channel.id,
             owner_id=ctx.author.id,
             max_players=max_players,
             is_invite_only=private,
+            is_digest=digest,
+            is_threaded=thread,
             day_length=day_length,
         )
 
@@ -229,6 +237,14 @@ class HungerGames(commands.Cog):
             name="Day length",
             value=f"` {game.day_length} `",
         )
+        embed.add_field(
+            name="Daily digest",
+            value="` {} `".format("✅" if game.is_digest else "❌"),
+        )
+        embed.add_field(
+            name="Thread",
+            value="` {} `".format("✅" if game.is_threaded else "❌"),
+        )
         embed.add_field(name="Channel", value=channel.mention)
         embed.add_field(name="Host", value=ctx.author.mention)
 
@@ -239,10 +255,10 @@ class HungerGames(commands.Cog):
                 "❌ I don't have permission to send messages in that channel.",
                 ephemeral=True,
             )
-            return await game.delete()
+            return await self.delete_game(game=game)
 
         game.message_id = message.id
-        await game.save()
+        await storage.save(game)
 
         await ctx.respond(
             f"✅ Hunger Games created: {message.jump_url}", ephemeral=True
@@ -260,12 +276,18 @@ class HungerGames(commands.Cog):
         channel: discord.Option(
             discord.TextChannel, "Channel to create the game in."
         ) = None,
+        digest: discord.Option(
+            bool, "Post the events of each day in one message with the summary?"
+        ) = None,
+        thread: discord.Option(bool, "Run the game in its own thread?") = None,
     ) -> Any:
         if (
             private is None
             and day_length is None
             and max_players is None
             and channel is None
+            and digest is None
+            and thread is None
         ):
             return await ctx.respond(
                 "❌ You must provide at least one option to edit.", ephemeral=True
@@ -328,6 +350,18 @@ class HungerGames(commands.Cog):
             name="Day length",
             value=f"` {game.day_length if day_length is None else day_length} `",
         )
+        embed.add_field(
+            name="Daily digest",
+            value="` {} `".format(
+                "✅" if (game.is_digest if digest is None else digest) else "❌"
+            ),
+        )
+        embed.add_field(
+            name="Thread",
+            value="` {} `".format(
+                "✅" if (game.is_threaded if thread is None else thread) else "❌"
+            ),
+        )
         embed.add_field(
             name="Channel",
             value=channel.mention if channel else f"<#{game.channel_id}>",
@@ -384,8 +418,12 @@ class HungerGames(commands.Cog):
             game.day_length = day_length
         if max_players is not None:
             game.max_players = max_players
+        if digest is not None:
+            game.is_digest = digest
+        if thread is not None:
+            game.is_threaded = thread
 
-        await game.save()
+        await storage.save(game)
 
         await ctx.respond(f"✅ Hunger Games edited: {message.jump_url}", ephemeral=True)
 
@@ -395,11 +433,16 @@ class HungerGames(commands.Cog):
         ctx: discord.ApplicationContext,
         game_id: discord.Option(int, "Game ID to check."),
     ) -> Any:
-        game = await GameModel.get_or_none(id=game_id, guild_id=ctx.guild.id)
+        db = storage.read_db()
+        game = (
+            await GameModel.filter(id=game_id, guild_id=ctx.guild.id)
+            .using_db(db)
+            .get_or_none()
+        )
         if not game:
             return await ctx.respond("❌ Game not found.", ephemeral=True)
 
-        await game.fetch_related("players")
+        await game.fetch_related("players", using_db=db)
 
         base_message = f"> Total players: ` {len(game.players)} `\n\n"
         embed = discord.Embed(
@@ -480,7 +523,7 @@ class HungerGames(commands.Cog):
             return await ctx.respond("❌ This game is full.", ephemeral=True)
 
         game.invited_users.append(member.id)
-        await game.save()
+        await storage.save(game)
 
         await ctx.respond(
             f"✅ {member.mention} has been invited to the game **{game}**."
@@ -518,7 +561,7 @@ class HungerGames(commands.Cog):
         if current_players >= game.max_players:
             return await ctx.respond("❌ This game is full.", ephemeral=True)
 
-        await PlayerModel.create(game=game, user_id=ctx.author.id)
+        await storage.create(PlayerModel, game=game, user_id=ctx.author.id)
         await ctx.respond(
             f"✅ {ctx.author.mention} have joined the game **{game}** ({current_players + 1}/{game.max_players})."
         )
@@ -557,63 +600,26 @@ class HungerGames(commands.Cog):
             else None
         )
 
-        try:
-            await message.edit(view=None)
-        except (discord.NotFound, discord.Forbidden):
-            game.is_ended = True
-            return await game.save()
-
-        game.is_started = True
-        await game.save()
-
-        await ctx.respond(f"✅ The game **{game}** has started.", ephemeral=True)
-        asyncio.ensure_future(self.GamesManager.run_game(game=game))
+        await self.launch_game(
+            game=game,
+            channel=channel,
+            message=message,
+            respond=partial(ctx.respond, ephemeral=True),
+        )
 
     def format_player(self, player: PlayerModel, winner: Optional[PlayerModel]) -> str:
         if not player.is_alive:
             return f"~~{player}~~ 💀\n>  Died by {player.death_by}. "
 
-        item_labels = {
-            "armor": "🛡️ Armor",
-            "shield": "🛡️ Shield",
-            "medkit": "💉 Medkit",
-            "medicine": "💊 Medicine",
-            "potion": "🧪 Potion",
-            "food": "🍖 Food",
-            "charm": "✨ Charm",
-            "herbs": "🌿 Herbs",
-            "knife": "🗡️ Knife",
-            "map": "🗺️ Map",
-            "legendary_sword": "⚔️ Legendary Sword",
-            "crown": "👑 Crown",
-            "divine_favor": "☆ Divine Favor",
-            "hope": "💫 Hope",
-            "rope": "🪢 Rope",
-            "stamina": "⚡ Stamina",
-            "ancient_relic": "🏺 Ancient Relic",
-            "rivalry_marker": "⚔️ Rivalry",
-            "warning_gift": "⚠️ Warning",
-            "spirit_gift": "👻 Spirit Gift",
-            "temporal_edge": "⏳ Temporal Edge",
-            "oracle_blessing": "🔮 Oracle Blessing",
-            "knowledge_shard": "📜 Knowledge",
-            "fresh_water": "💧 Fresh Water",
-            "seeds": "🌱 Seeds",
-            "blessing": "✨ Blessing",
-            "volcanic_treasure": "🌋 Molten Treasure",
-        }
-
         badges = []
-        inventory = sorted(
-            {str(item).strip().lower() for item in (player.inventory or [])}
-        )
+        inventory = sorted(items.unpack(player.items))
 
         if player.is_injured:
             badges.append("`[ 🤕 Injured ]`")
 
         item_badges = []
         for item in inventory:
-            label = item_labels.get(item)
+            label = items.label(item)
             if label:
                 item_badges.append(f"`[ {label} ]`")
 
@@ -639,13 +645,30 @@ class HungerGames(commands.Cog):
         ctx: discord.ApplicationContext,
         game_id: discord.Option(int, "Game ID to get more info."),
     ) -> Any:
-        game = await GameModel.get_or_none(id=game_id, guild_id=ctx.guild.id)
+        # Pages of big games take longer than the interaction response window
+        await ctx.defer(ephemeral=True)
+
+        db = storage.read_db()
+        game = (
+            await GameModel.filter(id=game_id, guild_id=ctx.guild.id)
+            .using_db(db)
+            .get_or_none()
+        )
         if not game:
             return await ctx.respond("❌ Game not found.", ephemeral=True)
 
-        players = await PlayerModel.filter(game=game).order_by(
-            "-is_alive", "-current_day", "is_injured"
-        )
+        if state := self.GamesManager.states.get(game.id):
+            # Running games are ahead of the database until their day is flushed
+            players = sorted(
+                state.players.values(),
+                key=lambda p: (not p.is_alive, -p.current_day, p.is_injured),
+            )
+        else:
+            players = (
+                await PlayerModel.filter(game=game)
+                .using_db(db)
+                .order_by("-is_alive", "-current_day", "is_injured")
+            )
 
         if not game.is_started:
             return await ctx.respond(
@@ -672,28 +695,25 @@ class HungerGames(commands.Cog):
             url=ctx.bot.user.display_avatar.url,
         )
 
+        winner = (
+            await PlayerModel.filter(winner_of_id=game.id).using_db(db).get_or_none()
+        )
         if game.is_ended:
-            game_embed.add_field(
-                name="Winner",
-                value=str(await game.winner.get()),
-            )
+            game_embed.add_field(name="Winner", value=str(winner))
 
         max_day = max([player.current_day for player in players])
         embeds = [game_embed]
-        current_day = None
-        description = ""
 
-        winner = await game.winner.get_or_none()
         for i in range(0, len(players), 10):
-            for player in players[i : i + 10]:
+            current_day = None
+            description = ""
+            for position, player in enumerate(players[i : i + 10], start=i):
                 player_day = max_day if player.is_alive else player.current_day
                 if player_day != current_day:
                     current_day = player_day
                     description += f"\n## Day {current_day}\n"
 
-                description += (
-                    f"{self.format_entry(players.index(player), player, winner)}\n"
-                )
+                description += f"{self.format_entry(position, player, winner)}\n"
             embed = discord.Embed(description=description, color=discord.Color.gold())
             embeds.append(embed)
 
@@ -717,27 +737,15 @@ class HungerGames(commands.Cog):
     ) -> Any:
         member = member or ctx.author
 
-        if state == "global":
-            games = await PlayerModel.filter(user_id=member.id).count()
-            won_games = await PlayerModel.filter(
-                Q(user_id=member.id) & ~Q(winner_of=None)
-            ).count()
-            player_kills = await PlayerModel.filter(user_id=member.id).annotate(
-                kills=Count("killed_players")
+        career = (
+            await PlayerStatsModel.filter(
+                user_id=member.id,
+                guild_id=stats.GLOBAL if state == "global" else ctx.guild.id,
             )
-            player_kills = sum([p.kills for p in player_kills if p.kills])
-        else:
-            games = await PlayerModel.filter(
-                Q(user_id=member.id, game__guild_id=ctx.guild.id)
-            ).count()
-            won_games = await PlayerModel.filter(
-                Q(user_id=member.id, game__guild_id=ctx.guild.id) & ~Q(winner_of=None)
-            ).count()
-            player_kills = await PlayerModel.filter(
-                Q(user_id=member.id, game__guild_id=ctx.guild.id)
-            ).annotate(kills=Count("killed_players"))
-        player_kills = sum([p.kills for p in player_kills if p.kills])
-        if games == 0:
+            .using_db(storage.read_db())
+            .get_or_none()
+        )
+        if not career or career.games == 0:
             return await ctx.respond(
                 f"{member.mention} did not participate in any Hunger Games.",
                 ephemeral=True,
@@ -749,9 +757,11 @@ class HungerGames(commands.Cog):
             icon_url=ctx.bot.user.display_avatar.url,
         )
 
-        embed.add_field(name="Games", value=f"` {games} `")
-        embed.add_field(name="Won", value=f"` {won_games} `")
-        embed.add_field(name="Kills", value=f"` {player_kills} `")
+        embed.add_field(name="Games", value=f"` {career.games} `")
+        embed.add_field(name="Won", value=f"` {career.wins} `")
+        embed.add_field(name="Kills", value=f"` {career.kills} `")
+        embed.add_field(name="Deaths", value=f"` {career.deaths} `")
+        embed.add_field(name="Best day", value=f"` {career.best_day} `")
 
         await ctx.respond(embed=embed, ephemeral=True)
 
@@ -761,14 +771,12 @@ class HungerGames(commands.Cog):
         ctx: discord.ApplicationContext,
     ) -> Any:
         embeds = []
-        games = await GameModel.filter(guild_id=ctx.guild.id).count()
-        games_finished = await GameModel.filter(
-            guild_id=ctx.guild.id, is_ended=True
-        ).count()
-        games_kills = await GameModel.filter(guild_id=ctx.guild.id).annotate(
-            killed_players=Count("players__killed_by")
+        rollup = (
+            await GuildStatsModel.filter(guild_id=ctx.guild.id)
+            .using_db(storage.read_db())
+            .get_or_none()
         )
-        games_kills = sum([g.killed_players for g in games_kills if g.killed_players])
+        rollup = rollup or GuildStatsModel(guild_id=ctx.guild.id)
 
         embed = discord.Embed(color=discord.Color.gold())
         embed.set_author(
@@ -776,24 +784,18 @@ class HungerGames(commands.Cog):
             icon_url=ctx.bot.user.display_avatar.url,
         )
 
-        embed.add_field(name="Games", value=f"` {games} `")
-        embed.add_field(name="Finished", value=f"` {games_finished} `")
-        embed.add_field(name="Total kills", value=f"` {games_kills} `")
+        embed.add_field(name="Games", value=f"` {rollup.games} `")
+        embed.add_field(name="Finished", value=f"` {rollup.finished} `")
+        embed.add_field(name="Total kills", value=f"` {rollup.kills} `")
         embeds.append(embed)
 
-        recent_winners = (
-            await PlayerModel.filter(
-                Q(game__guild_id=ctx.guild.id, is_bot=False) & ~Q(winner_of=None)
-            )
-            .order_by("-updated_at")
-            .limit(3)
-        )
-
-        if len(recent_winners) > 0:
+        if rollup.recent_winners:
             recent_winners = "\n".join(
                 [
-                    "{} - ` Hunger Games {} `".format(winner, await winner.game.get())
-                    for winner in recent_winners
+                    "<@{}> - ` Hunger Games #{} `".format(
+                        winner["user_id"], winner["game_id"]
+                    )
+                    for winner in rollup.recent_winners
                 ]
             )
             recent_winners = discord.Embed(
@@ -810,26 +812,33 @@ class HungerGames(commands.Cog):
     async def hgdebug(
         self,
         ctx: discord.ApplicationContext,
-        players: discord.Option(int, "Number of players to create.") = 2,
+        players: discord.Option(
+            int, "Number of players to create.", min_value=2, max_value=10000
+        ) = 2,
         instant: discord.Option(bool, "Instantly end days of the game.") = False,
     ) -> Any:
-        game = await GameModel.create(
+        # Not counted in the stats, the game is deleted once it ends
+        game = await storage.create(
+            GameModel,
             guild_id=ctx.guild.id,
             channel_id=ctx.channel.id,
             owner_id=ctx.author.id,
             day_length=0 if instant else 1,
             is_invite_only=True,
             is_started=True,
+            is_debug=True,
         )
 
-        for index in range(players):
-            await PlayerModel.create(game=game, user_id=index, is_bot=True)
+        await self.create_bots(game=game, count=players)
 
         await ctx.respond(f"✅ Done - **{game}** with **{players}** players.")
         await self.GamesManager.run_game(game=game)
 
-        await PlayerModel.filter(game=game).delete()
-        await game.delete()
+        async def delete(connection: BaseDBAsyncClient) -> None:
+            await PlayerModel.filter(game=game).using_db(connection).delete()
+            await game.delete(using_db=connection)
+
+        await storage.write(delete)
 
     @commands.slash_command(description="Fill game with bots.")
     @commands.is_owner()
@@ -837,31 +846,126 @@ class HungerGames(commands.Cog):
         self,
         ctx: discord.ApplicationContext,
         game_id: discord.Option(int, "Game ID."),
-        count: discord.Option(int, "Number of bots to create.") = 1,
+        count: discord.Option(
+            int, "Number of bots to create.", min_value=1, max_value=10000
+        ) = 1,
     ) -> Any:
         game = await GameModel.get_or_none(id=game_id, guild_id=ctx.guild.id)
         if not game:
             return await ctx.respond("❌ Game not found.", ephemeral=True)
 
         if game.is_started:
-            await ctx.respond("❌ Game has already started.", ephemeral=True)
+            return await ctx.respond("❌ Game has already started.", ephemeral=True)
 
         await ctx.defer(ephemeral=True)
 
-        if (
-            model := await PlayerModel.filter(game=game, is_bot=True)
-            .order_by("-id")
+        max_user_id = (
+            await PlayerModel.filter(game=game, is_bot=True)
+            .annotate(max_user_id=Max("user_id"))
             .first()
-        ):
-            max_id = model.id
-        else:
-            max_id = 0
+            .values_list("max_user_id", flat=True)
+        )
+        await self.create_bots(game=game, count=count, first_user_id=max_user_id or 0)
 
-        for index in range(1, count + 1):
-            await PlayerModel.create(game=game, user_id=max_id + index, is_bot=True)
+        await ctx.respond(f"✅ Added **{count}** bots to **{game}**.", ephemeral=True)
 
-        await ctx.respond(
-            f"✅ Added **{count-max_id}** bots to **{game}**.", ephemeral=True
+    @commands.slash_command(description="Show latency of the game hot paths.")
+    @commands.is_owner()
+    async def hgprofile(
+        self,
+        ctx: discord.ApplicationContext,
+        stage: discord.Option(
+            str, "Stage to show.", choices=["event", "db", "send"], required=False
+        ) = None,
+        reset: discord.Option(bool, "Reset the timings afterwards.") = False,
+    ) -> Any:
+        if not profiler.enabled:
+            return await ctx.respond("❌ Profiling is disabled.", ephemeral=True)
+
+        if not profiler.rows(stage=stage):
+            return await ctx.respond("❌ Nothing was recorded yet.", ephemeral=True)
+
+        embed = discord.Embed(
+            title="Profile (ms)",
+            description=f"```\n{profiler.format(stage=stage)}\n```",
+            color=discord.Color.blurple(),
+        )
+        if settings.GAME_SHARDS > 0:
+            embed.set_footer(text="Events run in the shard workers, see their dumps.")
+
+        if reset:
+            profiler.reset()
+        await ctx.respond(embed=embed, ephemeral=True)
+
+    async def create_game(self, **kwargs: Any) -> GameModel:
+        """Creates a game and counts it in the stats of its guild."""
+
+        async def create(connection: BaseDBAsyncClient) -> GameModel:
+            game = await GameModel.create(using_db=connection, **kwargs)
+            await stats.record_created(game=game, using_db=connection)
+            return game
+
+        return await storage.write(create)
+
+    async def delete_game(self, game: GameModel) -> None:
+        """Deletes a game that never ran and takes it out of the stats of its guild."""
+
+        async def delete(connection: BaseDBAsyncClient) -> None:
+            await game.delete(using_db=connection)
+            await stats.record_deleted(game=game, using_db=connection)
+
+        await storage.write(delete)
+
+    async def launch_game(
+        self,
+        game: GameModel,
+        channel: discord.TextChannel,
+        message: discord.PartialMessage,
+        respond: Callable[[str], Awaitable[Any]],
+    ) -> None:
+        """Starts a game from its message, for the Start button and `/hgstart`."""
+        try:
+            await message.edit(view=None)
+        except (discord.NotFound, discord.Forbidden):
+            game.is_ended = True
+            return await storage.save(game)
+
+        if game.is_threaded:
+            game.thread_id = await self.open_thread(game=game, channel=channel)
+
+        game.is_started = True
+        await storage.save(game)
+
+        await respond(f"✅ The game **{game}** has started.")
+        await self.GamesManager.start_game(game=game)
+
+    async def open_thread(
+        self, game: GameModel, channel: discord.TextChannel
+    ) -> Optional[int]:
+        """Opens the thread of a game on its message, returns None if it can't."""
+        try:
+            thread = await channel.create_thread(
+                name=f"Hunger Games {game}",
+                message=discord.Object(game.message_id),
+                auto_archive_duration=10080,
+            )
+        except discord.HTTPException:
+            # Without the permission, the game is posted in the channel
+            return None
+        return thread.id
+
+    async def create_bots(
+        self, game: GameModel, count: int, first_user_id: int = 0
+    ) -> None:
+        """Creates bot players in one transaction."""
+        bots = [
+            PlayerModel(game=game, user_id=first_user_id + index, is_bot=True)
+            for index in range(1, count + 1)
+        ]
+        await storage.write(
+            lambda connection: PlayerModel.bulk_create(
+                bots, batch_size=500, using_db=connection
+            )
         )
 
 
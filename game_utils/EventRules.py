@@ -0,0 +1,476 @@
+"""Declarative event definitions and their compiler.
+
+An event is a tree of frozen nodes: `Outcome` leaves apply effects and add a
+line of text, `Switch` picks the first case whose condition holds, `Seq` runs
+its nodes in order, `OneOf` picks one of its nodes at random, `Opponent`
+involves another alive player and `Duel` draws a winner among the two.
+Arena-wide events run their body for every alive player and group the
+players by how they fared in one message.
+
+Definitions are compiled once, at import time, into nested plain functions
+writing to the EventContext of the execution: text pools become tuples,
+item names become bit masks, and running an event costs a few attribute
+operations, without any coroutine or database access.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import TYPE_CHECKING, Callable, ClassVar, Optional, Union
+
+from game_utils.Events import EventType
+from utils.items import items
+
+if TYPE_CHECKING:
+    from game_utils.Events import EventContext
+
+Runner = Callable[["EventContext"], None]
+Test = Callable[["EventContext"], bool]
+
+# A line of text, or a pool of lines one is picked from
+Texts = Union[str, tuple[str, ...]]
+
+ROLES = ("player", "opponent", "winner", "loser")
+
+
+def _pool(texts: Texts) -> tuple[str, ...]:
+    return (texts,) if isinstance(texts, str) else tuple(texts)
+
+
+def _role(role: str) -> Callable[[EventContext], object]:
+    if role not in ROLES:
+        raise ValueError(f"Unknown event role {role!r}.")
+    return attrgetter(role)
+
+
+def _names(players: list, limit: int) -> str:
+    names = ", ".join(str(player) for player in players[:limit])
+    if len(players) > limit:
+        names += f" and {len(players) - limit} more"
+    return names
+
+
+class PlainNames(object):
+    """Names of the roles without the markdown of bot names, for causes of death."""
+
+    __slots__ = ("context",)
+
+    def __init__(self, context: EventContext):
+        self.context = context
+
+    def __getitem__(self, key: str) -> str:
+        return str(getattr(self.context, key)).replace("`", "")
+
+
+# Conditions
+
+
+class Condition(object):
+    """Condition of a `Switch` case, combined with `&`, `|` and `~`."""
+
+    def compile(self) -> Test:
+        raise NotImplementedError
+
+    def __and__(self, other: Condition) -> Condition:
+        return All(self, other)
+
+    def __or__(self, other: Condition) -> Condition:
+        return AnyOf(self, other)
+
+    def __invert__(self) -> Condition:
+        return Not(self)
+
+
+@dataclass(frozen=True)
+class Has(Condition):
+    """The role holds any of the items, or at least `at_least` of them."""
+
+    names: tuple[str, ...]
+    at_least: int = 1
+    who: str = "player"
+
+    def __init__(self, *names: str, at_least: int = 1, who: str = "player"):
+        object.__setattr__(self, "names", names)
+        object.__setattr__(self, "at_least", at_least)
+        object.__setattr__(self, "who", who)
+
+    def compile(self) -> Test:
+        mask = items.mask(*self.names)
+        at_least = self.at_least
+        target = _role(self.who)
+
+        if at_least == 1:
+            return lambda context: bool(target(context).items & mask)
+        return lambda context: (target(context).items & mask).bit_count() >= at_least
+
+
+@dataclass(frozen=True)
+class Injured(Condition):
+    """The role is injured."""
+
+    who: str = "player"
+
+    def compile(self) -> Test:
+        target = _role(self.who)
+        return lambda context: target(context).is_injured
+
+
+@dataclass(frozen=True)
+class Chance(Condition):
+    """Holds with the probability, raised by `bonus` for each group of items held."""
+
+    probability: float
+    bonus: tuple[tuple[tuple[str, ...], float], ...] = ()
+
+    def compile(self) -> Test:
+        probability = self.probability
+        if not self.bonus:
+            return lambda context: context.rng.random() < probability
+
+        bonus = tuple((items.mask(*names), value) for names, value in self.bonus)
+
+        def test(context: EventContext) -> bool:
+            held = context.player.items
+            chance = probability
+            for mask, value in bonus:
+                if held & mask:
+                    chance += value
+            return context.rng.random() < chance
+
+        return test
+
+
+@dataclass(frozen=True)
+class FewAlive(Condition):
+    """At most `count` players of the game are alive."""
+
+    count: int
+
+    def compile(self) -> Test:
+        count = self.count
+        return lambda context: context.state.alive_count() <= count
+
+
+@dataclass(frozen=True)
+class All(Condition):
+    conditions: tuple[Condition, ...]
+
+    def __init__(self, *conditions: Condition):
+        object.__setattr__(self, "conditions", conditions)
+
+    def compile(self) -> Test:
+        tests = tuple(condition.compile() for condition in self.conditions)
+        return lambda context: all(test(context) for test in tests)
+
+
+@dataclass(frozen=True)
+class AnyOf(Condition):
+    conditions: tuple[Condition, ...]
+
+    def __init__(self, *conditions: Condition):
+        object.__setattr__(self, "conditions", conditions)
+
+    def compile(self) -> Test:
+        tests = tuple(condition.compile() for condition in self.conditions)
+        return lambda context: any(test(context) for test in tests)
+
+
+@dataclass(frozen=True)
+class Not(Condition):
+    condition: Condition
+
+    def compile(self) -> Test:
+        test = self.condition.compile()
+        return lambda context: not test(context)
+
+
+# Nodes
+
+
+class Node(object):
+    """Part of an event, compiled into a function of the event context."""
+
+    def compile(self) -> Runner:
+        raise NotImplementedError
+
+
+@dataclass(frozen=True)
+class Outcome(Node):
+    """Applies its effects to a role, then adds a line of text and sets the type.
+
+    Effects run in order: `take` removes all the items, `give` adds all of
+    them, `give_one` adds one picked at random (shown as `{item}` in the
+    text), `heal` and `injure` set the injury and `kill` kills the role with
+    the given cause of death, crediting `killer` with the kill if set.
+    Texts are formatted with the roles, `{player}`, `{opponent}`, `{winner}`
+    and `{loser}`, causes of death with their plain names.
+    """
+
+    type: Optional[EventType] = None
+    text: Texts = ()
+    who: str = "player"
+    take: tuple[str, ...] = ()
+    give: tuple[str, ...] = ()
+    give_one: tuple[str, ...] = ()
+    heal: bool = False
+    injure: bool = False
+    kill: Optional[str] = None
+    killer: Optional[str] = None
+
+    def compile(self) -> Runner:
+        type = self.type
+        texts = _pool(self.text)
+        target = _role(self.who)
+        take = items.mask(*self.take)
+        give = items.mask(*self.give)
+        give_one = tuple((name, items.bit(name)) for name in self.give_one)
+        heal, injure, kill = self.heal, self.injure, self.kill
+        killer = _role(self.killer) if self.killer else None
+        changes_items = bool(take or give or give_one)
+        changes_player = changes_items or heal or injure or kill is not None
+
+        def run(context: EventContext) -> None:
+            if changes_player:
+                player = target(context)
+                context.touch(player)
+
+                if changes_items:
+                    held = player.items
+                    mask = (held & ~take) | give
+                    if give_one:
+                        context.item, bit = context.rng.choice(give_one)
+                        mask |= bit
+                    if mask != held:
+                        player.items = mask
+                        player.sync_gear_from_inventory()
+
+                if heal:
+                    player.is_injured = False
+                if injure:
+                    player.is_injured = True
+                if kill is not None:
+                    player.death_by = kill.format_map(PlainNames(context))
+                    player.is_alive = False
+                    if killer:
+                        context.record_kill(killer(context), player)
+
+            if texts:
+                line = (
+                    texts[0] if len(texts) == 1 else context.rng.choice(texts)
+                ).format_map(context)
+                context.text = f"{context.text}\n{line}" if context.text else line
+            if type:
+                context.type = type
+
+        return run
+
+
+@dataclass(frozen=True)
+class Seq(Node):
+    """Runs its nodes in order."""
+
+    nodes: tuple[Node, ...]
+
+    def __init__(self, *nodes: Node):
+        object.__setattr__(self, "nodes", nodes)
+
+    def compile(self) -> Runner:
+        runners = tuple(node.compile() for node in self.nodes)
+
+        def run(context: EventContext) -> None:
+            for runner in runners:
+                runner(context)
+
+        return run
+
+
+@dataclass(frozen=True)
+class Switch(Node):
+    """Runs the node of the first case whose condition holds, or `otherwise`."""
+
+    cases: tuple[tuple[Condition, Node], ...]
+    otherwise: Optional[Node] = None
+
+    def __init__(
+        self, *cases: tuple[Condition, Node], otherwise: Optional[Node] = None
+    ):
+        object.__setattr__(self, "cases", cases)
+        object.__setattr__(self, "otherwise", otherwise)
+
+    def compile(self) -> Runner:
+        cases = tuple(
+            (condition.compile(), node.compile()) for condition, node in self.cases
+        )
+        otherwise = self.otherwise.compile() if self.otherwise else None
+
+        def run(context: EventContext) -> None:
+            for test, runner in cases:
+                if test(context):
+                    runner(context)
+                    return
+            if otherwise:
+                otherwise(context)
+
+        return run
+
+
+@dataclass(frozen=True)
+class OneOf(Node):
+    """Runs one of its nodes, picked at random."""
+
+    nodes: tuple[Node, ...]
+
+    def __init__(self, *nodes: Node):
+        object.__setattr__(self, "nodes", nodes)
+
+    def compile(self) -> Runner:
+        runners = tuple(node.compile() for node in self.nodes)
+        return lambda context: context.rng.choice(runners)(context)
+
+
+@dataclass(frozen=True)
+class Opponent(Node):
+    """Picks a random alive opponent for `node`, runs `alone` without one."""
+
+    node: Node
+    alone: Node
+
+    def compile(self) -> Runner:
+        node = self.node.compile()
+        alone = self.alone.compile()
+
+        def run(context: EventContext) -> None:
+            if context.pick_opponent():
+                node(context)
+            else:
+                alone(context)
+
+        return run
+
+
+@dataclass(frozen=True)
+class Weight(object):
+    """Weight of a duelist: a base, raised for each group of items held and
+    lowered when injured."""
+
+    base: int
+    bonus: tuple[tuple[tuple[str, ...], int], ...] = ()
+    injured: int = 0
+
+    def compile(self) -> Callable[[object], int]:
+        base, injured = self.base, self.injured
+        bonus = tuple((items.mask(*names), value) for names, value in self.bonus)
+
+        def weight(player) -> int:
+            held = player.items
+            value = base + injured * player.is_injured
+            for mask, extra in bonus:
+                if held & mask:
+                    value += extra
+            return value
+
+        return weight
+
+
+@dataclass(frozen=True)
+class Duel(Node):
+    """Draws the winner between the player and the opponent by their weights."""
+
+    player: Weight
+    opponent: Weight
+    node: Node
+
+    def compile(self) -> Runner:
+        player_weight = self.player.compile()
+        opponent_weight = self.opponent.compile()
+        node = self.node.compile()
+
+        def run(context: EventContext) -> None:
+            player, opponent = context.player, context.opponent
+            weight = player_weight(player)
+            total = weight + opponent_weight(opponent)
+            if context.rng.random() * total < weight:
+                context.winner, context.loser = player, opponent
+            else:
+                context.winner, context.loser = opponent, player
+            node(context)
+
+        return run
+
+
+@dataclass(frozen=True)
+class EventDefinition(object):
+    """Declarative definition of an event: an intro line and the event body."""
+
+    name: str
+    body: Node
+    intro: Texts = ()
+    type: Optional[EventType] = None
+
+    def compile(self) -> Runner:
+        """Returns the executor of the event."""
+        run = self.body.compile()
+        if self.intro or self.type:
+            run = Seq(Outcome(type=self.type, text=self.intro), self.body).compile()
+
+        run.__name__ = self.name
+        return run
+
+
+@dataclass(frozen=True)
+class ArenaEventDefinition(object):
+    """Declarative definition of an event hitting every alive player at once.
+
+    The body runs for each alive player in turn and only applies effects, its
+    type tells whether the player was hurt. The event adds a single message:
+    the intro, then the names of the killed, injured and spared players after
+    their labels. The last alive player cannot die, they are injured instead.
+    """
+
+    # Names listed per group, the rest are counted
+    NAMES: ClassVar[int] = 25
+
+    name: str
+    body: Node
+    intro: Texts
+    killed: str
+    injured: str
+    spared: str
+
+    def compile(self) -> Runner:
+        """Returns the executor of the event, run without a player."""
+        body = self.body.compile()
+        intro = _pool(self.intro)
+        labels = (self.killed, self.injured, self.spared)
+
+        def run(context: EventContext) -> None:
+            killed, injured, spared = groups = ([], [], [])
+            for player in context.state.alive_players():
+                context.player, context.type = player, None
+                body(context)
+                if context.type is not EventType.NEGATIVE:
+                    spared.append(player)
+                elif player.is_alive:
+                    injured.append(player)
+                else:
+                    killed.append(player)
+            context.player = None
+
+            if killed and not injured and not spared:
+                survivor = killed.pop()
+                survivor.is_alive, survivor.death_by = True, None
+                survivor.is_injured = True
+                injured.append(survivor)
+
+            lines = [context.rng.choice(intro)]
+            for label, players in zip(labels, groups):
+                if players:
+                    lines.append(f"**{label}:** {_names(players, self.NAMES)}")
+            context.text = "\n".join(lines)
+            context.type = (
+                EventType.NEGATIVE if killed or injured else EventType.POSITIVE
+            )
+
+        run.__name__ = self.name
+        return run
@@ -1,10 +1,25 @@
 from __future__ import annotations
 
+import random
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Callable, Coroutine, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping, Optional
 
 from discord import Color
 
+from utils.items import items
+from utils.profiling import profiler
+
+if TYPE_CHECKING:
+    from game_utils.EventRules import ArenaEventDefinition, EventDefinition
+    from game_utils.GameState import GameState
+    from utils.models import PlayerModel
+
+
+# Actor id of the outcomes of arena-wide events, which have no player
+ARENA = 0
+
 
 class EventType(Enum):
     """Event types for the Hunger Games."""
@@ -14,36 +29,248 @@ class EventType(Enum):
     PASSIVE = Color.blurple()
 
 
+@dataclass(frozen=True)
+class PlayerDelta:
+    """Changes made by an event to a single player."""
+
+    player_id: int
+    changes: Mapping[str, Any]
+
+
+@dataclass(frozen=True)
+class EventOutcome:
+    """Immutable result of a single event execution."""
+
+    name: str
+    type: EventType
+    text: str
+    actor_id: int
+    target_id: Optional[int] = None
+    deltas: tuple[PlayerDelta, ...] = ()
+    kills: tuple[tuple[int, int], ...] = ()
+
+
+class EventContext(object):
+    """Per-execution scratch object the event executor writes its result to.
+
+    Besides the player, the roles of the execution are the opponent, once
+    picked, and the winner and loser of a duel. A player is tracked when an
+    effect first touches it, its deltas are the tracked fields that changed.
+    """
+
+    TRACKED_FIELDS = (
+        "is_alive",
+        "is_injured",
+        "is_protected",
+        "is_armored",
+        "inventory",
+        "death_by",
+    )
+
+    __slots__ = (
+        "player",
+        "state",
+        "rng",
+        "type",
+        "text",
+        "opponent",
+        "winner",
+        "loser",
+        "item",
+        "_snapshots",
+        "_kills",
+    )
+
+    def __init__(self, player: Optional[PlayerModel], state: GameState):
+        self.player = player
+        self.state = state
+        self.rng = state.rng
+
+        self.type: Optional[EventType] = None
+        self.text: str = ""
+
+        self.opponent: Optional[PlayerModel] = None
+        self.winner: Optional[PlayerModel] = None
+        self.loser: Optional[PlayerModel] = None
+        self.item: Optional[str] = None
+
+        self._snapshots: Optional[dict[int, tuple[PlayerModel, tuple]]] = None
+        self._kills: tuple[tuple[int, int], ...] = ()
+
+    def __getitem__(self, key: str) -> Any:
+        # Event texts are formatted with `str.format_map(context)`
+        return getattr(self, key)
+
+    @staticmethod
+    def _snapshot(player: PlayerModel) -> tuple:
+        return (
+            player.is_alive,
+            player.is_injured,
+            player.is_protected,
+            player.is_armored,
+            player.items,
+            player.death_by,
+        )
+
+    def touch(self, player: PlayerModel) -> None:
+        """Tracks changes made to the player during this execution."""
+        if self._snapshots is None:
+            self._snapshots = {}
+        if player.id not in self._snapshots:
+            self._snapshots[player.id] = (player, self._snapshot(player))
+
+    def pick_opponent(self) -> Optional[PlayerModel]:
+        """Returns a random alive opponent of the player, the first one is kept."""
+        opponent = self.state.pick_opponent(self.player)
+        if opponent and not self.opponent:
+            self.opponent = opponent
+        return opponent
+
+    def record_kill(self, killer: PlayerModel, victim: PlayerModel) -> None:
+        """Records a kill made during this execution."""
+        self._kills += ((killer.id, victim.id),)
+
+    def outcome(self, event: Event) -> EventOutcome:
+        """Freezes the execution result into an EventOutcome."""
+        deltas = ()
+        if self._snapshots:
+            deltas = tuple(
+                PlayerDelta(player.id, MappingProxyType(changes))
+                for player, before in self._snapshots.values()
+                if (changes := self._changes(before, self._snapshot(player)))
+            )
+
+        return EventOutcome(
+            name=event.name,
+            type=self.type,
+            text=self.text,
+            actor_id=self.player.id if self.player else ARENA,
+            target_id=self.opponent.id if self.opponent else None,
+            deltas=deltas,
+            kills=self._kills,
+        )
+
+    def _changes(self, before: tuple, after: tuple) -> dict[str, Any]:
+        changes = {
+            field: value
+            for field, old, value in zip(self.TRACKED_FIELDS, before, after)
+            if old != value
+        }
+        if "inventory" in changes:
+            changes["inventory"] = items.unpack(changes["inventory"])
+        return changes
+
+
 class Event(object):
-    """Event object for the Hunger Games."""
+    """Event object for the Hunger Games.
+
+    Events are stateless templates shared by every running game. Their
+    declarative definition is compiled once into a synchronous executor,
+    each execution writes to its own EventContext and returns an EventOutcome.
+    """
 
-    def __init__(
-        self,
-        weight: int,
-        callback: Callable[..., Coroutine[Any, Any, Event]],
-    ):
+    # Bumped on every weight change, so samplers know when to rebuild
+    revision = 0
+
+    def __init__(self, weight: int, definition: EventDefinition | ArenaEventDefinition):
         """Initializes the Event object.
 
         Args:
             weight (int): Event weight (to calculate the chance of the event happening).
-            callback (Callable[..., Coroutine[Any, Any, Self]]): Callback of the Event.
+            definition (EventDefinition | ArenaEventDefinition): Declarative definition of the Event.
         """
 
         self.weight = weight
-        self.callback = callback
-        self._type: Optional[EventType] = None
-        self.text: Optional[str] = None
-
-    async def execute(self, *args, **kwargs) -> Event:
-        """Executes the event callback function"""
-        event = await self.callback(*args, **kwargs)
-        if not event._type or not event.text:
+        self.definition = definition
+        self.callback: Callable[[EventContext], None] = definition.compile()
+
+    @property
+    def weight(self) -> int:
+        """Event weight"""
+        return self._weight
+
+    @weight.setter
+    def weight(self, value: int) -> None:
+        self._weight = value
+        Event.revision += 1
+
+    @property
+    def name(self) -> str:
+        """Event name"""
+        return self.definition.name
+
+    def execute(self, player: Optional[PlayerModel], state: GameState) -> EventOutcome:
+        """Executes the event for the player, or the whole arena without one"""
+        context = EventContext(player=player, state=state)
+        with profiler.time("event", self.name):
+            self.callback(context)
+        if not context.type or not context.text:
             raise ValueError(
                 "Event callback does not set required parameters of Event class."
             )
+        return context.outcome(self)
+
+
+class EventSampler(object):
+    """Weighted event sampler backed by a Walker/Vose alias table.
+
+    The table is built once and drawing an event costs a single random
+    number. It is rebuilt lazily after events are registered or any event
+    weight changes.
+    """
+
+    def __init__(self, events: Iterable[Event] = ()):
+        self.events: list[Event] = events if isinstance(events, list) else [*events]
+
+        self._probabilities: list[float] = []
+        self._aliases: list[int] = []
+        self._built: tuple[int, int] = (-1, -1)
+
+    def register(self, event: Event) -> Event:
+        """Adds an event to the sampled events."""
+        self.events.append(event)
         return event
 
-    @property
-    def type(self) -> EventType:
-        """Event type"""
-        return self._type
+    def rebuild(self) -> None:
+        """Builds the alias table from the current event weights."""
+        size = len(self.events)
+        total = sum(event.weight for event in self.events)
+        if size == 0 or total <= 0:
+            raise ValueError("Cannot sample from events without positive weights.")
+
+        probabilities = [event.weight * size / total for event in self.events]
+        aliases = list(range(size))
+
+        small = [index for index, value in enumerate(probabilities) if value < 1]
+        large = [index for index, value in enumerate(probabilities) if value >= 1]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            aliases[less] = more
+            probabilities[more] += probabilities[less] - 1
+            (small if probabilities[more] < 1 else large).append(more)
+
+        for index in small + large:
+            probabilities[index] = 1.0
+
+        self._probabilities = probabilities
+        self._aliases = aliases
+        self._built = (size, Event.revision)
+
+    def _draw(self, value: float) -> Event:
+        value *= len(self._probabilities)
+        index = int(value)
+        if value - index >= self._probabilities[index]:
+            index = self._aliases[index]
+        return self.events[index]
+
+    def choice(self, rng: random.Random = random) -> Event:
+        """Returns a random event."""
+        if self._built != (len(self.events), Event.revision):
+            self.rebuild()
+        return self._draw(rng.random())
+
+    def sample(self, n: int, rng: random.Random = random) -> list[Event]:
+        """Returns n random events drawn with replacement."""
+        if self._built != (len(self.events), Event.revision):
+            self.rebuild()
+        return [self._draw(rng.random()) for _ in range(n)]
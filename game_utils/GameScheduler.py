@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import traceback
+from contextlib import suppress
+from dataclasses import dataclass
+from functools import partial
+from typing import AsyncIterator, Optional
+
+from utils import settings
+
+
+@dataclass
+class ScheduledGame:
+    """Running game driven by the scheduler."""
+
+    game_id: int
+    ticks: AsyncIterator[float]
+    done: asyncio.Future
+
+
+class GameScheduler(object):
+    """Single-timer scheduler of all running games.
+
+    A game is an async iterator that runs one step (a player event, the end of
+    a day...) per iteration and yields the seconds to wait before its next step.
+    The scheduler keeps the next due step of every game in a heap and arms a
+    single loop timer for the earliest one. Every due step runs as its own
+    task, at most `batch_size` at once, so a slow step only holds back its
+    own game.
+    """
+
+    def __init__(self, batch_size: int = settings.SCHEDULER_BATCH_SIZE):
+        """Initializes the GameScheduler.
+
+        Args:
+            batch_size (int): Maximum number of steps run concurrently.
+        """
+        self.batch_size = batch_size
+
+        self.games: dict[int, ScheduledGame] = {}
+        self._heap: list[tuple[float, int, int]] = []
+        self._sequence = 0
+
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: dict[int, asyncio.Task] = {}
+        self._slots = asyncio.Semaphore(batch_size)
+
+        # Metrics
+        self.ticks = 0
+        self.lag = 0.0
+        self.max_lag = 0.0
+
+    @property
+    def backlog(self) -> int:
+        """Number of steps that are already due."""
+        now = asyncio.get_running_loop().time()
+        return sum(1 for due, _, _ in self._heap if due <= now)
+
+    def schedule(
+        self, game_id: int, ticks: AsyncIterator[float], delay: float = 0
+    ) -> asyncio.Future:
+        """Schedules a game and returns a future resolved when it finishes.
+
+        Args:
+            game_id (int): Id of the game.
+            ticks (AsyncIterator[float]): Steps of the game.
+            delay (float): Seconds to wait before the first step.
+        """
+        if game_id in self.games:
+            raise ValueError(f"Game {game_id} is already scheduled.")
+
+        loop = asyncio.get_running_loop()
+        done = loop.create_future()
+        done.add_done_callback(self._report)
+
+        self.games[game_id] = ScheduledGame(game_id=game_id, ticks=ticks, done=done)
+        self._push(game_id, loop.time() + delay)
+        return done
+
+    async def close(self) -> None:
+        """Stops the scheduler and closes all scheduled games."""
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+        # Steps paused at an await must stop before their games can be closed
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+
+        for scheduled in list(self.games.values()):
+            try:
+                await scheduled.ticks.aclose()
+            except Exception:
+                traceback.print_exc()
+            if not scheduled.done.done():
+                scheduled.done.cancel()
+
+        self.games.clear()
+        self._heap.clear()
+
+    @staticmethod
+    def _report(done: asyncio.Future) -> None:
+        if not done.cancelled() and (error := done.exception()):
+            traceback.print_exception(error)
+
+    def _push(self, game_id: int, due: float) -> None:
+        self._sequence += 1
+        heapq.heappush(self._heap, (due, self._sequence, game_id))
+        if self._heap[0][2] == game_id:
+            self._arm()
+
+    def _arm(self) -> None:
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+        if self._heap:
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_at(self._heap[0][0], self._wake)
+
+    def _wake(self) -> None:
+        self._timer = None
+        now = asyncio.get_running_loop().time()
+        while self._heap and self._heap[0][0] <= now:
+            due, _, game_id = heapq.heappop(self._heap)
+            self.lag = now - due
+            self.max_lag = max(self.max_lag, self.lag)
+
+            task = asyncio.ensure_future(self._tick(game_id))
+            self._tasks[game_id] = task
+            task.add_done_callback(partial(self._forget, game_id))
+        self._arm()
+
+    def _forget(self, game_id: int, task: asyncio.Task) -> None:
+        if self._tasks.get(game_id) is task:
+            del self._tasks[game_id]
+
+    async def _tick(self, game_id: int) -> None:
+        async with self._slots:
+            await self._step(game_id)
+
+    async def _step(self, game_id: int) -> None:
+        scheduled = self.games.get(game_id)
+        if not scheduled:
+            return
+
+        self.ticks += 1
+        try:
+            delay = await scheduled.ticks.__anext__()
+        except StopAsyncIteration:
+            del self.games[game_id]
+            if not scheduled.done.done():
+                scheduled.done.set_result(None)
+        except Exception as e:
+            del self.games[game_id]
+            if not scheduled.done.done():
+                scheduled.done.set_exception(e)
+        else:
+            self._push(game_id, asyncio.get_running_loop().time() + max(delay, 0))
@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+import random
+from collections import defaultdict
+from typing import Iterable, Optional
+
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.functions import Max
+
+from game_utils.Events import ARENA, EventOutcome, EventType
+from game_utils.events_data import disaster_sampler, event_sampler
+from utils import settings, stats, storage
+from utils.profiling import profiler
+from utils.models import EventLogModel, GameModel, PlayerModel
+
+
+class GameState:
+    """In-memory authoritative state of a running game.
+
+    Events mutate the players held here directly, and the changes are written
+    back to the database in one transaction by `flush` (write-behind). Until
+    a flush, the database still holds the state of the last flushed day, so
+    a crash runs the current day again, like the `current_day` reload logic
+    expects.
+
+    All randomness of the game is drawn from `rng`, which is reseeded from
+    the game seed at the start of every day. A game run from its seed and
+    players without a restart is therefore reproducible, like the simulator
+    relies on. A day run again after a restart is not the original one: the
+    players are loaded in a different order, and a day resumed after a
+    mid-day flush goes on with its pending players only.
+
+    Alive players are also kept in an index, a swap-remove array with an id to
+    slot map, so picking an opponent and counting the alive players are O(1).
+    The index follows the deaths committed by `commit`.
+
+    Committed events are buffered too and appended to the event log by the
+    next flush, numbered by their order within the day. A day run again after
+    a crash numbers its events from the start again, the log keeps the rows it
+    already has for those numbers. A day whose progress was flushed, like on
+    a clean shutdown, goes on numbering after its logged events instead, and
+    the digest of a digest game is rebuilt from them.
+    """
+
+    PLAYER_FIELDS = (
+        "current_day",
+        "is_alive",
+        "is_injured",
+        "is_protected",
+        "is_armored",
+        "inventory",
+        "death_by",
+        "winner_of_id",
+        "updated_at",
+    )
+
+    # Games whose players are loaded per query, below the SQLite variable limit
+    LOAD_CHUNK = 10000
+
+    def __init__(self, game: GameModel, players: Iterable[PlayerModel]):
+        self.game = game
+        self.players: dict[int, PlayerModel] = {player.id: player for player in players}
+
+        self._dirty: set[int] = set()
+        self._kills: list[tuple[int, int]] = []
+        self._events: list[tuple[int, int, EventOutcome]] = []
+        self._tick = 0
+        self._recorded = game.is_ended
+
+        # Outcomes of the day waiting for the digest message of digest games
+        self.digest: list[EventOutcome] = []
+
+        self._alive: list[PlayerModel] = []
+        self._slots: dict[int, int] = {}
+        for player in self.players.values():
+            if player.is_alive:
+                self._add_alive(player)
+
+        self.rng = self.day_rng(game.current_day)
+
+    @classmethod
+    async def load(cls, game: GameModel) -> GameState:
+        """Loads the game players from the database."""
+        state = cls(
+            game=game, players=await PlayerModel.filter(game=game).order_by("id")
+        )
+        await cls._resume_days({game.id: state})
+        return state
+
+    @classmethod
+    async def load_many(cls, games: list[GameModel]) -> dict[int, GameState]:
+        """Loads the players of many games at once, returns the states by game id."""
+        players: dict[int, list[PlayerModel]] = {game.id: [] for game in games}
+        for start in range(0, len(games), cls.LOAD_CHUNK):
+            chunk = [game.id for game in games[start : start + cls.LOAD_CHUNK]]
+            for player in await PlayerModel.filter(game_id__in=chunk).order_by(
+                "game_id", "id"
+            ):
+                players[player.game_id].append(player)
+
+        states = {game.id: cls(game=game, players=players[game.id]) for game in games}
+        await cls._resume_days(states)
+        return states
+
+    @classmethod
+    async def _resume_days(cls, states: dict[int, GameState]) -> None:
+        # Days started before the load continue after their logged events
+        resumed = [
+            game_id
+            for game_id, state in states.items()
+            if any(
+                player.current_day == state.game.current_day
+                for player in state.players.values()
+            )
+        ]
+        for start in range(0, len(resumed), cls.LOAD_CHUNK):
+            rows = (
+                await EventLogModel.filter(
+                    game_id__in=resumed[start : start + cls.LOAD_CHUNK]
+                )
+                .annotate(last=Max("tick"))
+                .group_by("game_id", "day")
+                .values("game_id", "day", "last")
+            )
+            for row in rows:
+                state = states[row["game_id"]]
+                if row["day"] == state.game.current_day:
+                    state._tick = row["last"] + 1
+
+        # Their digest still has to post the events logged before the load
+        days: dict[int, list[int]] = defaultdict(list)
+        for game_id in resumed:
+            if states[game_id].game.is_digest:
+                days[states[game_id].game.current_day].append(game_id)
+        for day, game_ids in days.items():
+            for start in range(0, len(game_ids), cls.LOAD_CHUNK):
+                for row in await EventLogModel.filter(
+                    game_id__in=game_ids[start : start + cls.LOAD_CHUNK], day=day
+                ).order_by("game_id", "tick"):
+                    states[row.game_id].digest.append(
+                        EventOutcome(
+                            name=row.name,
+                            type=EventType[row.type.upper()],
+                            text=row.text,
+                            actor_id=row.actor_id,
+                            target_id=row.target_id,
+                        )
+                    )
+
+    @property
+    def seed(self) -> int:
+        """Seed of the game, games created before seeding fall back to their id."""
+        return self.game.seed if self.game.seed is not None else self.game.id
+
+    def day_rng(self, day: int) -> random.Random:
+        """Returns the random generator for the given day of the game."""
+        return random.Random(f"{self.seed}:{day}")
+
+    def next_day(self) -> None:
+        """Advances the game to the next day."""
+        self.game.current_day += 1
+        self.game.current_day_choices.clear()
+        self.rng = self.day_rng(self.game.current_day)
+        self._tick = 0
+
+    def alive_players(self) -> list[PlayerModel]:
+        """Returns a list of alive players in the game."""
+        return [player for player in self.players.values() if player.is_alive]
+
+    def alive_count(self) -> int:
+        """Returns the number of alive players in the game."""
+        return len(self._alive)
+
+    def _add_alive(self, player: PlayerModel) -> None:
+        if player.id not in self._slots:
+            self._slots[player.id] = len(self._alive)
+            self._alive.append(player)
+
+    def _remove_alive(self, player_id: int) -> None:
+        slot = self._slots.pop(player_id, None)
+        if slot is None:
+            return
+
+        # Move the last player into the freed slot
+        last = self._alive.pop()
+        if slot < len(self._alive):
+            self._alive[slot] = last
+            self._slots[last.id] = slot
+
+    def pending_players(self) -> list[PlayerModel]:
+        """Returns alive players that did not have their event today yet."""
+        return [
+            player
+            for player in self.players.values()
+            if player.is_alive and player.current_day != self.game.current_day
+        ]
+
+    def deaths(self, day: int) -> list[PlayerModel]:
+        """Returns players that died on the given day."""
+        return [
+            player
+            for player in self.players.values()
+            if not player.is_alive and player.current_day == day
+        ]
+
+    def pick_opponent(self, player: PlayerModel) -> Optional[PlayerModel]:
+        """Returns a random alive player other than the given one."""
+        while True:
+            own = self._slots.get(player.id)
+            count = len(self._alive) - (own is not None)
+            if count < 1:
+                return None
+
+            # Draw among the other slots by skipping over the player's own one
+            slot = self.rng.randrange(count)
+            if own is not None and slot >= own:
+                slot += 1
+
+            opponent = self._alive[slot]
+            if opponent.is_alive:
+                return opponent
+
+            # Killed earlier in the running event, before its commit
+            self._remove_alive(opponent.id)
+
+    @property
+    def pending_events(self) -> int:
+        """Number of committed events not written to the event log yet."""
+        return len(self._events)
+
+    def mark_dirty(self, *players: PlayerModel) -> None:
+        """Marks players to be written on the next flush."""
+        self._dirty.update(player.id for player in players)
+
+    def commit(self, outcome: EventOutcome) -> None:
+        """Registers the changes described by the outcome for the next flush."""
+        for delta in outcome.deltas:
+            player = self.players[delta.player_id]
+            if delta.changes.get("is_alive") is False:
+                player.current_day = self.game.current_day
+                self._remove_alive(player.id)
+            elif delta.changes.get("is_alive") is True:
+                self._add_alive(player)
+            self._dirty.add(player.id)
+
+        self._kills.extend(outcome.kills)
+
+        if outcome.actor_id != ARENA:
+            actor = self.players[outcome.actor_id]
+            actor.current_day = self.game.current_day
+            self._dirty.add(actor.id)
+
+        self._events.append((self.game.current_day, self._tick, outcome))
+        self._tick += 1
+
+    def run_event(self, player: PlayerModel) -> EventOutcome:
+        """Runs a random event for the player and commits it to the state."""
+        event = event_sampler.choice(self.rng)
+        outcome = event.execute(player=player, state=self)
+        self.commit(outcome)
+        return outcome
+
+    def run_disaster(self) -> Optional[EventOutcome]:
+        """Rolls the arena-wide disaster of the day, runs and commits it if any.
+
+        A disaster hits every alive player in one pass and commits a single
+        outcome, its changes are written by the flush with the rest of the day.
+        """
+        if self.alive_count() < 2 or self.rng.random() >= settings.DISASTER_CHANCE:
+            return None
+
+        event = disaster_sampler.choice(self.rng)
+        outcome = event.execute(player=None, state=self)
+        self.commit(outcome)
+        return outcome
+
+    async def flush(self) -> None:
+        """Writes the game and all pending player changes in one transaction.
+
+        The flush that ends the game also records the career stats of the players.
+        The write goes through the storage writer, which may group it with the
+        flushes of other games. Changes committed while it is written are kept
+        for the next flush.
+        """
+        dirty, self._dirty = self._dirty, set()
+        kills = len(self._kills)
+
+        players = [self.players[player_id] for player_id in dirty]
+        for player in players:
+            player.pack_inventory()
+
+        victims: dict[int, list[PlayerModel]] = defaultdict(list)
+        for killer_id, victim_id in self._kills[:kills]:
+            victims[killer_id].append(self.players[victim_id])
+
+        record = self.game.is_ended and not self._recorded
+        events = self._event_rows()
+
+        async def write(connection: BaseDBAsyncClient) -> None:
+            if events:
+                await self._write_events(events, connection)
+            if players:
+                await PlayerModel.bulk_update(
+                    players, fields=self.PLAYER_FIELDS, using_db=connection
+                )
+            for killer_id, killed in victims.items():
+                killer = self.players[killer_id]
+                await killer.killed_players.add(*killed, using_db=connection)
+            await self.game.save(using_db=connection)
+            if record:
+                await stats.record_game(game=self.game, using_db=connection)
+
+        try:
+            with profiler.time("db", "flush"):
+                await storage.write(write)
+        except BaseException:
+            self._dirty |= dirty
+            raise
+        self._recorded = self.game.is_ended
+
+        del self._kills[:kills]
+        del self._events[: len(events)]
+
+    def _event_rows(self) -> list[EventLogModel]:
+        return [
+            EventLogModel(
+                game_id=self.game.id,
+                day=day,
+                tick=tick,
+                name=outcome.name,
+                type=outcome.type.name.lower(),
+                actor_id=outcome.actor_id,
+                target_id=outcome.target_id,
+                text=outcome.text,
+            )
+            for day, tick, outcome in self._events
+        ]
+
+    @staticmethod
+    async def _write_events(
+        rows: list[EventLogModel], connection: BaseDBAsyncClient
+    ) -> None:
+        await EventLogModel.bulk_create(
+            rows, batch_size=500, ignore_conflicts=True, using_db=connection
+        )
+
+    async def flush_events(self) -> None:
+        """Appends the buffered events to the event log, without the players."""
+        rows = self._event_rows()
+        if rows:
+            with profiler.time("db", "flush_events"):
+                await storage.write(
+                    lambda connection: self._write_events(rows, connection)
+                )
+            del self._events[: len(rows)]
@@ -1,76 +1,165 @@
 import asyncio
 import random
 from datetime import datetime
-from typing import Union
+from typing import AsyncIterator, Optional, Union
 
 import discord
-from tortoise.queryset import Q
 
-from game_utils.events_data import get_random_event
+from game_utils.Events import EventOutcome
+from game_utils.GameScheduler import GameScheduler
+from game_utils.GameState import GameState
+from utils import settings, storage
 from utils.client import HungerGamesBot
+from utils.MessageScheduler import (
+    MESSAGE_TEXT_LIMIT,
+    Priority,
+    count_components,
+    text_length,
+)
 from utils.models import GameModel, PlayerModel
 
 
+def shard_of(game: GameModel, shards: int) -> int:
+    """Returns the shard of the game, partitioned by the SHARD_KEY setting."""
+    return getattr(game, settings.SHARD_KEY) % shards
+
+
 class GamesManager:
-    def __init__(self, client: HungerGamesBot):
+    # Deaths listed by name in the day summary, keeps huge games under the message limit
+    SUMMARY_DEATHS = 25
+
+    def __init__(self, client: HungerGamesBot, batch_days: Optional[bool] = None):
+        """Initializes the GamesManager.
+
+        Args:
+            client (HungerGamesBot): Bot client used to send the game messages.
+            batch_days (Optional[bool]): Resolve whole days up front and stream
+                their messages afterwards, defaults to the BATCH_DAYS setting.
+        """
         self.client = client
+        self.batch_days = settings.BATCH_DAYS if batch_days is None else batch_days
+        self.states: dict[int, GameState] = {}
+        self.scheduler = GameScheduler()
+        self._resume_lock = asyncio.Lock()
+
+    async def run_games(self, shard_id: int = 0, shards: int = 1):
+        """Resumes the running games of the database, or of one shard.
+
+        Games that are already scheduled are skipped, so this is safe to call
+        again on every reconnect. The players of all resumed games are loaded
+        at once, and the first steps of the games are spread over the
+        RESUME_WINDOW setting, the most overdue games first.
+        """
+        async with self._resume_lock:
+            games = [
+                game
+                for game in await GameModel.filter(is_started=True, is_ended=False)
+                if shard_of(game=game, shards=shards) == shard_id
+                and game.id not in self.scheduler.games
+            ]
+            if not games:
+                return
 
-    async def get_alive_players(
-        self,
-        model: Union[GameModel, PlayerModel],
-        restart: bool = False,
-        count: bool = False,
-    ) -> Union[list[PlayerModel], int]:
-        """Returns a list of alive players in the game."""
-        model = model if isinstance(model, GameModel) else model.game
-        queryset = PlayerModel.filter(Q(game=model, is_alive=True))
-        if restart:
-            queryset = queryset.filter(~Q(current_day=model.current_day))
-        return await queryset.count() if count else await queryset
-
-    async def run_games(self):
-        """Runs all games in the database."""
-        for game in await GameModel.filter(is_started=True, is_ended=False):
-            await game.fetch_related("players")
-            asyncio.ensure_future(self.run_game(game=game))
+            states = await GameState.load_many(games=games)
+            games.sort(key=self.remaining_time)
 
-    async def run_game(self, game: GameModel):
-        """Run a specific game."""
-        loop_length = game.day_length * 60
+            step = settings.RESUME_WINDOW / len(games) if len(games) > 1 else 0
+            for index, game in enumerate(games):
+                await self.start_game(
+                    game=game, state=states[game.id], delay=index * step
+                )
+
+    async def flush_states(self, states: Optional[list[GameState]] = None) -> None:
+        """Writes the in-memory state of running games to the database."""
+        for state in list(self.states.values()) if states is None else states:
+            await state.flush()
+
+    async def close(self) -> None:
+        """Stops the scheduler, then writes all games that were running.
+
+        The steps are stopped first, so nothing is committed during the writes.
+        """
+        states = list(self.states.values())
+        await self.scheduler.close()
+        await self.flush_states(states=states)
+
+    @staticmethod
+    def remaining_time(game: GameModel) -> int:
+        """Returns the seconds left in the current day of the game."""
         last_loop = game.updated_at or game.created_at
+        return int(
+            game.day_length * 60
+            - (datetime.now(last_loop.tzinfo) - last_loop).total_seconds()
+        )
+
+    async def start_game(
+        self, game: GameModel, state: Optional[GameState] = None, delay: float = 0
+    ) -> asyncio.Future:
+        """Schedules a specific game, returns a future resolved when it ends.
 
-        remaining_time = int(
-            (loop_length - (datetime.now(last_loop.tzinfo) - last_loop).total_seconds())
+        Args:
+            game (GameModel): Game to run.
+            state (Optional[GameState]): Loaded state of the game.
+            delay (float): Seconds to wait before the first step of the game.
+        """
+        if scheduled := self.scheduler.games.get(game.id):
+            return scheduled.done
+
+        remaining_time = int(self.remaining_time(game) - delay)
+        if state is None:
+            state = await GameState.load(game=game)
+            # Scheduled by another caller, like run_games, during the load
+            if scheduled := self.scheduler.games.get(game.id):
+                return scheduled.done
+
+        self.states[game.id] = state
+        return self.scheduler.schedule(
+            game_id=game.id,
+            ticks=self.game_ticks(state=state, remaining_time=remaining_time),
+            delay=delay,
         )
 
-        players = await self.get_alive_players(model=game)
-        if len(players) < 2:
-            return await self.check_game_end(game=game, skip_check=True)
+    async def run_game(self, game: GameModel):
+        """Run a specific game."""
+        await (await self.start_game(game=game))
 
-        if any([player.current_day < game.current_day for player in players]):
-            players = await self.get_alive_players(model=game, restart=True)
+    async def game_ticks(
+        self, state: GameState, remaining_time: int
+    ) -> AsyncIterator[float]:
+        """Runs the game step by step, yields the seconds until the next step."""
+        game = state.game
+        loop_length = game.day_length * 60
+        try:
+            players = state.alive_players()
+            if len(players) < 2:
+                await self.check_game_end(state=state, skip_check=True)
+                return
 
-        await game.fetch_related("players")
-        if len(game.players) == len(players):
-            await self.send_start_info(game=game)
+            if any([player.current_day < game.current_day for player in players]):
+                players = state.pending_players()
 
-        while len(players) > 1:
-            random.shuffle(players)
-            if await self.run_day(
-                game=game, players=players, remaining_time=remaining_time
-            ):
-                break
+            if len(state.players) == len(players):
+                await self.send_start_info(state=state)
 
-            remaining_time = loop_length
+            while len(players) > 1:
+                state.rng.shuffle(players)
+                run_day = self.run_batch_day if self.batch_days else self.run_day
+                async for delay in run_day(
+                    state=state, players=players, remaining_time=remaining_time
+                ):
+                    yield delay
 
-            game.current_day += 1
-            game.current_day_choices.clear()
-            await game.save()
+                if game.is_ended:
+                    break
 
-            players = await self.get_alive_players(model=game)
+                remaining_time = loop_length
 
-    async def send_start_info(self, game: GameModel) -> None:
-        channel = self.client.get_channel(game.channel_id)
+                players = state.alive_players()
+        finally:
+            self.states.pop(game.id, None)
+
+    async def send_start_info(self, state: GameState) -> None:
+        game = state.game
 
         view = discord.ui.DesignerView(timeout=0)
         container = discord.ui.Container(color=discord.Color.gold())
@@ -83,11 +172,13 @@ class GamesManager:
 
         section.add_text(f"# The Hunger Games has started!")
 
-        players = [f"- {player}" for player in game.players if player.user_id > 1000]
+        players = [
+            f"- {player}" for player in state.players.values() if not player.is_bot
+        ]
         if players:
             section.add_text("\n".join(players))
 
-        bot_count = len(game.players) - len(players)
+        bot_count = len(state.players) - len(players)
         if bot_count != 0:
             section.add_text(
                 "> **There {} {} {} in the game.**".format(
@@ -97,35 +188,112 @@ class GamesManager:
                 )
             )
 
-        channel = self.client.get_channel(game.channel_id)
-        message = (
-            channel.get_partial_message(game.message_id)
-            if channel and game.message_id
-            else None
-        )
-
         try:
-            await message.reply(view=view)
+            # Threads are opened on the game message, replies would leave them
+            await self.send(
+                state=state,
+                view=view,
+                priority=Priority.SUMMARY,
+                reference=None if game.thread_id else game.message_id,
+            )
         except (discord.NotFound, discord.Forbidden):
             game.is_ended = True
-            await game.save()
+            await storage.save(game)
 
     async def run_day(
-        self, game: GameModel, players: list[PlayerModel], remaining_time: int
-    ) -> Union[bool, None]:
+        self, state: GameState, players: list[PlayerModel], remaining_time: int
+    ) -> AsyncIterator[float]:
         """Run a day in the game."""
-        if await self.run_players_events(
-            game=game, players=players, remaining_time=remaining_time
+        disaster = self.day_disaster(state=state, players=players)
+        if disaster:
+            self.send_event(state=state, outcome=disaster)
+            if await self.check_game_end(state=state):
+                return
+
+        async for delay in self.run_players_events(
+            state=state, players=players, remaining_time=remaining_time
         ):
-            return True
-        await self.day_summary(game=game)
+            yield delay
 
-    async def day_summary(self, game: GameModel) -> None:
-        deaths_today = await PlayerModel.filter(
-            game=game, is_alive=False, current_day=game.current_day
-        )
+        if state.game.is_ended:
+            return
+
+        await self.day_summary(state=state)
+        state.next_day()
+        await state.flush()
+
+    async def run_batch_day(
+        self, state: GameState, players: list[PlayerModel], remaining_time: int
+    ) -> AsyncIterator[float]:
+        """Run a day in the game in batch mode.
+
+        All events of the day are resolved up front and committed together with
+        the day change (or the game end) in one transaction. The messages are
+        then streamed on the same pacing schedule as `run_players_events`.
+        """
+        views: list[Optional[discord.ui.DesignerView]] = []
+        summary = winner = None
+
+        disaster = self.day_disaster(state=state, players=players)
+        if disaster:
+            views.append(self.event_view(state=state, outcome=disaster))
+
+        for player in players:
+            if state.alive_count() < 2:
+                break
+            if not player.is_alive:
+                views.append(None)
+                continue
+
+            outcome = state.run_event(player=player)
+            views.append(self.event_view(state=state, outcome=outcome))
+
+        if state.alive_count() < 2:
+            winner = self.declare_winner(state=state)
+        else:
+            summary = self.day_summary_view(state=state)
+            state.next_day()
+
+        await state.flush()
+
+        player_offset = 0 if remaining_time <= 0 else int(remaining_time / len(players))
+        remaining_offset = 0
+
+        for view in views:
+            offset = random.randint(0, player_offset) if player_offset > 0 else 0
+            yield remaining_offset + offset
+            remaining_offset = player_offset - offset
+
+            if view:
+                self.send(state=state, view=view)
+
+        yield remaining_offset
+
+        if summary:
+            self.send_digest(state=state, summary=summary)
+
+        if winner:
+            self.send_digest(state=state)
+            await self.announce_winner(state=state, winner=winner)
 
-        channel = self.client.get_channel(game.channel_id)
+    def day_disaster(
+        self, state: GameState, players: list[PlayerModel]
+    ) -> Optional[EventOutcome]:
+        """Rolls the arena-wide disaster of the day.
+
+        Resumed days whose players already had their events do not roll again.
+        """
+        if len(players) != state.alive_count():
+            return None
+        return state.run_disaster()
+
+    async def day_summary(self, state: GameState) -> None:
+        self.send_digest(state=state, summary=self.day_summary_view(state=state))
+
+    def day_summary_view(self, state: GameState) -> discord.ui.DesignerView:
+        """Builds the day summary message."""
+        game = state.game
+        deaths_today = state.deaths(day=game.current_day)
 
         view = discord.ui.DesignerView(timeout=0)
         container = discord.ui.Container(color=discord.Color.from_rgb(0, 0, 0))
@@ -144,7 +312,7 @@ class GamesManager:
             ]
 
             container.add_text("# There were no shots fired this night...")
-            container.add_text(f"> {random.choice(alive_descriptions)}")
+            container.add_text(f"> {state.rng.choice(alive_descriptions)}")
         else:
             death_descriptions = [
                 "Another tribute has fallen, their fate sealed by a merciless force.",
@@ -157,77 +325,145 @@ class GamesManager:
                 "A tribute's light is extinguished, their story left unfinished in the annals of the Hunger Games.",
             ]
             day_data = [
-                f"- {player} died by {player.death_by}." for player in deaths_today
+                f"- {player} died by {player.death_by}."
+                for player in deaths_today[: self.SUMMARY_DEATHS]
             ]
+            if len(deaths_today) > self.SUMMARY_DEATHS:
+                day_data.append(
+                    f"- ...and {len(deaths_today) - self.SUMMARY_DEATHS} more."
+                )
 
             container.add_text("# Cannon shots go off in the distance...")
             container.add_text("> The following tributes have died today:")
             container.add_text("\n".join(day_data))
-            container.add_text(f"-# {random.choice(death_descriptions)}")
+            container.add_text(f"-# {state.rng.choice(death_descriptions)}")
 
-        await channel.send(view=view)
+        return view
 
     async def run_players_events(
-        self, game: GameModel, players: list[PlayerModel], remaining_time: int
-    ) -> Union[bool, None]:
-        """Run all alive players events."""
+        self, state: GameState, players: list[PlayerModel], remaining_time: int
+    ) -> AsyncIterator[float]:
+        """Run all alive players events, one scheduler step per player.
+
+        Pacing offsets use the global random module on purpose, so the outcome
+        of a game does not depend on when it was (re)started.
+        """
         player_offset = 0 if remaining_time <= 0 else int(remaining_time / len(players))
         remaining_offset = 0
 
         for player in players:
-            if player_offset > 0:
-                offset = random.randint(0, player_offset)
-                remaining_offset = player_offset - offset
-                await asyncio.sleep(offset)
+            offset = random.randint(0, player_offset) if player_offset > 0 else 0
+            yield remaining_offset + offset
+            remaining_offset = player_offset - offset
 
-            player = await PlayerModel.get(id=player.id)
             if player.is_alive:
-                await self.player_event(game=game, player=player)
-                player.current_day = game.current_day
-                await player.save()
-                if await self.check_game_end(game=game):
-                    return True
+                await self.player_event(state=state, player=player)
+                if await self.check_game_end(state=state):
+                    return
 
-            await asyncio.sleep(remaining_offset)
+        yield remaining_offset
 
-    async def player_event(self, game: GameModel, player: PlayerModel) -> None:
+    async def player_event(self, state: GameState, player: PlayerModel) -> None:
         """Run a player event."""
+        outcome = state.run_event(player=player)
+        self.send_event(state=state, outcome=outcome)
 
-        # Fetch related players to ensure we have the latest data
-        await game.fetch_related("players")
-
-        event = await get_random_event()
-        event = await event.execute(game=game, player=player, event=event)
+        # Long days write their events before the day flush
+        if state.pending_events >= settings.EVENT_LOG_BATCH_SIZE:
+            await state.flush_events()
 
+    def player_event_view(self, outcome: EventOutcome) -> discord.ui.DesignerView:
+        """Builds the player event message."""
         view = discord.ui.DesignerView(timeout=0)
-        container = discord.ui.Container(color=event.type.value)
+        container = discord.ui.Container(color=outcome.type.value)
         view.add_item(container)
 
-        container.add_text(event.text)
+        container.add_text(outcome.text)
+        return view
+
+    def event_view(
+        self, state: GameState, outcome: EventOutcome
+    ) -> Optional[discord.ui.DesignerView]:
+        """Builds the event message, digest games keep the event for the digest instead."""
+        if state.game.is_digest:
+            state.digest.append(outcome)
+            return None
+        return self.player_event_view(outcome=outcome)
+
+    def send_event(self, state: GameState, outcome: EventOutcome) -> None:
+        """Sends the event message, unless the game posts a digest."""
+        view = self.event_view(state=state, outcome=outcome)
+        if view:
+            self.send(state=state, view=view)
+
+    def send_digest(
+        self, state: GameState, summary: Optional[discord.ui.DesignerView] = None
+    ) -> None:
+        """Sends the events kept for the digest followed by the day summary.
+
+        The event containers and the summary are packed into as few messages
+        as the component and text limits of a message allow.
+        """
+        parts = [self.player_event_view(outcome=outcome) for outcome in state.digest]
+        state.digest.clear()
+        if summary:
+            parts.append(summary)
+
+        views: list[discord.ui.DesignerView] = []
+        components = length = 0
+        for part in parts:
+            size, text = count_components(part), text_length(part)
+            if (
+                not views
+                or components + size > views[-1].MAX_ITEMS
+                or length + text > MESSAGE_TEXT_LIMIT
+            ):
+                views.append(discord.ui.DesignerView(timeout=0))
+                components = length = 0
+
+            for item in list(part.children):
+                part.remove_item(item)
+                views[-1].add_item(item)
+            components += size
+            length += text
 
-        channel = self.client.get_channel(game.channel_id)
-        await channel.send(view=view)
+        for view in views:
+            self.send(state=state, view=view, priority=Priority.SUMMARY)
 
     async def check_game_end(
-        self, game: GameModel, skip_check=False
+        self, state: GameState, skip_check=False
     ) -> Union[discord.Message, None]:
         """Check if the game has ended."""
-        if skip_check or await self.get_alive_players(model=game, count=True) < 2:
-            return await self.end_game(game=game)
+        if skip_check or state.alive_count() < 2:
+            return await self.end_game(state=state)
 
-    async def end_game(self, game: GameModel) -> discord.Message:
+    async def end_game(self, state: GameState) -> discord.Message:
         """End the game."""
-        winner = await PlayerModel.get(game=game, is_alive=True)
+        winner = self.declare_winner(state=state)
+        await state.flush()
+
+        self.send_digest(state=state)
+        return await self.announce_winner(state=state, winner=winner)
+
+    def declare_winner(self, state: GameState) -> PlayerModel:
+        """Marks the last alive player as the winner, persisted on the next flush."""
+        game = state.game
+        winner = state.alive_players()[0]
 
         if winner.current_day != game.current_day:
             winner.current_day = game.current_day
 
         winner.winner_of = game
-        await winner.save()
+        state.mark_dirty(winner)
 
         game.is_ended = True
-        await game.save()
+        return winner
 
+    async def announce_winner(
+        self, state: GameState, winner: PlayerModel
+    ) -> discord.Message:
+        """Runs the winner callback and sends the winner message."""
+        game = state.game
         await self.winner_callback(winner=winner)
 
         view = discord.ui.DesignerView(timeout=0)
@@ -246,8 +482,27 @@ class GamesManager:
         else:
             container.add_text(f"# 🎉 {winner} won the **{game}** Hunger Games!")
 
-        channel = self.client.get_channel(game.channel_id)
-        return await channel.send(view=view)
+        return await self.send(state=state, view=view, priority=Priority.WINNER)
+
+    def send(
+        self,
+        state: GameState,
+        view: discord.ui.DesignerView,
+        priority: Priority = Priority.EVENT,
+        reference: Optional[int] = None,
+    ) -> asyncio.Future:
+        """Queues a game message on the bot message scheduler.
+
+        Event and summary messages are not awaited, so the game keeps its own
+        pacing while the scheduler deals with the Discord rate limits. Games
+        with a thread post there, with a rate limit bucket of their own.
+        """
+        return self.client.message_scheduler.send(
+            channel_id=state.game.thread_id or state.game.channel_id,
+            view=view,
+            priority=priority,
+            reference=reference,
+        )
 
     async def winner_callback(self, winner: PlayerModel) -> None:
         """
@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import traceback
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import partial
+from multiprocessing.connection import Connection
+from types import SimpleNamespace
+from typing import Optional
+
+import discord
+from tortoise import connections
+
+from game_utils.GamesManager import GamesManager, shard_of
+from game_utils.GameState import GameState
+from utils import settings, storage
+from utils.client import HungerGamesBot
+from utils.MessageScheduler import Priority
+from utils.models import GameModel
+from utils.profiling import profiler
+
+# IPC messages are tuples, their first item is the kind of the message:
+#   gateway -> worker: ("start", game_id), ("reply", request_id, error), ("stop",)
+#   worker -> gateway: ("send", request_id, channel_id, priority, reference,
+#                       components), ("ended", game_id)
+
+
+class ShardClient(object):
+    """Stand-in for the bot client inside a shard worker.
+
+    Game messages are rendered in the worker and forwarded to the gateway
+    process, which sends them through the bot message scheduler.
+    """
+
+    def __init__(self, connection: Connection, avatar_url: Optional[str] = None):
+        self.connection = connection
+        self.user = SimpleNamespace(display_avatar=SimpleNamespace(url=avatar_url))
+        self.message_scheduler = self
+
+        self._request = 0
+        self._replies: dict[int, asyncio.Future] = {}
+
+    def get_guild(self, guild_id: int) -> None:
+        """Guilds are only cached by the gateway."""
+        return None
+
+    def send(
+        self,
+        channel_id: int,
+        view: discord.ui.DesignerView,
+        priority: Priority = Priority.EVENT,
+        reference: Optional[int] = None,
+    ) -> asyncio.Future:
+        """Forwards a message to the gateway, same as MessageScheduler.send."""
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+        self._request += 1
+        self._replies[self._request] = future
+        self.connection.send(
+            (
+                "send",
+                self._request,
+                channel_id,
+                int(priority),
+                reference,
+                view.to_components(),
+            )
+        )
+        return future
+
+    def resolve(self, request_id: int, error: Optional[str]) -> None:
+        """Resolves a forwarded message with the result reported by the gateway."""
+        future = self._replies.pop(request_id, None)
+        if not future or future.done():
+            return
+
+        if error is None:
+            future.set_result(True)
+        elif error == "not_found":
+            response = SimpleNamespace(status=404, reason="Not Found")
+            future.set_exception(discord.NotFound(response, "Unknown Message"))
+        elif error == "forbidden":
+            response = SimpleNamespace(status=403, reason="Forbidden")
+            future.set_exception(discord.Forbidden(response, "Missing Access"))
+        else:
+            future.set_exception(RuntimeError(error))
+
+    def game_ended(self, game_id: int, *_args) -> None:
+        """Notifies the gateway that a game of this shard has ended."""
+        try:
+            self.connection.send(("ended", game_id))
+        except (BrokenPipeError, OSError):
+            pass
+
+
+def run_shard(
+    shard_id: int,
+    shards: int,
+    connection: Connection,
+    db_url: str,
+    avatar_url: Optional[str] = None,
+) -> None:
+    """Entry point of a shard worker process."""
+    asyncio.run(
+        serve_shard(
+            shard_id=shard_id,
+            shards=shards,
+            connection=connection,
+            db_url=db_url,
+            avatar_url=avatar_url,
+        )
+    )
+
+
+async def serve_shard(
+    shard_id: int,
+    shards: int,
+    connection: Connection,
+    db_url: str,
+    avatar_url: Optional[str] = None,
+) -> None:
+    """Resumes the games of the shard and serves the gateway requests."""
+    await storage.init(db_url=db_url)
+
+    loop = asyncio.get_running_loop()
+    client = ShardClient(connection=connection, avatar_url=avatar_url)
+    manager = GamesManager(client=client)
+
+    try:
+        await manager.run_games(shard_id=shard_id, shards=shards)
+        for scheduled in manager.scheduler.games.values():
+            scheduled.done.add_done_callback(
+                partial(client.game_ended, scheduled.game_id)
+            )
+
+        while True:
+            message = await loop.run_in_executor(None, connection.recv)
+            if message[0] == "start":
+                game = await GameModel.get_or_none(id=message[1], is_ended=False)
+                if not game:
+                    client.game_ended(message[1])
+                    continue
+                # Games already resumed by the worker return their running future
+                done = await manager.start_game(game=game)
+                done.add_done_callback(partial(client.game_ended, game.id))
+            elif message[0] == "reply":
+                client.resolve(*message[1:])
+            elif message[0] == "stop":
+                break
+    except (EOFError, OSError):
+        pass  # The gateway is gone
+    finally:
+        await manager.close()
+        await connections.close_all()
+
+        # Events run in the workers, each dumps its own profile
+        path, extension = os.path.splitext(settings.PROFILE_PATH)
+        profiler.dump(f"{path}.shard{shard_id}{extension}")
+
+
+@dataclass
+class Shard:
+    """Worker process of a shard and its end of the IPC channel."""
+
+    process: multiprocessing.Process
+    connection: Connection
+
+
+class ShardManager(object):
+    """Runs the games in worker processes, drop-in for GamesManager in the bot.
+
+    Games are partitioned between the shards by the SHARD_KEY setting. Every
+    worker resumes the running games of its own shard when it boots, so a
+    crashed worker is restarted on its own without touching the other shards.
+    """
+
+    def __init__(
+        self,
+        client: HungerGamesBot,
+        shards: int = settings.GAME_SHARDS,
+        db_url: str = settings.DB_URL,
+    ):
+        """Initializes the ShardManager.
+
+        Args:
+            client (HungerGamesBot): Bot client used to send the game messages.
+            shards (int): Number of worker processes.
+            db_url (str): Database the workers connect to.
+        """
+        self.client = client
+        self.shards = shards
+        self.db_url = db_url
+
+        # Game states live in the workers, commands read them from the database
+        self.states: dict[int, GameState] = {}
+        self.workers: dict[int, Shard] = {}
+        self.running: dict[int, asyncio.Future] = {}
+
+        # Held while a worker is replaced, so a game start waits for the new one
+        self._locks: defaultdict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._closing = False
+
+    async def run_games(self):
+        """Starts the shard workers, each one resumes its own games."""
+        for shard_id in range(self.shards):
+            if shard_id not in self.workers:
+                self.start_worker(shard_id=shard_id)
+
+    def start_worker(self, shard_id: int) -> None:
+        """Starts the worker process of the shard."""
+        context = multiprocessing.get_context("spawn")
+        connection, worker_connection = context.Pipe()
+
+        avatar_url = self.client.user.display_avatar.url if self.client.user else None
+        process = context.Process(
+            target=run_shard,
+            args=(shard_id, self.shards, worker_connection, self.db_url, avatar_url),
+            name=f"hunger-games-shard-{shard_id}",
+            daemon=True,
+        )
+        process.start()
+        worker_connection.close()
+
+        self.workers[shard_id] = Shard(process=process, connection=connection)
+        asyncio.ensure_future(self.listen(shard_id=shard_id, connection=connection))
+
+    async def restart_worker(self, shard_id: int) -> None:
+        """Restarts the worker process of the shard."""
+        async with self._locks[shard_id]:
+            if shard := self.workers.pop(shard_id, None):
+                shard.connection.close()
+                if shard.process.is_alive():
+                    shard.process.terminate()
+                await asyncio.get_running_loop().run_in_executor(
+                    None, shard.process.join, 10
+                )
+            if not self._closing:
+                self.start_worker(shard_id=shard_id)
+
+    async def listen(self, shard_id: int, connection: Connection) -> None:
+        """Handles the messages of a worker, restarts it when it dies."""
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                message = await loop.run_in_executor(None, connection.recv)
+            except (EOFError, OSError):
+                break
+
+            try:
+                self.handle(shard_id=shard_id, message=message)
+            except Exception:
+                traceback.print_exc()
+
+        shard = self.workers.get(shard_id)
+        if not self._closing and shard and shard.connection is connection:
+            await asyncio.sleep(1)
+            await self.restart_worker(shard_id=shard_id)
+
+    def handle(self, shard_id: int, message: tuple) -> None:
+        """Handles a single message of a worker."""
+        if message[0] == "send":
+            _, request_id, channel_id, priority, reference, components = message
+            future = self.client.message_scheduler.send(
+                channel_id=channel_id,
+                view=discord.ui.DesignerView.from_dict(components, timeout=0),
+                priority=Priority(priority),
+                reference=reference,
+            )
+            future.add_done_callback(partial(self.reply, shard_id, request_id))
+        elif message[0] == "ended":
+            if (future := self.running.pop(message[1], None)) and not future.done():
+                future.set_result(None)
+
+    def reply(self, shard_id: int, request_id: int, future: asyncio.Future) -> None:
+        """Reports the result of a forwarded message back to the worker."""
+        if future.cancelled():
+            error = "cancelled"
+        elif isinstance(future.exception(), discord.NotFound):
+            error = "not_found"
+        elif isinstance(future.exception(), discord.Forbidden):
+            error = "forbidden"
+        else:
+            error = repr(future.exception()) if future.exception() else None
+
+        if shard := self.workers.get(shard_id):
+            try:
+                shard.connection.send(("reply", request_id, error))
+            except (BrokenPipeError, OSError):
+                pass
+
+    async def start_game(self, game: GameModel) -> asyncio.Future:
+        """Hands the game over to its shard, returns a future resolved when it ends."""
+        shard_id = shard_of(game=game, shards=self.shards)
+        async with self._locks[shard_id]:
+            if shard_id not in self.workers:
+                self.start_worker(shard_id=shard_id)
+
+        future = self.running.get(game.id)
+        if not future:
+            future = self.running[game.id] = asyncio.get_running_loop().create_future()
+        self.workers[shard_id].connection.send(("start", game.id))
+        return future
+
+    async def run_game(self, game: GameModel):
+        """Run a specific game."""
+        await (await self.start_game(game=game))
+
+    async def close(self) -> None:
+        """Stops all workers, they write their games before exiting."""
+        self._closing = True
+        loop = asyncio.get_running_loop()
+
+        for shard in self.workers.values():
+            try:
+                shard.connection.send(("stop",))
+            except (BrokenPipeError, OSError):
+                pass
+
+        for shard in self.workers.values():
+            await loop.run_in_executor(None, shard.process.join, 10)
+            if shard.process.is_alive():
+                shard.process.terminate()
+            shard.connection.close()
+
+        self.workers.clear()
@@ -0,0 +1,195 @@
+"""Headless Hunger Games simulator.
+
+Runs games against an in-memory GameState with the same event callbacks the
+bot uses, but without Discord, sleeps or database writes. Useful to benchmark
+and balance-test event changes offline:
+
+    python -m game_utils.simulate --games 10000 --players 24 --seed 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Optional
+
+from tortoise import Tortoise
+
+from game_utils.Events import EventOutcome
+from game_utils.GameState import GameState
+from utils.models import GameModel, PlayerModel
+
+
+@dataclass
+class SimulationReport:
+    """Aggregated results of a simulation run."""
+
+    games: int = 0
+    players: int = 0
+    elapsed: float = 0.0
+    events: Counter = field(default_factory=Counter)
+    deaths: Counter = field(default_factory=Counter)
+    days: Counter = field(default_factory=Counter)
+    wins: Counter = field(default_factory=Counter)
+    unfinished: int = 0
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "games": self.games,
+            "players": self.players,
+            "elapsed": self.elapsed,
+            "games_per_second": self.games_per_second,
+            "events": dict(self.events.most_common()),
+            "deaths": dict(self.deaths.most_common()),
+            "days": dict(sorted(self.days.items())),
+            "wins": dict(sorted(self.wins.items())),
+            "unfinished": self.unfinished,
+        }
+
+    def format(self, top: int = 15) -> str:
+        def percent(count: int, total: int) -> str:
+            return f"{count / total * 100:6.2f}%" if total else "   n/a"
+
+        lines = [
+            f"Simulated {self.games} games of {self.players} players "
+            f"in {self.elapsed:.2f}s ({self.games_per_second:.1f} games/s)",
+            f"Unfinished games: {self.unfinished}",
+            "",
+            "Days per game:",
+        ]
+        peak = max(self.days.values(), default=0)
+        for day, count in sorted(self.days.items()):
+            bar = "#" * max(1, round(count / peak * 40))
+            lines.append(f"  {day:>4} {count:>7} {bar}")
+
+        total_events = sum(self.events.values())
+        lines += ["", f"Events (top {top} of {len(self.events)}):"]
+        for name, count in self.events.most_common(top):
+            lines.append(f"  {name:<32} {count:>9} {percent(count, total_events)}")
+
+        total_deaths = sum(self.deaths.values())
+        lines += ["", f"Causes of death (top {top}):"]
+        for cause, count in self.deaths.most_common(top):
+            lines.append(f"  {cause:<48} {count:>9} {percent(count, total_deaths)}")
+
+        lines += ["", "Win rate by starting slot:"]
+        for slot in range(1, self.players + 1):
+            count = self.wins[slot]
+            lines.append(f"  {slot:>4} {count:>7} {percent(count, self.games)}")
+
+        return "\n".join(lines)
+
+
+def create_state(players: int, seed: int, game_id: int = 1) -> GameState:
+    """Creates a fresh in-memory state with unsaved bot players."""
+    game = GameModel(id=game_id, guild_id=0, channel_id=0, owner_id=0, seed=seed)
+    return GameState(
+        game=game,
+        players=[
+            PlayerModel(id=slot, game_id=game_id, user_id=slot, is_bot=True)
+            for slot in range(1, players + 1)
+        ],
+    )
+
+
+def simulate_game(
+    state: GameState, report: SimulationReport, max_days: int = 1000
+) -> Optional[PlayerModel]:
+    """Plays the game to the end, mirroring GamesManager.run_game."""
+    game = state.game
+    players = state.alive_players()
+
+    def record(outcome: EventOutcome) -> None:
+        report.events[outcome.name] += 1
+        for delta in outcome.deltas:
+            if delta.changes.get("is_alive") is False:
+                report.deaths[delta.changes.get("death_by")] += 1
+
+    while len(players) > 1 and game.current_day <= max_days:
+        state.rng.shuffle(players)
+        disaster = state.run_disaster()
+        if disaster:
+            record(disaster)
+            if state.alive_count() < 2:
+                break
+
+        for player in players:
+            if not player.is_alive:
+                continue
+
+            record(state.run_event(player=player))
+            if state.alive_count() < 2:
+                break
+        else:
+            state.next_day()
+            players = state.alive_players()
+            continue
+        break
+
+    alive = state.alive_players()
+    report.days[game.current_day] += 1
+    if len(alive) != 1:
+        report.unfinished += 1
+        return None
+
+    report.wins[alive[0].id] += 1
+    return alive[0]
+
+
+def simulate(
+    games: int, players: int, seed: Optional[int] = None, max_days: int = 1000
+) -> SimulationReport:
+    """Simulates a number of games and returns the aggregated report."""
+    if players < 2:
+        raise ValueError("At least 2 players are required.")
+
+    seeds = random.Random(seed)
+    report = SimulationReport(players=players)
+
+    start = time.perf_counter()
+    for game_id in range(1, games + 1):
+        state = create_state(
+            players=players, seed=seeds.getrandbits(63), game_id=game_id
+        )
+        simulate_game(state=state, report=report, max_days=max_days)
+        report.games += 1
+    report.elapsed = time.perf_counter() - start
+
+    return report
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m game_utils.simulate",
+        description="Run Hunger Games simulations without Discord.",
+    )
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--players", type=int, default=24)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--max-days", type=int, default=1000)
+    parser.add_argument("--top", type=int, default=15, help="rows per table")
+    parser.add_argument("--json", action="store_true", help="print report as JSON")
+    args = parser.parse_args(argv)
+
+    # Model metadata only, the simulator never touches a database
+    Tortoise.init_models(["utils.models"], "models")
+
+    report = simulate(
+        games=args.games,
+        players=args.players,
+        seed=args.seed,
+        max_days=args.max_days,
+    )
+    print(json.dumps(report.to_dict()) if args.json else report.format(args.top))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,8 +5,9 @@ from os import getenv
 from typing import Optional
 
 from dotenv import load_dotenv
-from tortoise import Tortoise, connections
+from tortoise import connections
 
+from utils import settings, storage
 from utils.client import HungerGamesBot
 
 load_dotenv(override=True)
@@ -19,8 +20,8 @@ client: Optional[HungerGamesBot] = None
 
 
 async def init():
-    await Tortoise.init(db_url="sqlite://main.db", modules={"models": ["utils.models"]})
-    await Tortoise.generate_schemas()
+    await storage.init(db_url=settings.DB_URL)
+    await storage.generate_schemas()
 
     global client
     client = HungerGamesBot(args.sync)
@@ -34,9 +35,9 @@ if __name__ == "__main__":
     except (KeyboardInterrupt, Exception) as e:
         if not isinstance(e, KeyboardInterrupt):
             traceback.print_exc()
-        loop.run_until_complete(connections.close_all())
         if client and not client.is_closed():
             loop.run_until_complete(client.close())
+        loop.run_until_complete(connections.close_all())
     finally:
         if loop.is_running():
             loop.close()
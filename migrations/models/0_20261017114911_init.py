@@ -0,0 +1,59 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "gamemodel" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "created_at" TIMESTAMP NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+    "updated_at" TIMESTAMP NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+    "guild_id" BIGINT NOT NULL,
+    "channel_id" BIGINT NOT NULL,
+    "message_id" BIGINT,
+    "owner_id" BIGINT NOT NULL,
+    "is_invite_only" INT NOT NULL  DEFAULT 0,
+    "is_started" INT NOT NULL  DEFAULT 0,
+    "is_ended" INT NOT NULL  DEFAULT 0,
+    "day_length" INT NOT NULL  DEFAULT 60,
+    "max_players" INT NOT NULL  DEFAULT 24,
+    "current_day" INT NOT NULL  DEFAULT 1,
+    "current_day_choices" JSON NOT NULL,
+    "invited_users" JSON NOT NULL
+) /* Represents a Hunger Games game. */;
+CREATE TABLE IF NOT EXISTS "playermodel" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "created_at" TIMESTAMP NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+    "updated_at" TIMESTAMP NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+    "user_id" BIGINT NOT NULL,
+    "current_day" INT NOT NULL  DEFAULT 0,
+    "is_bot" INT NOT NULL  DEFAULT 0,
+    "is_alive" INT NOT NULL  DEFAULT 1,
+    "is_injured" INT NOT NULL  DEFAULT 0,
+    "is_protected" INT NOT NULL  DEFAULT 0,
+    "is_armored" INT NOT NULL  DEFAULT 0,
+    "inventory" JSON NOT NULL,
+    "death_by" VARCHAR(256),
+    "game_id" INT NOT NULL REFERENCES "gamemodel" ("id") ON DELETE CASCADE,
+    "winner_of_id" INT  UNIQUE REFERENCES "gamemodel" ("id") ON DELETE CASCADE
+) /* Represents a player in a Hunger Games game. */;
+CREATE TABLE IF NOT EXISTS "aerich" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "version" VARCHAR(255) NOT NULL,
+    "app" VARCHAR(100) NOT NULL,
+    "content" JSON NOT NULL
+);
+CREATE TABLE IF NOT EXISTS "playermodel_playermodel" (
+    "playermodel_rel_id" INT NOT NULL REFERENCES "playermodel" ("id") ON DELETE CASCADE,
+    "playermodel_id" INT NOT NULL REFERENCES "playermodel" ("id") ON DELETE CASCADE
+);
+CREATE UNIQUE INDEX IF NOT EXISTS "uidx_playermodel_playerm_c812f2" ON "playermodel_playermodel" ("playermodel_rel_id", "playermodel_id");
+CREATE TABLE IF NOT EXISTS "playermodel_playermodel" (
+    "playermodel_rel_id" INT NOT NULL REFERENCES "playermodel" ("id") ON DELETE CASCADE,
+    "playermodel_id" INT NOT NULL REFERENCES "playermodel" ("id") ON DELETE CASCADE
+);
+CREATE UNIQUE INDEX IF NOT EXISTS "uidx_playermodel_playerm_c812f2" ON "playermodel_playermodel" ("playermodel_rel_id", "playermodel_id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        """
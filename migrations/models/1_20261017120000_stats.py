@@ -0,0 +1,36 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "gamemodel" ADD "seed" BIGINT;
+        CREATE TABLE IF NOT EXISTS "playerstatsmodel" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "created_at" TIMESTAMP NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+    "updated_at" TIMESTAMP NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+    "user_id" BIGINT NOT NULL,
+    "guild_id" BIGINT NOT NULL  DEFAULT 0,
+    "games" INT NOT NULL  DEFAULT 0,
+    "wins" INT NOT NULL  DEFAULT 0,
+    "kills" INT NOT NULL  DEFAULT 0,
+    "deaths" INT NOT NULL  DEFAULT 0,
+    "best_day" INT NOT NULL  DEFAULT 0,
+    CONSTRAINT "uid_playerstats_user_id_44c5bb" UNIQUE ("user_id", "guild_id")
+) /* Career stats of a user in a guild, guild_id 0 holds the global stats. */;
+        CREATE TABLE IF NOT EXISTS "guildstatsmodel" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "created_at" TIMESTAMP NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+    "updated_at" TIMESTAMP NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+    "guild_id" BIGINT NOT NULL UNIQUE,
+    "games" INT NOT NULL  DEFAULT 0,
+    "finished" INT NOT NULL  DEFAULT 0,
+    "kills" INT NOT NULL  DEFAULT 0,
+    "recent_winners" JSON NOT NULL
+) /* Rollup of the games of a guild, with a ring of its recent winners. */;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "guildstatsmodel";
+        DROP TABLE IF EXISTS "playerstatsmodel";
+        ALTER TABLE "gamemodel" DROP COLUMN "seed";"""
@@ -0,0 +1,15 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_gamemodel_guild_i_be8428" ON "gamemodel" ("guild_id", "is_ended");
+        CREATE INDEX IF NOT EXISTS "idx_gamemodel_is_star_06f07d" ON "gamemodel" ("is_started", "is_ended");
+        CREATE INDEX IF NOT EXISTS "idx_playermodel_game_id_59f8b3" ON "playermodel" ("game_id", "is_alive", "current_day");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_gamemodel_guild_i_be8428";
+        DROP INDEX IF EXISTS "idx_gamemodel_is_star_06f07d";
+        DROP INDEX IF EXISTS "idx_playermodel_game_id_59f8b3";"""
@@ -0,0 +1,24 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "eventlogmodel" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "created_at" TIMESTAMP NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+    "updated_at" TIMESTAMP NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+    "day" INT NOT NULL,
+    "tick" INT NOT NULL,
+    "name" VARCHAR(64) NOT NULL,
+    "type" VARCHAR(16) NOT NULL,
+    "actor_id" INT NOT NULL,
+    "target_id" INT,
+    "text" TEXT NOT NULL,
+    "game_id" INT NOT NULL REFERENCES "gamemodel" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_eventlogmod_game_id_cdc3d0" UNIQUE ("game_id", "day", "tick")
+) /* Append-only log of the events of a game. */;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "eventlogmodel";"""
@@ -0,0 +1,13 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "gamemodel" ADD "thread_id" BIGINT;
+        ALTER TABLE "gamemodel" ADD "is_threaded" INT NOT NULL  DEFAULT 0;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "gamemodel" DROP COLUMN "thread_id";
+        ALTER TABLE "gamemodel" DROP COLUMN "is_threaded";"""
@@ -0,0 +1,28 @@
+from os import getenv
+
+import pytest
+import pytest_asyncio
+from tortoise import Tortoise, connections
+
+from utils import storage
+
+# Run against PostgreSQL with e.g. postgres://postgres@localhost:5432/hg_test,
+# the database is created for the run and dropped afterwards
+TEST_DB_URL = getenv("TEST_DB_URL", "sqlite://:memory:")
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    # Connection pools are bound to their loop, all tests share the session one
+    session = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session, append=False)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session", autouse=True)
+async def initialize_tests():
+    await storage.init(db_url=TEST_DB_URL, _create_db=True)
+    await storage.generate_schemas()
+    yield
+    await Tortoise._drop_databases()
+    await connections.close_all()
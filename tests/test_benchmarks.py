@@ -0,0 +1,25 @@
+from benchmarks.suite import Result, compare
+
+
+def test_regression_report_flags_slower_benchmarks():
+    baseline = {
+        "same": {"runs": 10, "median_us": 10.0, "p90_us": 12.0},
+        "slower": {"runs": 10, "median_us": 10.0, "p90_us": 12.0},
+        "faster": {"runs": 10, "median_us": 10.0, "p90_us": 12.0},
+        "removed": {"runs": 10, "median_us": 10.0, "p90_us": 12.0},
+    }
+    results = {
+        "same": Result(runs=10, median_us=11.0, p90_us=12.0),
+        "slower": Result(runs=10, median_us=13.0, p90_us=14.0),
+        "faster": Result(runs=10, median_us=5.0, p90_us=6.0),
+        "added": Result(runs=10, median_us=1.0, p90_us=1.0),
+    }
+
+    lines, regressions = compare(baseline, results, threshold=1.25)
+
+    assert regressions == ["slower"]
+    report = {line.split()[0]: line for line in lines[1:]}
+    assert report["slower"].endswith("REGRESSION")
+    assert report["faster"].endswith("faster")
+    assert report["added"].endswith("new")
+    assert "removed" in report
@@ -0,0 +1,77 @@
+from types import SimpleNamespace
+
+import pytest
+
+from cogs.HungerGames import HungerGames
+from utils.models import GameModel, PlayerModel
+
+
+class DummyContext:
+    def __init__(self, guild_id):
+        self.guild = SimpleNamespace(id=guild_id)
+        self.responses = []
+
+    async def defer(self, *args, **kwargs):
+        pass
+
+    async def respond(self, content, *args, **kwargs):
+        self.responses.append(content)
+
+
+@pytest.mark.asyncio()
+async def test_hgbots_bulk_creates_bots_after_highest_bot():
+    cog = HungerGames(SimpleNamespace(load_extension=None))
+    game = await GameModel.create(guild_id=11, channel_id=11, owner_id=11)
+    await PlayerModel.create(game=game, user_id=123456789, is_bot=False)
+    await PlayerModel.create(game=game, user_id=7, is_bot=True)
+
+    ctx = DummyContext(guild_id=11)
+    await cog.hgbots.callback(cog, ctx, game_id=game.id, count=2500)
+
+    bots = await PlayerModel.filter(game=game, is_bot=True).values_list(
+        "user_id", flat=True
+    )
+    assert sorted(bots) == [7, *range(8, 8 + 2500)]
+    assert ctx.responses == [f"✅ Added **2500** bots to **{game}**."]
+
+
+@pytest.mark.asyncio()
+async def test_start_button_opens_the_thread_of_threaded_games():
+    cog = HungerGames(SimpleNamespace(load_extension=None))
+    started, responses = [], []
+
+    async def start_game(game):
+        started.append(game.id)
+
+    cog.GamesManager = SimpleNamespace(start_game=start_game)
+
+    game = await GameModel.create(
+        guild_id=12, channel_id=12, message_id=13, owner_id=12, is_threaded=True
+    )
+    for user_id in (1, 2):
+        await PlayerModel.create(game=game, user_id=user_id)
+
+    async def edit(**kwargs):
+        pass
+
+    async def create_thread(name, message, **kwargs):
+        assert message.id == game.message_id
+        return SimpleNamespace(id=14)
+
+    async def send_message(content, **kwargs):
+        responses.append(content)
+
+    interaction = SimpleNamespace(
+        custom_id=f"start_game_{game.id}",
+        guild=SimpleNamespace(id=12),
+        user=SimpleNamespace(id=12),
+        channel=SimpleNamespace(create_thread=create_thread),
+        message=SimpleNamespace(edit=edit),
+        response=SimpleNamespace(send_message=send_message),
+    )
+    await cog.on_interaction(interaction)
+
+    stored = await GameModel.get(id=game.id)
+    assert stored.is_started and stored.thread_id == 14
+    assert started == [game.id]
+    assert responses == [f"✅ The game **{game}** has started."]
@@ -1,35 +1,25 @@
-import asyncio
 import random
 from types import SimpleNamespace
 
 import pytest
-from tortoise import Tortoise, connections
 
-from game_utils.Events import Event
-from game_utils.events_data import event_list
+from game_utils.EventRules import (
+    Duel,
+    EventDefinition,
+    Opponent,
+    Outcome,
+    Seq,
+    Weight,
+)
+from game_utils.Events import Event, EventOutcome, EventSampler, EventType
+from game_utils import events_data
+from game_utils.events_data import event_list, event_sampler
 from game_utils.GamesManager import GamesManager
+from game_utils.GameState import GameState
+from utils.items import items
+from utils.MessageScheduler import MessageScheduler
 from utils.models import GameModel, PlayerModel
 
-loop = asyncio.new_event_loop()
-
-
-async def initialize():
-    await Tortoise.init(
-        db_url="sqlite://:memory:", modules={"models": ["utils.models"]}
-    )
-    await Tortoise.generate_schemas()
-
-
-def cleanup():
-    loop.run_until_complete(Tortoise._drop_databases())
-    loop.run_until_complete(connections.close_all())
-
-
-@pytest.fixture(scope="session", autouse=True)
-def initialize_tests(request: pytest.FixtureRequest):
-    loop.run_until_complete(initialize())
-    request.addfinalizer(cleanup)
-
 
 @pytest.mark.asyncio()
 async def test_event_pool_is_expanded():
@@ -43,8 +33,7 @@ async def test_events():
         assert isinstance(event, Event)
 
         # Test events attributes
-        assert event._type == None
-        assert event.text == None
+        assert not hasattr(event, "text")
         assert event.weight > 0
         assert event.callback != None
 
@@ -58,21 +47,32 @@ async def test_events():
         assert len(game.players) == len(players) and list(game.players) == players
 
         # Test events callback with required arguments
-        player = random.choice(players)
-        event = await event.execute(game=game, player=player, event=event)
+        state = await GameState.load(game=game)
+        player = state.players[random.choice(players).id]
+        outcome = event.execute(player=player, state=state)
 
-        # Test events attributes after callback
-        assert event.text != None
-        assert event._type != None
+        # Test events outcome after callback
+        assert isinstance(outcome, EventOutcome)
+        assert outcome.name == event.name
+        assert outcome.actor_id == player.id
+        assert outcome.text != None
+        assert outcome.type != None
+        assert not hasattr(event, "text")
 
 
 @pytest.mark.asyncio()
-async def test_rare_items_are_part_of_event_correlations(monkeypatch):
-    monkeypatch.setattr(random, "random", lambda: 0.99)
-    monkeypatch.setattr(random, "choice", lambda seq: seq[0])
+async def test_rare_items_are_part_of_event_correlations():
+    class FixedRandom(random.Random):
+        def random(self):
+            return 0.99
+
+        def choice(self, seq):
+            return seq[0]
 
     game = await GameModel.create(guild_id=1, channel_id=1, owner_id=1)
     player = await PlayerModel.create(game=game, user_id=99)
+    state = GameState(game=game, players=[player])
+    state.rng = FixedRandom()
 
     cases = [
         ("oracle_riddle", ["oracle_blessing"], "oracle_blessing"),
@@ -89,43 +89,15 @@ async def test_rare_items_are_part_of_event_correlations(monkeypatch):
         player.is_alive = True
         await player.save()
 
-        callback = {
-            "oracle_riddle": __import__(
-                "game_utils.events_data", fromlist=["oracle_riddle"]
-            ).oracle_riddle,
-            "time_distortion": __import__(
-                "game_utils.events_data", fromlist=["time_distortion"]
-            ).time_distortion,
-            "ghost_encounter": __import__(
-                "game_utils.events_data", fromlist=["ghost_encounter"]
-            ).ghost_encounter,
-            "last_water_source": __import__(
-                "game_utils.events_data", fromlist=["last_water_source"]
-            ).last_water_source,
-            "seed_cache": __import__(
-                "game_utils.events_data", fromlist=["seed_cache"]
-            ).seed_cache,
-            "rivalry_ignite": __import__(
-                "game_utils.events_data", fromlist=["rivalry_ignite"]
-            ).rivalry_ignite,
-        }[callback_name]
-
-        event = Event(weight=1, callback=callback)
-        result = await event.execute(game=game, player=player, event=event)
-
-        assert result._type is not None
-        assert (
-            result._type
-            != __import__(
-                "game_utils.events_data", fromlist=["EventType"]
-            ).EventType.NEGATIVE
-        )
-        assert expected_item in [
-            str(item).strip().lower() for item in (player.inventory or [])
-        ], (
+        event = Event(weight=1, definition=getattr(events_data, callback_name))
+        result = event.execute(player=player, state=state)
+
+        assert result.type is not None
+        assert result.type != EventType.NEGATIVE
+        assert player.has_item(expected_item), (
             callback_name,
             result.text,
-            player.inventory,
+            items.unpack(player.items),
         )
 
 
@@ -139,23 +111,135 @@ async def test_end_game_tracks_winner_only_via_relation(monkeypatch):
         async def send(self, *args, **kwargs):
             return None
 
-    manager = GamesManager(
-        client=SimpleNamespace(
-            get_channel=lambda *_args, **_kwargs: DummyChannel(),
-            get_guild=lambda *_args, **_kwargs: SimpleNamespace(
-                get_member=lambda *_: None
-            ),
-        )
+    client = SimpleNamespace(
+        get_channel=lambda *_args, **_kwargs: DummyChannel(),
+        get_guild=lambda *_args, **_kwargs: SimpleNamespace(get_member=lambda *_: None),
     )
+    client.message_scheduler = MessageScheduler(client)
+    manager = GamesManager(client=client)
 
     async def fake_winner_callback(winner):
         return None
 
     monkeypatch.setattr(manager, "winner_callback", fake_winner_callback)
 
-    result = await manager.end_game(game=game)
+    result = await manager.end_game(state=await GameState.load(game=game))
 
     stored_winner = await PlayerModel.get(id=winner.id)
     assert result is None
     assert stored_winner.winner_of_id == game.id
     assert not hasattr(stored_winner, "is_winner")
+
+
+@pytest.mark.asyncio()
+async def test_event_outcomes_are_independent_per_execution():
+    event = Event(weight=1, definition=events_data.wild_animals)
+
+    outcomes = []
+    for armor in (True, False):
+        game = await GameModel.create(guild_id=4, channel_id=4, owner_id=4)
+        player = await PlayerModel.create(
+            game=game, user_id=4, inventory=["armor"] if armor else []
+        )
+        state = GameState(game=game, players=[player])
+        outcomes.append(event.execute(player=player, state=state))
+
+    survived, died = outcomes
+    assert survived.type == EventType.POSITIVE
+    assert died.type == EventType.NEGATIVE
+    assert survived.text != died.text
+
+    assert dict(survived.deltas[0].changes) == {"inventory": []}
+    assert died.deltas[0].changes["is_alive"] is False
+    assert died.deltas[0].changes["death_by"] == "wild animals"
+
+
+def test_event_sampler_follows_weights():
+    first = events_data.nothing
+    second = events_data.quiet_reflection
+
+    events = [Event(weight=1, definition=first), Event(weight=3, definition=second)]
+    sampler = EventSampler(events)
+
+    picks = sampler.sample(40_000, rng=random.Random(0))
+    assert abs(picks.count(events[1]) / len(picks) - 0.75) < 0.01
+
+    # Weight changes and newly registered events rebuild the table
+    events[1].weight = 0
+    assert set(sampler.sample(1_000, rng=random.Random(1))) == {events[0]}
+
+    third = sampler.register(Event(weight=1, definition=second))
+    assert third in sampler.sample(1_000, rng=random.Random(2))
+
+
+def test_event_sampler_covers_event_list():
+    picks = event_sampler.sample(len(event_list) * 500, rng=random.Random(3))
+    assert {event.name for event in picks} == {event.name for event in event_list}
+
+
+@pytest.mark.asyncio()
+async def test_item_mask_is_packed_only_when_persisted():
+    game = await GameModel.create(guild_id=12, channel_id=12, owner_id=12)
+    player = await PlayerModel.create(game=game, user_id=12, inventory=[" Armor "])
+
+    assert player.has_item("armor") and player.has_item("ARMOR")
+    assert player.add_item("potion") and not player.add_item("potion")
+    assert player.remove_item("armor") and not player.remove_item("armor")
+    player.sync_gear_from_inventory()
+    assert player.is_protected and not player.is_armored
+    # The stored form is untouched until the player is persisted
+    assert player.inventory == [" Armor "]
+
+    await player.save()
+    assert (await PlayerModel.get(id=player.id)).inventory == ["potion"]
+
+    # Assigning the inventory directly wins over the in-memory mask
+    player.inventory = ["map"]
+    await player.save()
+    assert (await PlayerModel.get(id=player.id)).items == items.mask("map")
+
+
+def test_definitions_compile_to_outcomes_with_roles():
+    definition = EventDefinition(
+        "test_duel",
+        Opponent(
+            Seq(
+                Outcome(EventType.PASSIVE, "{player} meets {opponent}."),
+                Duel(
+                    Weight(1, bonus=((("knife",), 1000),)),
+                    Weight(1),
+                    Outcome(
+                        EventType.NEGATIVE,
+                        "{winner} beats {loser}.",
+                        who="loser",
+                        give=("map",),
+                        kill="duel with {winner}",
+                        killer="winner",
+                    ),
+                ),
+            ),
+            alone=Outcome(EventType.PASSIVE, "{player} is alone."),
+        ),
+    )
+    event = Event(weight=1, definition=definition)
+
+    game = GameModel(id=1, guild_id=0, channel_id=0, owner_id=0, seed=1)
+    player = PlayerModel(id=1, game_id=1, user_id=1, is_bot=True, inventory=["knife"])
+    rival = PlayerModel(id=2, game_id=1, user_id=2, is_bot=True)
+
+    outcome = event.execute(player=player, state=GameState(game, [player, rival]))
+    assert outcome.type == EventType.NEGATIVE
+    assert outcome.text == f"{player} meets {rival}.\n{player} beats {rival}."
+    assert outcome.target_id == rival.id
+    assert outcome.kills == ((player.id, rival.id),)
+    # Only the touched players have deltas, causes of death use plain names
+    assert [delta.player_id for delta in outcome.deltas] == [rival.id]
+    assert dict(outcome.deltas[0].changes) == {
+        "is_alive": False,
+        "inventory": ["map"],
+        "death_by": "duel with  Bot #1 ",
+    }
+
+    outcome = event.execute(player=player, state=GameState(game, [player]))
+    assert outcome.text == f"{player} is alone."
+    assert outcome.target_id is None and outcome.deltas == ()
@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from game_utils.GameScheduler import GameScheduler
+
+
+@pytest.mark.asyncio()
+async def test_steps_run_in_due_order_in_bounded_batches():
+    scheduler = GameScheduler(batch_size=2)
+    log, running, peak = [], 0, 0
+
+    async def game(name, delays):
+        nonlocal running, peak
+        for delay in delays:
+            running += 1
+            peak = max(peak, running)
+            log.append(name)
+            await asyncio.sleep(0)
+            running -= 1
+            yield delay
+
+    done = [
+        scheduler.schedule(game_id=1, ticks=game("a", [0.03, 0.03])),
+        scheduler.schedule(game_id=2, ticks=game("b", [0.01, 0.01])),
+        scheduler.schedule(game_id=3, ticks=game("c", [0.05])),
+    ]
+    await asyncio.gather(*done)
+
+    assert log == ["a", "b", "c", "b", "a"]
+    assert peak == 2
+    assert scheduler.ticks == 8
+    assert scheduler.games == {}
+    assert scheduler.backlog == 0
+
+
+@pytest.mark.asyncio()
+async def test_failing_game_fails_only_its_future():
+    scheduler = GameScheduler()
+
+    async def broken():
+        yield 0
+        raise RuntimeError("broken game")
+
+    async def healthy():
+        yield 0
+        yield 0
+
+    with pytest.raises(RuntimeError):
+        await scheduler.schedule(game_id=1, ticks=broken())
+    await scheduler.schedule(game_id=2, ticks=healthy())
+    with pytest.raises(ValueError):
+        scheduler.schedule(game_id=2, ticks=healthy())
+        scheduler.schedule(game_id=2, ticks=healthy())
+    await scheduler.close()
+
+
+@pytest.mark.asyncio()
+async def test_slow_step_does_not_hold_back_other_games():
+    scheduler = GameScheduler(batch_size=4)
+    release, log = asyncio.Event(), []
+
+    async def slow():
+        await release.wait()
+        log.append("slow")
+        yield 0
+
+    async def fast():
+        for _ in range(3):
+            log.append("fast")
+            yield 0.01
+
+    slow_done = scheduler.schedule(game_id=1, ticks=slow())
+    await asyncio.wait_for(scheduler.schedule(game_id=2, ticks=fast()), timeout=1)
+
+    assert log == ["fast"] * 3
+    release.set()
+    await slow_done
+    assert log[-1] == "slow"
+
+
+@pytest.mark.asyncio()
+async def test_close_stops_steps_paused_at_an_await():
+    scheduler = GameScheduler()
+    started, closed = asyncio.Event(), []
+
+    async def blocked():
+        try:
+            started.set()
+            await asyncio.Event().wait()
+            yield 0
+        finally:
+            closed.append(True)
+
+    done = scheduler.schedule(game_id=1, ticks=blocked())
+    await started.wait()
+    await scheduler.close()
+
+    assert closed == [True]
+    assert done.cancelled()
+    assert scheduler.games == {}
@@ -0,0 +1,531 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from game_utils.EventRules import ArenaEventDefinition, Outcome
+from game_utils.Events import ARENA, Event, EventOutcome, EventType, PlayerDelta
+from game_utils.GamesManager import GamesManager
+from game_utils.GameState import GameState
+from utils import settings, storage
+from utils.MessageScheduler import (
+    MESSAGE_TEXT_LIMIT,
+    MessageScheduler,
+    count_components,
+    text_length,
+)
+from utils.models import EventLogModel, GameModel, PlayerModel
+
+
+class DummyChannel:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, *args, **kwargs):
+        self.sent.append(kwargs)
+        return SimpleNamespace(channel=self, **kwargs)
+
+    def get_partial_message(self, *_args):
+        return self
+
+    async def reply(self, *args, **kwargs):
+        self.sent.append(kwargs)
+
+
+def dummy_client(channel: DummyChannel) -> SimpleNamespace:
+    client = SimpleNamespace(
+        get_channel=lambda *_args, **_kwargs: channel,
+        get_guild=lambda *_args, **_kwargs: None,
+        user=SimpleNamespace(
+            display_avatar=SimpleNamespace(url="https://example.com/a.png")
+        ),
+    )
+    client.message_scheduler = MessageScheduler(
+        client, channel_rate=1000, channel_burst=1000, global_rate=1000, coalesce=False
+    )
+    return client
+
+
+@pytest.mark.asyncio()
+async def test_state_changes_are_written_behind():
+    game = await GameModel.create(guild_id=2, channel_id=2, owner_id=2)
+    killer = await PlayerModel.create(game=game, user_id=201)
+    victim = await PlayerModel.create(game=game, user_id=202)
+
+    state = await GameState.load(game=game)
+    state_killer, state_victim = state.players[killer.id], state.players[victim.id]
+
+    state_victim.is_alive = False
+    state_victim.death_by = "test"
+    state.commit(
+        EventOutcome(
+            name="test",
+            type=EventType.NEGATIVE,
+            text="test",
+            actor_id=state_killer.id,
+            deltas=(PlayerDelta(victim.id, {"is_alive": False, "death_by": "test"}),),
+            kills=((killer.id, victim.id),),
+        )
+    )
+
+    assert state.alive_count() == 1
+    assert state.deaths(day=game.current_day) == [state_victim]
+    assert (await PlayerModel.get(id=victim.id)).is_alive
+
+    await state.flush()
+
+    stored_victim = await PlayerModel.get(id=victim.id)
+    assert not stored_victim.is_alive
+    assert stored_victim.death_by == "test"
+    assert [p.id for p in await killer.killed_players.all()] == [victim.id]
+
+
+@pytest.mark.asyncio()
+async def test_run_game_persists_final_state():
+    channel = DummyChannel()
+    manager = GamesManager(client=dummy_client(channel))
+
+    async def fake_winner_callback(winner):
+        return None
+
+    manager.winner_callback = fake_winner_callback
+
+    game = await GameModel.create(
+        guild_id=3, channel_id=3, owner_id=3, message_id=3, day_length=0
+    )
+    for index in range(8):
+        await PlayerModel.create(game=game, user_id=index, is_bot=True)
+
+    await manager.run_game(game=game)
+
+    stored_game = await GameModel.get(id=game.id)
+    players = await PlayerModel.filter(game=game)
+    winner = await stored_game.winner.get()
+
+    assert stored_game.is_ended
+    assert manager.states == {}
+    assert [player.id for player in players if player.is_alive] == [winner.id]
+    assert all(player.current_day > 0 for player in players)
+    assert channel.sent
+
+
+@pytest.mark.asyncio()
+async def test_game_is_replayable_from_seed():
+    async def play(seed):
+        game = await GameModel.create(guild_id=5, channel_id=5, owner_id=5, seed=seed)
+        for index in range(6):
+            await PlayerModel.create(game=game, user_id=index, is_bot=True)
+
+        state = await GameState.load(game=game)
+        slots = {player.id: slot for slot, player in enumerate(state.players.values())}
+
+        texts = []
+        while state.alive_count() > 1 and game.current_day < 100:
+            players = state.alive_players()
+            state.rng.shuffle(players)
+            for player in players:
+                if player.is_alive and state.alive_count() > 1:
+                    outcome = state.run_event(player=player)
+                    texts.append((slots[outcome.actor_id], outcome.name))
+            state.next_day()
+        return texts
+
+    assert (await GameModel.create(guild_id=5, channel_id=5, owner_id=5)).seed
+    assert await play(seed=42) == await play(seed=42)
+    assert await play(seed=42) != await play(seed=43)
+
+
+@pytest.mark.asyncio()
+async def test_batch_days_resolve_like_sequential_days(monkeypatch):
+    flush = GameState.flush
+    results = []
+    for batch_days in (False, True):
+        channel = DummyChannel()
+        manager = GamesManager(client=dummy_client(channel), batch_days=batch_days)
+
+        async def fake_winner_callback(winner):
+            return None
+
+        manager.winner_callback = fake_winner_callback
+
+        game = await GameModel.create(
+            guild_id=6, channel_id=6, owner_id=6, message_id=6, day_length=0, seed=7
+        )
+        for index in range(8):
+            await PlayerModel.create(game=game, user_id=index, is_bot=True)
+
+        flushes = []
+
+        async def counting_flush(self):
+            flushes.append(self.game.current_day)
+            await flush(self)
+
+        monkeypatch.setattr(GameState, "flush", counting_flush)
+        await manager.run_game(game=game)
+
+        stored_game = await GameModel.get(id=game.id)
+        players = await PlayerModel.filter(game=game).order_by("id")
+        results.append(
+            (
+                stored_game.current_day,
+                len(channel.sent),
+                [
+                    (p.is_alive, p.current_day, p.death_by, p.winner_of_id is not None)
+                    for p in players
+                ],
+            )
+        )
+
+        assert stored_game.is_ended
+        # One write burst per resolved day
+        assert len(flushes) == stored_game.current_day
+
+    assert results[0] == results[1]
+
+
+@pytest.mark.asyncio()
+async def test_events_are_logged_in_batches(monkeypatch):
+    manager = GamesManager(client=dummy_client(DummyChannel()))
+
+    async def fake_winner_callback(winner):
+        return None
+
+    manager.winner_callback = fake_winner_callback
+    monkeypatch.setattr(settings, "EVENT_LOG_BATCH_SIZE", 4)
+
+    commit, flush_events = GameState.commit, GameState.flush_events
+    committed, batches = [], []
+
+    def recording_commit(self, outcome):
+        committed.append((self.game.current_day, outcome))
+        commit(self, outcome)
+
+    async def counting_flush_events(self):
+        batches.append(self.pending_events)
+        await flush_events(self)
+
+    monkeypatch.setattr(GameState, "commit", recording_commit)
+    monkeypatch.setattr(GameState, "flush_events", counting_flush_events)
+
+    game = await GameModel.create(
+        guild_id=7, channel_id=7, owner_id=7, message_id=7, day_length=0, seed=3
+    )
+    for index in range(12):
+        await PlayerModel.create(game=game, user_id=index, is_bot=True)
+
+    await manager.run_game(game=game)
+
+    rows = await EventLogModel.filter(game=game).order_by("day", "tick")
+    assert [(row.day, row.name, row.actor_id) for row in rows] == [
+        (day, outcome.name, outcome.actor_id) for day, outcome in committed
+    ]
+    for day in {row.day for row in rows}:
+        ticks = [row.tick for row in rows if row.day == day]
+        assert ticks == list(range(len(ticks)))
+    assert batches and set(batches) == {4}
+
+    # A replayed day writes the same rows again, they are ignored
+    state = GameState(game=game, players=[])
+    state._events = [
+        (day, index, outcome) for index, (day, outcome) in enumerate(committed[:3])
+    ]
+    await state.flush_events()
+    assert await EventLogModel.filter(game=game).count() == len(rows)
+
+
+def test_alive_index_follows_committed_deaths():
+    game = GameModel(id=1, guild_id=0, channel_id=0, owner_id=0, seed=1)
+    players = [PlayerModel(id=index, game_id=1, user_id=index) for index in range(6)]
+    state = GameState(game=game, players=players)
+
+    def kill(victim):
+        victim.is_alive = False
+        state.commit(
+            EventOutcome(
+                name="test",
+                type=EventType.NEGATIVE,
+                text="test",
+                actor_id=victim.id,
+                deltas=(PlayerDelta(victim.id, {"is_alive": False}),),
+            )
+        )
+
+    kill(players[1])
+    kill(players[5])
+    assert state.alive_count() == 4
+
+    picks = {state.pick_opponent(players[0]).id for _ in range(200)}
+    assert picks == {2, 3, 4}
+
+    # Killed within a running event, before its commit
+    players[3].is_alive = False
+    picks = {state.pick_opponent(players[0]).id for _ in range(200)}
+    assert picks == {2, 4}
+    assert state.alive_count() == 3
+
+    for victim in (players[2], players[4]):
+        kill(victim)
+    assert state.alive_count() == 1
+    assert state.pick_opponent(players[0]) is None
+
+
+def test_disasters_hit_every_alive_player_in_one_outcome(monkeypatch):
+    monkeypatch.setattr(settings, "DISASTER_CHANCE", 1.0)
+    game = GameModel(id=1, guild_id=0, channel_id=0, owner_id=0, seed=1)
+    players = [
+        PlayerModel(id=index, game_id=1, user_id=index, is_bot=True)
+        for index in range(1, 61)
+    ]
+    players[0].is_alive = False
+    state = GameState(game=game, players=players)
+
+    outcome = state.run_disaster()
+
+    assert outcome.actor_id == ARENA
+    assert outcome.name in ("earthquake", "flooding", "meteor_strike")
+    assert outcome.text.count("\n") <= 3
+    hurt = {delta.player_id for delta in outcome.deltas}
+    assert hurt and players[0].id not in hurt
+    dead = [player for player in players[1:] if not player.is_alive]
+    assert state.alive_count() == 59 - len(dead)
+    assert all(player.current_day == game.current_day for player in dead)
+    assert state.pending_events == 1
+
+    # The last alive players cannot all die
+    wipe = Event(
+        weight=1,
+        definition=ArenaEventDefinition(
+            "wipe",
+            Outcome(EventType.NEGATIVE, kill="wipe"),
+            intro="Everything burns.",
+            killed="Burned",
+            injured="Scorched",
+            spared="Untouched",
+        ),
+    )
+    outcome = wipe.execute(player=None, state=state)
+    state.commit(outcome)
+    assert state.alive_count() == 1
+    assert outcome.type == EventType.NEGATIVE
+    assert outcome.text.splitlines()[1].startswith("**Burned:** ")
+    assert outcome.text.splitlines()[2].startswith("**Scorched:** ")
+    assert state.alive_players()[0].is_injured
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("batch_days", (False, True))
+async def test_digest_games_post_one_message_per_day(batch_days):
+    channel = DummyChannel()
+    manager = GamesManager(client=dummy_client(channel), batch_days=batch_days)
+
+    async def fake_winner_callback(winner):
+        return None
+
+    manager.winner_callback = fake_winner_callback
+
+    game = await GameModel.create(
+        guild_id=8,
+        channel_id=8,
+        owner_id=8,
+        message_id=8,
+        day_length=0,
+        seed=5,
+        is_digest=True,
+    )
+    for index in range(30):
+        await PlayerModel.create(game=game, user_id=index, is_bot=True)
+
+    await manager.run_game(game=game)
+
+    stored_game = await GameModel.get(id=game.id)
+    events = await EventLogModel.filter(game=game).count()
+    views = [sent["view"] for sent in channel.sent]
+
+    assert stored_game.is_ended and stored_game.is_digest
+    assert len(views) < events / 4
+    assert all(
+        count_components(view) <= view.MAX_ITEMS
+        and text_length(view) <= MESSAGE_TEXT_LIMIT
+        for view in views
+    )
+    # Start info, every event, the summary of every finished day and the winner
+    assert sum(len(view.children) for view in views) == (
+        1 + events + stored_game.current_day - 1 + 1
+    )
+
+
+@pytest.mark.asyncio()
+async def test_threaded_games_post_in_their_thread():
+    sent = []
+
+    def send(**kwargs):
+        sent.append(kwargs)
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(None)
+        return future
+
+    client = dummy_client(DummyChannel())
+    client.message_scheduler = SimpleNamespace(send=send)
+    manager = GamesManager(client=client)
+
+    game = GameModel(
+        id=1, guild_id=9, channel_id=9, message_id=10, thread_id=11, owner_id=9
+    )
+    players = [PlayerModel(id=1, game_id=1, user_id=1, is_bot=True)]
+    state = GameState(game=game, players=players)
+
+    await manager.send_start_info(state=state)
+    await manager.day_summary(state=state)
+
+    assert [(kwargs["channel_id"], kwargs["reference"]) for kwargs in sent] == [
+        (11, None),
+        (11, None),
+    ]
+
+
+@pytest.mark.asyncio()
+async def test_day_resumed_after_a_flush_keeps_logging_its_events():
+    game = await GameModel.create(guild_id=10, channel_id=10, owner_id=10, seed=2)
+    for index in range(20):
+        await PlayerModel.create(game=game, user_id=index, is_bot=True)
+
+    state = await GameState.load(game=game)
+    players = state.alive_players()
+    committed = [state.run_event(player=player) for player in players[:4]]
+    # Clean shutdown in the middle of the day
+    await state.flush()
+
+    state = await GameState.load(game=await GameModel.get(id=game.id))
+    for player in state.pending_players():
+        if player.is_alive:
+            committed.append(state.run_event(player=player))
+    await state.flush()
+
+    rows = await EventLogModel.filter(game=game, day=1).order_by("tick")
+    assert [row.tick for row in rows] == list(range(len(committed)))
+    assert [row.text for row in rows] == [outcome.text for outcome in committed]
+
+
+@pytest.mark.asyncio()
+async def test_changes_committed_during_a_flush_are_kept(monkeypatch):
+    game = await GameModel.create(guild_id=13, channel_id=13, owner_id=13)
+    killer = await PlayerModel.create(game=game, user_id=1)
+    first = await PlayerModel.create(game=game, user_id=2)
+    second = await PlayerModel.create(game=game, user_id=3)
+    state = await GameState.load(game=game)
+
+    def kill(victim_id):
+        victim = state.players[victim_id]
+        victim.is_alive = False
+        state.commit(
+            EventOutcome(
+                name="test",
+                type=EventType.NEGATIVE,
+                text="test",
+                actor_id=killer.id,
+                deltas=(PlayerDelta(victim_id, {"is_alive": False}),),
+                kills=((killer.id, victim_id),),
+            )
+        )
+
+    write = storage.write
+
+    async def write_during_a_kill(job):
+        # Another step of the game runs while the flush waits for the writer
+        kill(second.id)
+        monkeypatch.setattr(storage, "write", write)
+        return await write(job)
+
+    kill(first.id)
+    monkeypatch.setattr(storage, "write", write_during_a_kill)
+    await state.flush()
+    await state.flush()
+
+    assert not (await PlayerModel.get(id=second.id)).is_alive
+    assert sorted(p.id for p in await killer.killed_players.all()) == [
+        first.id,
+        second.id,
+    ]
+
+
+@pytest.mark.asyncio()
+async def test_close_writes_the_changes_of_running_steps(monkeypatch):
+    manager = GamesManager(client=dummy_client(DummyChannel()))
+    game = await GameModel.create(guild_id=14, channel_id=14, owner_id=14)
+    killer = await PlayerModel.create(game=game, user_id=1)
+    victim = await PlayerModel.create(game=game, user_id=2)
+    state = await GameState.load(game=game)
+    manager.states[game.id] = state
+
+    writing, committed = asyncio.Event(), []
+    write = storage.write
+
+    async def signalling_write(job):
+        writing.set()
+        await asyncio.sleep(0)
+        return await write(job)
+
+    async def ticks():
+        try:
+            # The step commits as soon as a flush is being written
+            await writing.wait()
+            state.players[victim.id].is_alive = False
+            state.commit(
+                EventOutcome(
+                    name="test",
+                    type=EventType.NEGATIVE,
+                    text="test",
+                    actor_id=killer.id,
+                    deltas=(PlayerDelta(victim.id, {"is_alive": False}),),
+                )
+            )
+            committed.append(victim.id)
+            yield 0
+        finally:
+            manager.states.pop(game.id, None)
+
+    monkeypatch.setattr(storage, "write", signalling_write)
+    manager.scheduler.schedule(game_id=game.id, ticks=ticks())
+    await asyncio.sleep(0)
+    await manager.close()
+
+    stored = await PlayerModel.get(id=victim.id)
+    assert stored.is_alive == (victim.id not in committed)
+
+
+@pytest.mark.asyncio()
+async def test_digest_of_a_resumed_day_keeps_the_events_before_the_restart():
+    manager = GamesManager(client=dummy_client(DummyChannel()))
+    game = await GameModel.create(
+        guild_id=15, channel_id=15, owner_id=15, seed=3, is_digest=True
+    )
+    for index in range(10):
+        await PlayerModel.create(game=game, user_id=index, is_bot=True)
+
+    state = await GameState.load(game=game)
+    for player in state.alive_players()[:4]:
+        if player.is_alive:
+            manager.event_view(state=state, outcome=state.run_event(player=player))
+    digest = [(outcome.type, outcome.text) for outcome in state.digest]
+    # Clean shutdown in the middle of the day
+    await state.flush()
+
+    game = await GameModel.get(id=game.id)
+    state = (await GameState.load_many(games=[game]))[game.id]
+    assert [(outcome.type, outcome.text) for outcome in state.digest] == digest
+
+
+@pytest.mark.asyncio()
+async def test_concurrent_starts_schedule_a_game_once():
+    manager = GamesManager(client=dummy_client(DummyChannel()))
+    game = await GameModel.create(guild_id=16, channel_id=16, owner_id=16)
+    for index in range(4):
+        await PlayerModel.create(game=game, user_id=index, is_bot=True)
+
+    first, second = await asyncio.gather(
+        manager.start_game(game=game, delay=60), manager.start_game(game=game, delay=60)
+    )
+
+    assert first is second
+    assert list(manager.scheduler.games) == [game.id]
+    await manager.close()
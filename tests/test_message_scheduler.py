@@ -0,0 +1,170 @@
+import asyncio
+from types import SimpleNamespace
+
+import discord
+import pytest
+
+from utils.MessageScheduler import (
+    MESSAGE_TEXT_LIMIT,
+    MessageScheduler,
+    Priority,
+    count_components,
+    text_length,
+)
+
+
+class RecordingChannel:
+    def __init__(self, channel_id, log):
+        self.id = channel_id
+        self.log = log
+
+    async def send(self, *args, view=None, **kwargs):
+        texts = [
+            child.content
+            for container in view.children
+            for child in container.items
+            if isinstance(child, discord.ui.TextDisplay)
+        ]
+        self.log.append((self.id, texts))
+        return SimpleNamespace(channel=self, view=view)
+
+
+def scheduler_for(log, **kwargs) -> MessageScheduler:
+    channels = {}
+
+    def get_channel(channel_id):
+        return channels.setdefault(channel_id, RecordingChannel(channel_id, log))
+
+    return MessageScheduler(SimpleNamespace(get_channel=get_channel), **kwargs)
+
+
+def view_with(text: str) -> discord.ui.DesignerView:
+    view = discord.ui.DesignerView(timeout=0)
+    container = discord.ui.Container(color=discord.Color.blurple())
+    view.add_item(container)
+    container.add_text(text)
+    return view
+
+
+@pytest.mark.asyncio()
+async def test_priority_wins_across_channels_and_order_holds_within():
+    log = []
+    scheduler = scheduler_for(log, global_rate=1, coalesce=False)
+    # Spend the only global token, so everything below queues up
+    scheduler.budget.tokens = 0
+
+    scheduler.send(1, view_with("event a"))
+    scheduler.send(2, view_with("event b"))
+    scheduler.send(2, view_with("summary b"), priority=Priority.SUMMARY)
+    winner = scheduler.send(3, view_with("winner c"), priority=Priority.WINNER)
+
+    scheduler.budget.rate = 1000
+    await winner
+    await asyncio.sleep(0.05)
+    await scheduler.close()
+
+    assert log[0] == (3, ["winner c"])
+    assert [texts for channel, texts in log if channel == 2] == [
+        ["event b"],
+        ["summary b"],
+    ]
+
+
+@pytest.mark.asyncio()
+async def test_backlogged_channel_coalesces_events():
+    log = []
+    scheduler = scheduler_for(log, channel_rate=1000, channel_burst=1)
+    scheduler.buckets[1] = scheduler._bucket(1)
+    scheduler.buckets[1].tokens = 0
+
+    futures = [scheduler.send(1, view_with(f"event {index}")) for index in range(30)]
+    futures.append(scheduler.send(1, view_with("summary"), priority=Priority.SUMMARY))
+    await asyncio.gather(*futures)
+    await scheduler.close()
+
+    # A merged message never exceeds the component limit of Discord
+    assert all(
+        count_components(result.view) <= discord.ui.DesignerView.MAX_ITEMS
+        for result in {id(f.result()): f.result() for f in futures}.values()
+    )
+    assert len(log) < 31
+    assert [text for _, texts in log for text in texts] == [
+        *(f"event {index}" for index in range(30)),
+        "summary",
+    ]
+    assert log[-1] == (1, ["summary"])
+
+
+class ArchivedThread(discord.Thread):
+    def __init__(self, thread_id, log):
+        self.id = thread_id
+        self.archived = True
+        self.log = log
+
+    async def unarchive(self):
+        self.archived = False
+        return self
+
+    async def send(self, *args, view=None, **kwargs):
+        self.log.append((self.id, self.archived))
+        return SimpleNamespace(channel=self, view=view)
+
+
+@pytest.mark.asyncio()
+async def test_archived_threads_are_fetched_and_reopened():
+    log, fetched = [], []
+    thread = ArchivedThread(5, log)
+
+    async def fetch_channel(channel_id):
+        fetched.append(channel_id)
+        if channel_id == thread.id:
+            return thread
+        response = SimpleNamespace(status=404, reason="Not Found")
+        raise discord.NotFound(response, "Unknown Channel")
+
+    client = SimpleNamespace(get_channel=lambda _id: None, fetch_channel=fetch_channel)
+    scheduler = MessageScheduler(client, coalesce=False)
+
+    sent = await scheduler.send(thread.id, view_with("event"))
+    gone = [await scheduler.send(6, view_with(f"event {index}")) for index in range(2)]
+    await scheduler.close()
+
+    assert sent.channel is thread and log == [(5, False)]
+    # Deleted channels are fetched once, their messages are dropped
+    assert gone == [None, None] and fetched == [5, 6]
+
+
+@pytest.mark.asyncio()
+async def test_coalesced_messages_stay_under_the_text_limit():
+    log = []
+    scheduler = scheduler_for(log, channel_rate=1000, channel_burst=1)
+    scheduler.buckets[1] = scheduler._bucket(1)
+    scheduler.buckets[1].tokens = 0
+
+    futures = [scheduler.send(1, view_with("x" * 240)) for _ in range(20)]
+    await asyncio.gather(*futures)
+    await scheduler.close()
+
+    assert all(
+        text_length(result.view) <= MESSAGE_TEXT_LIMIT
+        for result in {id(f.result()): f.result() for f in futures}.values()
+    )
+    assert 1 < len(log) < 20
+    assert sum(len(texts) for _, texts in log) == 20
+
+
+@pytest.mark.asyncio()
+async def test_close_sends_queued_messages_until_the_timeout():
+    log = []
+    scheduler = scheduler_for(log, channel_rate=5, channel_burst=1, coalesce=False)
+
+    first = scheduler.send(1, view_with("first"))
+    second = scheduler.send(1, view_with("second"))
+    late = scheduler.send(1, view_with("late"))
+    # The channel sends one message every 0.2 seconds
+    await scheduler.close(timeout=0.3)
+
+    assert log == [(1, ["first"]), (1, ["second"])]
+    assert first.done() and second.done()
+    assert late.cancelled()
+    assert not scheduler.queues
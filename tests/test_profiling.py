@@ -0,0 +1,57 @@
+import json
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from cogs.HungerGames import HungerGames
+from game_utils.GameState import GameState
+from tests.test_stats import make_context
+from utils.models import GameModel, PlayerModel
+from utils.profiling import Histogram, profiler
+
+
+def test_histogram_percentiles_are_within_bucket_error():
+    rng = random.Random(0)
+    values = sorted(rng.randrange(1, 10**9) for _ in range(10000))
+    histogram = Histogram()
+    for value in values:
+        histogram.record(value)
+
+    assert histogram.count == len(values)
+    assert histogram.min == values[0] and histogram.max == values[-1]
+    for percent in (50, 90, 99):
+        exact = values[round(len(values) * percent / 100) - 1]
+        assert abs(histogram.percentile(percent) - exact) <= exact / 64
+    # Memory is bounded by the buckets, not by the samples
+    assert len(histogram.buckets) < 64 * 30
+
+
+@pytest.mark.asyncio()
+async def test_game_timings_are_profiled(tmp_path):
+    profiler.reset()
+    game = await GameModel.create(guild_id=8, channel_id=8, owner_id=8, seed=1)
+    for index in range(4):
+        await PlayerModel.create(game=game, user_id=index, is_bot=True)
+
+    state = await GameState.load(game=game)
+    for player in state.alive_players():
+        if player.is_alive:
+            state.run_event(player=player)
+    await state.flush()
+
+    events = profiler.rows(stage="event")
+    assert sum(histogram.count for _, _, histogram in events) == 4
+    assert [name for _, name, _ in profiler.rows(stage="db")] == ["flush"]
+
+    responses = []
+    cog = HungerGames(SimpleNamespace(load_extension=None))
+    await cog.hgprofile.callback(
+        cog, make_context(guild_id=8, responses=responses), stage="event"
+    )
+    assert events[0][1] in responses[0].description
+
+    path = tmp_path / "profile.json"
+    profiler.dump(str(path))
+    dumped = json.loads(path.read_text())
+    assert dumped["stages"]["db"]["flush"]["count"] == 1
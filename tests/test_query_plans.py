@@ -0,0 +1,116 @@
+from types import SimpleNamespace
+
+import pytest
+from tortoise import connections
+from tortoise.backends.sqlite.client import SqliteClient
+
+import cogs.HungerGames as hunger_games
+from cogs.HungerGames import HungerGames
+from game_utils.GamesManager import GamesManager
+from tests.test_game_state import DummyChannel, dummy_client
+from tests.test_stats import make_context
+from utils.models import GameModel, PlayerModel
+
+
+class DummyPaginator:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    async def respond(self, *args, **kwargs):
+        pass
+
+
+@pytest.fixture()
+def queries(monkeypatch):
+    """Records the statements sent to SQLite."""
+    recorded = []
+    execute_query = SqliteClient.execute_query
+    execute_query_dict = SqliteClient.execute_query_dict
+
+    async def record_query(self, query, values=None):
+        recorded.append((query, values))
+        return await execute_query(self, query, values)
+
+    async def record_query_dict(self, query, values=None):
+        recorded.append((query, values))
+        return await execute_query_dict(self, query, values)
+
+    monkeypatch.setattr(SqliteClient, "execute_query", record_query)
+    monkeypatch.setattr(SqliteClient, "execute_query_dict", record_query_dict)
+    yield recorded
+    monkeypatch.setattr(SqliteClient, "execute_query", execute_query)
+    monkeypatch.setattr(SqliteClient, "execute_query_dict", execute_query_dict)
+
+
+def full_scans(plan: list) -> list[str]:
+    """Returns the steps of the plan that read a whole table."""
+    return [
+        row["detail"]
+        for row in plan
+        if row["detail"].startswith("SCAN ") and " INDEX " not in row["detail"]
+    ]
+
+
+@pytest.mark.asyncio()
+async def test_game_and_command_queries_use_indexes(queries, monkeypatch):
+    if connections.get("default").capabilities.dialect != "sqlite":
+        pytest.skip("query plans are checked on SQLite")
+    monkeypatch.setattr(hunger_games, "Paginator", DummyPaginator)
+
+    manager = GamesManager(client=dummy_client(DummyChannel()))
+
+    async def fake_winner_callback(winner):
+        return None
+
+    manager.winner_callback = fake_winner_callback
+
+    game = await GameModel.create(
+        guild_id=81, channel_id=81, owner_id=801, message_id=81, day_length=0
+    )
+    await PlayerModel.create(game=game, user_id=801)
+    await PlayerModel.create(game=game, user_id=802)
+    for index in range(6):
+        await PlayerModel.create(game=game, user_id=index, is_bot=True)
+
+    game.is_started = True
+    await game.save()
+
+    # Only the resume query, games of the other tests are not run
+    async def skip_game(game, **kwargs):
+        pass
+
+    start_game, manager.start_game = manager.start_game, skip_game
+    await manager.run_games()
+    manager.start_game = start_game
+
+    await manager.run_game(game=game)
+
+    cog = HungerGames(SimpleNamespace(load_extension=None))
+    cog.client = dummy_client(DummyChannel())
+    ctx = make_context(guild_id=81, responses=[])
+    ctx.interaction = None
+    member = SimpleNamespace(id=801, mention="<@801>")
+
+    await cog.hginfo.callback(cog, ctx, game_id=game.id)
+    await cog.hgplayers.callback(cog, ctx, game_id=game.id)
+    await cog.hgplayer.callback(cog, ctx, member=member, state="server")
+    await cog.hgplayer.callback(cog, ctx, member=member, state="global")
+    await cog.hgserver.callback(cog, ctx)
+
+    pending = await GameModel.create(guild_id=81, channel_id=81, owner_id=801)
+    ctx.defer = DummyPaginator().respond
+    await cog.hgbots.callback(cog, ctx, game_id=pending.id, count=3)
+
+    statements = {
+        (query, tuple(values or ()))
+        for query, values in queries
+        if query.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE"))
+    }
+    assert statements
+
+    connection = connections.get("default")
+    for query, values in statements:
+        plan = await connection.execute_query_dict(
+            f"EXPLAIN QUERY PLAN {query}", list(values)
+        )
+        assert not full_scans(plan), query
@@ -0,0 +1,139 @@
+import asyncio
+import time
+from multiprocessing import Pipe
+from types import SimpleNamespace
+
+import discord
+import pytest
+
+from game_utils.GamesManager import GamesManager, shard_of
+from game_utils.ShardManager import ShardClient, ShardManager
+from utils import settings
+from utils.MessageScheduler import Priority
+from utils.models import GameModel, PlayerModel
+
+
+@pytest.mark.asyncio()
+async def test_run_games_resumes_only_its_shard(monkeypatch):
+    games = [
+        await GameModel.create(guild_id=9, channel_id=9, owner_id=9, is_started=True)
+        for _ in range(6)
+    ]
+    running = {game.id for game in games}
+
+    for shard_id in range(3):
+        manager = GamesManager(client=SimpleNamespace())
+        started = []
+
+        async def fake_start_game(game, **kwargs):
+            started.append(game.id)
+
+        monkeypatch.setattr(manager, "start_game", fake_start_game)
+        await manager.run_games(shard_id=shard_id, shards=3)
+
+        mine = [game_id for game_id in started if game_id in running]
+        assert mine == [game.id for game in games if shard_of(game, 3) == shard_id]
+
+
+@pytest.mark.asyncio()
+async def test_resume_is_idempotent_and_staggered(monkeypatch):
+    monkeypatch.setattr(settings, "RESUME_WINDOW", 20)
+    games = [
+        await GameModel.create(guild_id=10, channel_id=10, owner_id=10, is_started=True)
+        for _ in range(4)
+    ]
+    for game in games:
+        await PlayerModel.create(game=game, user_id=1)
+        await PlayerModel.create(game=game, user_id=2)
+    mine = {game.id for game in games}
+
+    manager = GamesManager(client=SimpleNamespace())
+    scheduled = []
+
+    def fake_schedule(game_id, ticks, delay=0):
+        scheduled.append((game_id, delay))
+        manager.scheduler.games[game_id] = SimpleNamespace(done=None)
+
+    monkeypatch.setattr(manager.scheduler, "schedule", fake_schedule)
+    await asyncio.gather(manager.run_games(), manager.run_games())
+    await manager.run_games()
+
+    delays = sorted(delay for game_id, delay in scheduled if game_id in mine)
+    assert len(delays) == 4
+    assert all(0 <= delay < 20 for delay in delays)
+    assert len(set(delays)) == 4
+    assert all(len(manager.states[game_id].players) == 2 for game_id in mine)
+
+
+@pytest.mark.asyncio()
+async def test_worker_messages_are_sent_by_the_gateway():
+    gateway_connection, worker_connection = Pipe()
+    sent = []
+
+    class DummyScheduler:
+        def send(self, channel_id, view, priority, reference):
+            sent.append((channel_id, view.to_components(), priority, reference))
+            future = asyncio.get_running_loop().create_future()
+            if reference:
+                response = SimpleNamespace(status=404, reason="Not Found")
+                future.set_exception(discord.NotFound(response, "Unknown Message"))
+            else:
+                future.set_result(object())
+            return future
+
+    gateway = ShardManager(
+        client=SimpleNamespace(message_scheduler=DummyScheduler()), shards=1
+    )
+    gateway.workers[0] = SimpleNamespace(connection=gateway_connection)
+    worker = ShardClient(connection=worker_connection)
+
+    view = discord.ui.DesignerView(timeout=0)
+    container = discord.ui.Container(color=discord.Color.gold())
+    view.add_item(container)
+    container.add_text("# Winner!")
+
+    delivered = worker.send(channel_id=7, view=view, priority=Priority.WINNER)
+    missing = worker.send(channel_id=7, view=view, reference=1)
+
+    for _ in range(2):
+        gateway.handle(shard_id=0, message=gateway_connection.recv())
+    await asyncio.sleep(0)
+    for _ in range(2):
+        worker.resolve(*worker_connection.recv()[1:])
+
+    assert sent[0] == (7, view.to_components(), Priority.WINNER, None)
+    assert await delivered
+    with pytest.raises(discord.NotFound):
+        await missing
+
+    future = gateway.running[5] = asyncio.get_running_loop().create_future()
+    worker.game_ended(5)
+    gateway.handle(shard_id=0, message=gateway_connection.recv())
+    assert future.done() and 5 not in gateway.running
+
+
+@pytest.mark.asyncio()
+async def test_game_started_during_a_restart_waits_for_the_new_worker(monkeypatch):
+    game = await GameModel.create(guild_id=10, channel_id=10, owner_id=10)
+    gateway = ShardManager(client=SimpleNamespace(), shards=1)
+    started, sent = [], []
+
+    def fake_start_worker(shard_id):
+        started.append(shard_id)
+        gateway.workers[shard_id] = SimpleNamespace(
+            connection=SimpleNamespace(send=sent.append)
+        )
+
+    monkeypatch.setattr(gateway, "start_worker", fake_start_worker)
+    gateway.workers[0] = SimpleNamespace(
+        connection=SimpleNamespace(close=lambda: None),
+        process=SimpleNamespace(is_alive=lambda: False, join=lambda _: time.sleep(0.1)),
+    )
+
+    restart = asyncio.ensure_future(gateway.restart_worker(shard_id=0))
+    await asyncio.sleep(0)
+    await gateway.start_game(game=game)
+    await restart
+
+    assert started == [0]
+    assert sent == [("start", game.id)]
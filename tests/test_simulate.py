@@ -0,0 +1,16 @@
+from game_utils.simulate import simulate
+
+
+def test_simulation_is_reproducible_and_consistent():
+    report = simulate(games=20, players=6, seed=1)
+
+    assert report.games == 20
+    assert sum(report.days.values()) == 20
+    assert sum(report.wins.values()) + report.unfinished == 20
+    assert set(report.wins) <= set(range(1, 7))
+    assert sum(report.events.values()) >= 20
+
+    again = simulate(games=20, players=6, seed=1)
+    assert again.to_dict() | {"elapsed": 0, "games_per_second": 0} == (
+        report.to_dict() | {"elapsed": 0, "games_per_second": 0}
+    )
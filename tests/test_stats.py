@@ -0,0 +1,192 @@
+from types import SimpleNamespace
+
+import pytest
+
+from cogs.HungerGames import HungerGames
+from game_utils.GameState import GameState
+from utils import stats
+from utils.models import GameModel, GuildStatsModel, PlayerModel, PlayerStatsModel
+
+
+async def play_game(guild_id: int, users: list[int], winner: int) -> GameModel:
+    """Creates an ended game where the winner killed everyone else."""
+    game = await GameModel.create(
+        guild_id=guild_id, channel_id=guild_id, owner_id=users[0], is_started=True
+    )
+    await stats.record_created(game=game)
+    players = [await PlayerModel.create(game=game, user_id=user) for user in users]
+    players.append(await PlayerModel.create(game=game, user_id=1, is_bot=True))
+
+    state = GameState(game=game, players=players)
+    for player in players:
+        if player.user_id == winner and not player.is_bot:
+            player.winner_of = game
+            player.current_day = 3
+        else:
+            player.is_alive = False
+            player.current_day = 2
+            state._kills.append((players[users.index(winner)].id, player.id))
+    state.mark_dirty(*players)
+    game.is_ended = True
+    await state.flush()
+
+    # Flushing an ended game again must not count it twice
+    await state.flush()
+    return game
+
+
+async def rollups() -> dict:
+    return {
+        row.guild_id: (row.games, row.finished, row.kills, row.recent_winners)
+        for row in await GuildStatsModel.filter(guild_id__in=[51, 52])
+    }
+
+
+def make_context(guild_id: int, responses: list) -> SimpleNamespace:
+    async def respond(*args, **kwargs):
+        responses.append(kwargs.get("embed") or kwargs.get("embeds") or args[0])
+
+    async def defer(*args, **kwargs):
+        pass
+
+    return SimpleNamespace(
+        guild=SimpleNamespace(id=guild_id),
+        bot=SimpleNamespace(
+            user=SimpleNamespace(display_avatar=SimpleNamespace(url=None))
+        ),
+        respond=respond,
+        defer=defer,
+    )
+
+
+async def careers() -> dict:
+    return {
+        (row.user_id, row.guild_id): (
+            row.games,
+            row.wins,
+            row.kills,
+            row.deaths,
+            row.best_day,
+        )
+        for row in await PlayerStatsModel.filter(user_id__in=[501, 502, 503])
+    }
+
+
+@pytest.mark.asyncio()
+async def test_career_stats_are_recorded_when_game_ends():
+    await PlayerStatsModel.all().delete()
+    first = await play_game(guild_id=51, users=[501, 502], winner=501)
+    second = await play_game(guild_id=52, users=[501, 503], winner=503)
+    third = await play_game(guild_id=51, users=[502, 503], winner=502)
+    pending = await GameModel.create(guild_id=51, channel_id=51, owner_id=501)
+    await stats.record_created(game=pending)
+
+    recorded = await careers()
+    assert recorded == {
+        (501, 51): (1, 1, 2, 0, 3),
+        (501, 52): (1, 0, 0, 1, 2),
+        (501, stats.GLOBAL): (2, 1, 2, 1, 3),
+        (502, 51): (2, 1, 2, 1, 3),
+        (502, stats.GLOBAL): (2, 1, 2, 1, 3),
+        (503, 51): (1, 0, 0, 1, 2),
+        (503, 52): (1, 1, 2, 0, 3),
+        (503, stats.GLOBAL): (2, 1, 2, 1, 3),
+    }
+    assert not await PlayerStatsModel.filter(user_id=1).exists()
+
+    rolled_up = await rollups()
+    assert rolled_up == {
+        51: (
+            3,
+            2,
+            4,
+            [
+                {"user_id": 502, "game_id": third.id},
+                {"user_id": 501, "game_id": first.id},
+            ],
+        ),
+        52: (1, 1, 2, [{"user_id": 503, "game_id": second.id}]),
+    }
+
+    await stats.backfill(batch_size=1)
+    assert await careers() == recorded
+    assert await rollups() == rolled_up
+
+
+@pytest.mark.asyncio()
+async def test_hgplayer_reads_career_row():
+    await PlayerStatsModel.create(
+        user_id=601, guild_id=stats.GLOBAL, games=4, wins=1, kills=5, deaths=3
+    )
+    await PlayerStatsModel.create(user_id=601, guild_id=61, games=1, kills=2)
+
+    responses = []
+    member = SimpleNamespace(id=601, mention="<@601>")
+    ctx = make_context(guild_id=61, responses=responses)
+    cog = HungerGames(SimpleNamespace(load_extension=None))
+
+    await cog.hgplayer.callback(cog, ctx, member=member, state="global")
+    await cog.hgplayer.callback(cog, ctx, member=member, state="server")
+    ctx.guild.id = 62
+    await cog.hgplayer.callback(cog, ctx, member=member, state="server")
+
+    fields = [{f.name: f.value for f in embed.fields} for embed in responses[:2]]
+    assert fields[0]["Games"] == "` 4 `" and fields[0]["Kills"] == "` 5 `"
+    assert fields[1]["Games"] == "` 1 `" and fields[1]["Kills"] == "` 2 `"
+    assert responses[2] == "<@601> did not participate in any Hunger Games."
+
+
+@pytest.mark.asyncio()
+async def test_hgserver_reads_guild_rollup():
+    await GuildStatsModel.create(
+        guild_id=71,
+        games=5,
+        finished=2,
+        kills=9,
+        recent_winners=[{"user_id": 701, "game_id": 8}],
+    )
+    cog = HungerGames(SimpleNamespace(load_extension=None))
+
+    responses = []
+    await cog.hgserver.callback(cog, make_context(guild_id=71, responses=responses))
+    await cog.hgserver.callback(cog, make_context(guild_id=72, responses=responses))
+
+    history, winners = responses[0]
+    assert [field.value for field in history.fields] == ["` 5 `", "` 2 `", "` 9 `"]
+    assert winners.description == "<@701> - ` Hunger Games #8 `"
+    assert [field.value for field in responses[1][0].fields] == ["` 0 `"] * 3
+
+
+@pytest.mark.asyncio()
+async def test_debug_games_are_left_out_of_the_stats():
+    cog = HungerGames(SimpleNamespace(load_extension=None))
+
+    async def run_game(game):
+        state = await GameState.load(game=game)
+        for player in list(state.players.values())[1:]:
+            player.is_alive = False
+            state._kills.append((next(iter(state.players)), player.id))
+        state.mark_dirty(*state.players.values())
+        game.is_ended = True
+        await state.flush()
+
+    cog.GamesManager = SimpleNamespace(run_game=run_game)
+    ctx = make_context(guild_id=97, responses=[])
+    ctx.channel = SimpleNamespace(id=97)
+    ctx.author = SimpleNamespace(id=97)
+
+    await cog.hgdebug.callback(cog, ctx, players=5, instant=True)
+
+    assert not await GameModel.filter(guild_id=97).exists()
+    assert not await GuildStatsModel.filter(guild_id=97).exists()
+
+
+@pytest.mark.asyncio()
+async def test_game_deleted_before_it_runs_is_not_counted():
+    cog = HungerGames(SimpleNamespace(load_extension=None))
+    kept = await cog.create_game(guild_id=98, channel_id=98, owner_id=98)
+    deleted = await cog.create_game(guild_id=98, channel_id=98, owner_id=98)
+    await cog.delete_game(game=deleted)
+
+    assert not await GameModel.filter(id=deleted.id).exists()
+    assert (await GuildStatsModel.get(guild_id=kept.guild_id)).games == 1
@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+
+from utils import settings, storage
+from utils.models import GameModel
+
+
+def test_sqlite_config_has_pragmas_and_read_pool():
+    config = storage.tortoise_config(
+        db_url="sqlite://data/main.db?synchronous=FULL", read_pool=2
+    )
+    connections = config["connections"]
+
+    assert list(connections) == ["default", "read_0", "read_1"]
+    writer = connections["default"]["credentials"]
+    assert writer["journal_mode"] == "WAL"
+    assert writer["synchronous"] == "FULL"
+    assert writer["busy_timeout"] > 0
+    assert "query_only" not in writer
+    assert connections["read_1"]["credentials"]["query_only"] == "ON"
+    assert connections["read_1"]["credentials"]["file_path"] == "data/main.db"
+
+    memory = storage.tortoise_config(db_url="sqlite://:memory:", read_pool=2)
+    assert list(memory["connections"]) == ["default"]
+
+
+def test_postgres_config_has_pool_sizes():
+    config = storage.tortoise_config(
+        db_url="postgres://bot:secret@db:5432/hunger_games?maxsize=32", read_pool=2
+    )
+    connections = config["connections"]
+
+    assert list(connections) == ["default"]
+    assert connections["default"]["engine"] == storage.POSTGRES
+    credentials = connections["default"]["credentials"]
+    assert credentials["database"] == "hunger_games"
+    assert credentials["minsize"] == settings.DB_POOL_MIN_SIZE
+    assert credentials["maxsize"] == "32"
+
+
+@pytest.mark.asyncio()
+async def test_writer_groups_queued_writes():
+    writer = storage.Writer(batch_size=10)
+
+    async def fail(connection):
+        await GameModel.create(
+            guild_id=92, channel_id=0, owner_id=0, using_db=connection
+        )
+        raise RuntimeError("bad write")
+
+    futures = [
+        writer.write(
+            lambda connection, index=index: GameModel.create(
+                guild_id=91, channel_id=index, owner_id=0, using_db=connection
+            )
+        )
+        for index in range(12)
+    ]
+    futures.append(writer.write(fail))
+
+    results = await asyncio.gather(*futures, return_exceptions=True)
+
+    assert isinstance(results[-1], RuntimeError)
+    assert sorted(
+        game.channel_id for game in results if isinstance(game, GameModel)
+    ) == list(range(12))
+    assert await GameModel.filter(guild_id=91).count() == 12
+    assert not await GameModel.filter(guild_id=92).exists()
+    # The first batch commits at once, the failed second one write by write
+    assert writer.transactions == 1 + 1 + 3
+    assert writer.writes == 12
@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any, Optional
+
+import discord
+
+from utils import settings
+from utils.profiling import profiler
+
+if TYPE_CHECKING:
+    from utils.client import HungerGamesBot
+
+
+# Characters of text a single message may hold
+MESSAGE_TEXT_LIMIT = 4000
+
+
+class Priority(IntEnum):
+    """Priority of an outgoing message, lower is sent first."""
+
+    WINNER = 0
+    SUMMARY = 1
+    EVENT = 2
+
+
+class TokenBucket(object):
+    """Token bucket refilled continuously at `rate` tokens per second."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self, now: float) -> float:
+        """Returns the seconds until a token is available."""
+        self._refill(now)
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self, now: float) -> None:
+        """Takes a token from the bucket."""
+        self._refill(now)
+        self.tokens -= 1
+
+
+@dataclass
+class OutgoingMessage:
+    """Message waiting in the scheduler queue."""
+
+    priority: Priority
+    sequence: int
+    view: discord.ui.DesignerView
+    reference: Optional[int] = None
+    futures: list[asyncio.Future] = field(default_factory=list)
+
+
+def count_components(view: discord.ui.DesignerView) -> int:
+    """Returns the number of components in the view, nested ones included."""
+
+    def count(component: Any) -> int:
+        if isinstance(component, list):
+            return sum(count(child) for child in component)
+        if isinstance(component, dict):
+            return 1 + sum(
+                count(value)
+                for key, value in component.items()
+                if key in ("components", "accessory")
+            )
+        return 0
+
+    return count(view.to_components())
+
+
+def text_length(view: discord.ui.DesignerView) -> int:
+    """Returns the number of characters of the text displays in the view."""
+
+    def length(component: Any) -> int:
+        if isinstance(component, list):
+            return sum(length(child) for child in component)
+        if isinstance(component, dict):
+            return len(component.get("content") or "") + sum(
+                length(value)
+                for key, value in component.items()
+                if key in ("components", "accessory")
+            )
+        return 0
+
+    return length(view.to_components())
+
+
+class MessageScheduler(object):
+    """Outbound message scheduler shared by all games of the bot.
+
+    Every channel has its own token bucket and all channels share a global
+    budget. When several channels can send, the one whose next message has the
+    highest priority goes first, while messages within a channel always keep
+    their order. If a channel is backlogged, consecutive event messages are
+    merged into a single message, within the component and text limits.
+    """
+
+    def __init__(
+        self,
+        client: HungerGamesBot,
+        channel_rate: float = settings.SEND_CHANNEL_RATE,
+        channel_burst: float = settings.SEND_CHANNEL_BURST,
+        global_rate: float = settings.SEND_GLOBAL_RATE,
+        coalesce: bool = settings.SEND_COALESCE,
+    ):
+        """Initializes the MessageScheduler.
+
+        Args:
+            client (HungerGamesBot): Bot client used to resolve the channels.
+            channel_rate (float): Messages per second a single channel may send.
+            channel_burst (float): Messages a channel may send in a burst.
+            global_rate (float): Messages per second the bot may send overall.
+            coalesce (bool): Merge queued event messages of backlogged channels.
+        """
+        self.client = client
+        self.channel_rate = channel_rate
+        self.channel_burst = channel_burst
+        self.coalesce = coalesce
+
+        self.budget = TokenBucket(rate=global_rate, capacity=global_rate)
+        self.buckets: dict[int, TokenBucket] = {}
+        self.queues: dict[int, deque[OutgoingMessage]] = {}
+        self.in_flight: set[int] = set()
+        # Channels that could not be fetched, their messages are dropped
+        self.missing: set[int] = set()
+
+        self._sequence = 0
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def backlog(self) -> int:
+        """Number of queued messages."""
+        return sum(len(queue) for queue in self.queues.values())
+
+    def send(
+        self,
+        channel_id: int,
+        view: discord.ui.DesignerView,
+        priority: Priority = Priority.EVENT,
+        reference: Optional[int] = None,
+    ) -> asyncio.Future:
+        """Queues a message and returns a future of the sent message.
+
+        Args:
+            channel_id (int): Channel to send the message to.
+            view (discord.ui.DesignerView): Content of the message.
+            priority (Priority): Priority of the message.
+            reference (Optional[int]): Id of the message to reply to.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        # Nobody has to await event messages, don't warn about their errors
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+        self._sequence += 1
+        message = OutgoingMessage(
+            priority=priority,
+            sequence=self._sequence,
+            view=view,
+            reference=reference,
+            futures=[future],
+        )
+        self.queues.setdefault(channel_id, deque()).append(message)
+
+        if not self._task or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+        self._wakeup.set()
+
+        return future
+
+    async def close(self, timeout: float = settings.SEND_DRAIN_TIMEOUT) -> None:
+        """Sends the queued messages, then stops the scheduler.
+
+        Args:
+            timeout (float): Seconds to keep sending for, the messages still
+                queued after that are cancelled.
+        """
+        try:
+            await asyncio.wait_for(self._drain(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+        for queue in self.queues.values():
+            for message in queue:
+                for future in message.futures:
+                    future.cancel()
+        self.queues.clear()
+
+    async def _drain(self) -> None:
+        while self.queues or self.in_flight:
+            if self.queues and (not self._task or self._task.done()):
+                self._task = asyncio.ensure_future(self._run())
+            await asyncio.sleep(0.05)
+
+    def _bucket(self, channel_id: int) -> TokenBucket:
+        if channel_id not in self.buckets:
+            self.buckets[channel_id] = TokenBucket(
+                rate=self.channel_rate, capacity=self.channel_burst
+            )
+        return self.buckets[channel_id]
+
+    def _pop(self, channel_id: int) -> OutgoingMessage:
+        queue = self.queues[channel_id]
+        message = queue.popleft()
+
+        if self.coalesce and message.priority == Priority.EVENT and queue:
+            merged = discord.ui.DesignerView(timeout=0)
+            components = count_components(message.view)
+            length = text_length(message.view)
+            parts = [message]
+            while queue and queue[0].priority == Priority.EVENT:
+                size = count_components(queue[0].view)
+                text = text_length(queue[0].view)
+                if (
+                    components + size > merged.MAX_ITEMS
+                    or length + text > MESSAGE_TEXT_LIMIT
+                ):
+                    break
+                components += size
+                length += text
+                parts.append(queue.popleft())
+
+            if len(parts) > 1:
+                for part in parts:
+                    for item in list(part.view.children):
+                        part.view.remove_item(item)
+                        merged.add_item(item)
+                message = OutgoingMessage(
+                    priority=message.priority,
+                    sequence=message.sequence,
+                    view=merged,
+                    futures=[future for part in parts for future in part.futures],
+                )
+
+        if not queue:
+            del self.queues[channel_id]
+        return message
+
+    async def _resolve(self, channel_id: int) -> Optional[discord.abc.Messageable]:
+        """Returns the channel to send to.
+
+        Threads leave the cache once archived, so missing channels are fetched,
+        and archived threads are reopened before sending.
+        """
+        channel = self.client.get_channel(channel_id)
+        if not channel and channel_id not in self.missing:
+            try:
+                channel = await self.client.fetch_channel(channel_id)
+            except (discord.NotFound, discord.Forbidden):
+                self.missing.add(channel_id)
+
+        if isinstance(channel, discord.Thread) and channel.archived:
+            channel = await channel.unarchive()
+        return channel
+
+    async def _deliver(self, channel_id: int, message: OutgoingMessage) -> None:
+        try:
+            channel = await self._resolve(channel_id)
+            if not channel:
+                result = None
+            elif message.reference:
+                reference = channel.get_partial_message(message.reference)
+                with profiler.time("send", message.priority.name.lower()):
+                    result = await reference.reply(view=message.view)
+            else:
+                with profiler.time("send", message.priority.name.lower()):
+                    result = await channel.send(view=message.view)
+        except Exception as e:
+            for future in message.futures:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for future in message.futures:
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self.in_flight.discard(channel_id)
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        # Exits once the queues are drained, `send` starts it again
+        while self.queues:
+            self._wakeup.clear()
+            now = time.monotonic()
+
+            ready, delay = [], None
+            for channel_id, queue in self.queues.items():
+                if channel_id in self.in_flight:
+                    continue
+                channel_delay = self._bucket(channel_id).delay(now)
+                if channel_delay > 0:
+                    delay = (
+                        channel_delay if delay is None else min(delay, channel_delay)
+                    )
+                    continue
+                ready.append((queue[0].priority, queue[0].sequence, channel_id))
+
+            budget_delay = self.budget.delay(now)
+            if not ready or budget_delay > 0:
+                if ready:
+                    delay = budget_delay
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            _, _, channel_id = min(ready)
+            self.budget.take(now)
+            self._bucket(channel_id).take(now)
+            self.in_flight.add(channel_id)
+            asyncio.ensure_future(self._deliver(channel_id, self._pop(channel_id)))
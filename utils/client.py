@@ -1,11 +1,15 @@
 import discord
 from discord.ext import commands
 
+from utils.MessageScheduler import MessageScheduler
+from utils.profiling import profiler
+
 
 class HungerGamesBot(commands.Bot):
     def __init__(self, sync: bool = False):
         super().__init__(intents=discord.Intents.default(), help_command=None)
         self.sync = sync
+        self.message_scheduler = MessageScheduler(self)
 
         self.load_extension("cogs.System")
         self.load_extension("cogs.HungerGames")
@@ -16,3 +20,11 @@ class HungerGamesBot(commands.Bot):
 
     async def on_ready(self):
         print("Running as {} (ID: {})".format(self.user, self.user.id))
+
+    async def close(self):
+        # Write behind game states before the database connections are closed
+        if cog := self.get_cog("HungerGames"):
+            await cog.GamesManager.close()
+        await self.message_scheduler.close()
+        profiler.dump()
+        await super().close()
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+
+def normalize_item(item: object) -> str:
+    """Returns the canonical name of an item."""
+    return str(item).strip().lower()
+
+
+class ItemRegistry(object):
+    """Registry of interned items.
+
+    Every item name gets a bit, so an inventory is a single integer mask and
+    membership, gear and "any of" checks are bit operations. Names are only
+    normalized once, the first time they are seen. Bits are process local, the
+    database only ever stores item names.
+    """
+
+    def __init__(self):
+        self.names: list[str] = []
+        self.labels: dict[str, str] = {}
+
+        self._bits: dict[object, int] = {}
+        self._masks: dict[tuple, int] = {}
+
+    def register(self, name: str, label: Optional[str] = None) -> int:
+        """Interns the item and returns its bit."""
+        bit = self.bit(name)
+        if label:
+            self.labels[self.names[bit.bit_length() - 1]] = label
+        return bit
+
+    def bit(self, name: object) -> int:
+        """Returns the bit of the item, interning it when it is new."""
+        if (bit := self._bits.get(name)) is not None:
+            return bit
+
+        key = normalize_item(name)
+        if not key:
+            return 0
+
+        if (bit := self._bits.get(key)) is None:
+            bit = 1 << len(self.names)
+            self.names.append(key)
+            self._bits[key] = bit
+
+        # Remember the raw spelling too, so it is never normalized again
+        self._bits[name] = bit
+        return bit
+
+    def mask(self, *names: object) -> int:
+        """Returns the mask of the items."""
+        if (mask := self._masks.get(names)) is None:
+            mask = 0
+            for name in names:
+                mask |= self.bit(name)
+            self._masks[names] = mask
+        return mask
+
+    def pack(self, inventory: Optional[Iterable[object]]) -> int:
+        """Returns the mask of a stored inventory."""
+        mask = 0
+        for name in inventory or []:
+            mask |= self.bit(name)
+        return mask
+
+    def unpack(self, mask: int) -> list[str]:
+        """Returns the item names of the mask, in interning order."""
+        names = []
+        while mask:
+            low = mask & -mask
+            names.append(self.names[low.bit_length() - 1])
+            mask ^= low
+        return names
+
+    def label(self, name: str) -> Optional[str]:
+        """Returns the display label of the item."""
+        return self.labels.get(name)
+
+
+items = ItemRegistry()
+
+for name, label in (
+    ("armor", "🛡️ Armor"),
+    ("shield", "🛡️ Shield"),
+    ("medkit", "💉 Medkit"),
+    ("medicine", "💊 Medicine"),
+    ("potion", "🧪 Potion"),
+    ("food", "🍖 Food"),
+    ("charm", "✨ Charm"),
+    ("herbs", "🌿 Herbs"),
+    ("knife", "🗡️ Knife"),
+    ("map", "🗺️ Map"),
+    ("legendary_sword", "⚔️ Legendary Sword"),
+    ("crown", "👑 Crown"),
+    ("divine_favor", "☆ Divine Favor"),
+    ("hope", "💫 Hope"),
+    ("rope", "🪢 Rope"),
+    ("stamina", "⚡ Stamina"),
+    ("ancient_relic", "🏺 Ancient Relic"),
+    ("rivalry_marker", "⚔️ Rivalry"),
+    ("warning_gift", "⚠️ Warning"),
+    ("spirit_gift", "👻 Spirit Gift"),
+    ("temporal_edge", "⏳ Temporal Edge"),
+    ("oracle_blessing", "🔮 Oracle Blessing"),
+    ("knowledge_shard", "📜 Knowledge"),
+    ("fresh_water", "💧 Fresh Water"),
+    ("seeds", "🌱 Seeds"),
+    ("blessing", "✨ Blessing"),
+    ("volcanic_treasure", "🌋 Molten Treasure"),
+):
+    items.register(name, label)
+
+ARMOR = items.mask("armor", "shield")
+PROTECTION = items.mask("medkit", "medicine", "potion")
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import random
+from typing import Optional
+
 from tortoise import fields
 from tortoise.models import Model
 
+from utils.items import ARMOR, PROTECTION
+from utils.items import items as item_registry
+
 
 class BaseModel(Model):
     """Base model for all models."""
@@ -15,26 +21,43 @@ class BaseModel(Model):
     updated_at = fields.DatetimeField(auto_now=True)
 
 
+def generate_seed() -> int:
+    """Returns a new random game seed."""
+    return random.getrandbits(63)
+
+
 class GameModel(BaseModel):
     """Represents a Hunger Games game."""
 
     guild_id = fields.BigIntField()
     channel_id = fields.BigIntField()
     message_id = fields.BigIntField(null=True)
+    thread_id = fields.BigIntField(null=True)
     owner_id = fields.BigIntField()
 
     is_invite_only = fields.BooleanField(default=False)
     is_started = fields.BooleanField(default=False)
     is_ended = fields.BooleanField(default=False)
+    # Posts the events of a day in one message with the day summary
+    is_digest = fields.BooleanField(default=False)
+    # Posts the game in its own thread, opened on the game message at the start
+    is_threaded = fields.BooleanField(default=False)
+    # Debug and load test games, left out of the stats
+    is_debug = fields.BooleanField(default=False)
 
     day_length = fields.IntField(default=60)
     max_players = fields.IntField(default=24)
     current_day = fields.IntField(default=1)
     current_day_choices = fields.JSONField(default=[])
     invited_users = fields.JSONField(default=[])
+    seed = fields.BigIntField(null=True, default=generate_seed)
 
     players: fields.ReverseRelation[PlayerModel]
     winner: fields.BackwardOneToOneRelation[PlayerModel]
+    events: fields.ReverseRelation[EventLogModel]
+
+    class Meta:
+        indexes = (("guild_id", "is_ended"), ("is_started", "is_ended"))
 
     def __str__(self) -> str:
         return f"#{self.id}"
@@ -71,49 +94,109 @@ class PlayerModel(BaseModel):
         "models.PlayerModel", related_name="killed_by"
     )
 
+    class Meta:
+        indexes = (("game_id", "is_alive", "current_day"),)
+
+    # In-memory item mask, `inventory` is only rebuilt from it by `pack_inventory`
+    _items: int = 0
+    _items_source: Optional[list] = None
+    _items_changed: bool = False
+
+    @property
+    def items(self) -> int:
+        """Bitmask of the items in the inventory, see utils.items."""
+        if self.inventory is not self._items_source:
+            # The inventory was loaded or assigned, it wins over the mask
+            self._items = item_registry.pack(self.inventory)
+            self._items_source = self.inventory
+            self._items_changed = False
+        return self._items
+
+    @items.setter
+    def items(self, mask: int) -> None:
+        if self.inventory is not self._items_source:
+            self._items_source = self.inventory
+        self._items = mask
+        self._items_changed = True
+
+    def pack_inventory(self) -> None:
+        """Writes the item mask back to the inventory before persisting it."""
+        if self.inventory is self._items_source and self._items_changed:
+            self.inventory = self._items_source = item_registry.unpack(self._items)
+            self._items_changed = False
+
+    async def save(self, *args, **kwargs) -> None:
+        self.pack_inventory()
+        await super().save(*args, **kwargs)
+
     def has_item(self, item: str) -> bool:
-        item_name = str(item).strip().lower()
-        raw_items = self.inventory or []
-        return any(str(existing).strip().lower() == item_name for existing in raw_items)
+        return bool(self.items & item_registry.bit(item))
 
     def add_item(self, item: str) -> bool:
-        item_name = str(item).strip().lower()
-        if not item_name:
+        bit = item_registry.bit(item)
+        if not bit or self.items & bit:
             return False
 
-        inventory = list(self.inventory or [])
-        normalized = [str(existing).strip().lower() for existing in inventory]
-        if item_name in normalized:
-            return False
-
-        inventory.append(item_name)
-        self.inventory = inventory
+        self.items |= bit
         return True
 
     def remove_item(self, item: str) -> bool:
-        item_name = str(item).strip().lower()
-        if not item_name:
-            return False
-
-        inventory = list(self.inventory or [])
-        remaining = [
-            existing
-            for existing in inventory
-            if str(existing).strip().lower() != item_name
-        ]
-        if len(remaining) == len(inventory):
+        bit = item_registry.bit(item)
+        if not self.items & bit:
             return False
 
-        self.inventory = remaining
+        self.items &= ~bit
         return True
 
     def sync_gear_from_inventory(self) -> None:
-        self.is_armored = self.has_item("armor") or self.has_item("shield")
-        self.is_protected = (
-            self.has_item("medkit")
-            or self.has_item("medicine")
-            or self.has_item("potion")
-        )
+        self.is_armored = bool(self.items & ARMOR)
+        self.is_protected = bool(self.items & PROTECTION)
 
     def __str__(self) -> str:
         return f"` Bot #{self.user_id} `" if self.is_bot else f"<@{self.user_id}>"
+
+
+class EventLogModel(BaseModel):
+    """Append-only log of the events of a game."""
+
+    game: fields.ForeignKeyRelation[GameModel] = fields.ForeignKeyField(
+        "models.GameModel", related_name="events"
+    )
+    day = fields.IntField()
+    tick = fields.IntField()  # order of the event within the day
+
+    name = fields.CharField(max_length=64)
+    type = fields.CharField(max_length=16)
+    actor_id = fields.IntField()
+    target_id = fields.IntField(null=True)
+    text = fields.TextField()
+
+    class Meta:
+        unique_together = (("game_id", "day", "tick"),)
+
+
+class PlayerStatsModel(BaseModel):
+    """Career stats of a user in a guild, guild_id 0 holds the global stats."""
+
+    user_id = fields.BigIntField()
+    guild_id = fields.BigIntField(default=0)
+
+    games = fields.IntField(default=0)
+    wins = fields.IntField(default=0)
+    kills = fields.IntField(default=0)
+    deaths = fields.IntField(default=0)
+    best_day = fields.IntField(default=0)
+
+    class Meta:
+        unique_together = (("user_id", "guild_id"),)
+
+
+class GuildStatsModel(BaseModel):
+    """Rollup of the games of a guild, with a ring of its recent winners."""
+
+    guild_id = fields.BigIntField(unique=True)
+
+    games = fields.IntField(default=0)
+    finished = fields.IntField(default=0)
+    kills = fields.IntField(default=0)
+    recent_winners = fields.JSONField(default=[])
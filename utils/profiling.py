@@ -0,0 +1,185 @@
+"""Latency histograms of the game hot paths.
+
+Timings are grouped by stage ("event" callbacks, "db" writes and Discord
+"send"s) and by name within the stage, each in a histogram with logarithmic
+buckets like HdrHistogram: recording is a couple of integer operations and
+the memory of a histogram is bounded whatever the number of samples. The
+profile is shown by `/hgprofile` and dumped to PROFILE_PATH on shutdown.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import Optional
+
+from utils import settings
+
+
+class Histogram(object):
+    """Latency histogram in nanoseconds, with a bounded relative error.
+
+    Values are grouped by their power of two, and every power of two is split
+    in 2 ** (SUB_BITS - 1) linear buckets, so a value is reported within
+    1 / 2 ** (SUB_BITS - 1) of itself.
+    """
+
+    SUB_BITS = 7
+
+    __slots__ = ("buckets", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.buckets: dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    @classmethod
+    def _span(cls, bucket: int) -> int:
+        return 1 << max(bucket.bit_length() - cls.SUB_BITS, 0)
+
+    def record(self, value: int) -> None:
+        """Records a value in nanoseconds."""
+        shift = value.bit_length() - self.SUB_BITS
+        bucket = value >> shift << shift if shift > 0 else value
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+        if not self.count or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def percentile(self, percent: float) -> int:
+        """Returns the highest value of the bucket holding the given percentile."""
+        if not self.count:
+            return 0
+
+        rank = max(round(self.count * percent / 100), 1)
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(bucket + self._span(bucket) - 1, self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_ms": self.total / 1e6,
+            "mean_us": self.mean / 1e3,
+            "min_us": self.min / 1e3,
+            "p50_us": self.percentile(50) / 1e3,
+            "p90_us": self.percentile(90) / 1e3,
+            "p99_us": self.percentile(99) / 1e3,
+            "max_us": self.max / 1e3,
+            "buckets": {str(bucket): count for bucket, count in self.buckets.items()},
+        }
+
+
+class Timer(object):
+    """Context manager recording its duration in a histogram of the profiler."""
+
+    __slots__ = ("profiler", "key", "start")
+
+    def __init__(self, profiler: Profiler, key: tuple[str, str]):
+        self.profiler = profiler
+        self.key = key
+
+    def __enter__(self) -> Timer:
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.profiler.record(*self.key, time.perf_counter_ns() - self.start)
+
+
+class NullTimer(object):
+    """Timer of a disabled profiler."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> NullTimer:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+class Profiler(object):
+    """Latency histograms per stage and name."""
+
+    def __init__(self, enabled: bool = settings.PROFILE):
+        """Initializes the Profiler.
+
+        Args:
+            enabled (bool): Record the timings, a disabled profiler costs nothing.
+        """
+        self.enabled = enabled
+        self.histograms: dict[tuple[str, str], Histogram] = {}
+        self.started = time.time()
+
+    def time(self, stage: str, name: str) -> Timer | NullTimer:
+        """Returns a context manager timing its block."""
+        if not self.enabled:
+            return NULL_TIMER
+        return Timer(self, (stage, name))
+
+    def record(self, stage: str, name: str, elapsed: int) -> None:
+        """Records a duration in nanoseconds."""
+        histogram = self.histograms.get((stage, name))
+        if histogram is None:
+            histogram = self.histograms[(stage, name)] = Histogram()
+        histogram.record(elapsed)
+
+    def reset(self) -> None:
+        """Drops all the recorded timings."""
+        self.histograms.clear()
+        self.started = time.time()
+
+    def rows(self, stage: Optional[str] = None) -> list[tuple[str, str, Histogram]]:
+        """Returns the histograms of a stage, or of all, by total time spent."""
+        rows = [
+            (row_stage, name, histogram)
+            for (row_stage, name), histogram in self.histograms.items()
+            if stage is None or row_stage == stage
+        ]
+        return sorted(rows, key=lambda row: row[2].total, reverse=True)
+
+    def format(self, stage: Optional[str] = None, limit: int = 20) -> str:
+        """Returns a table of the slowest names, timings in milliseconds."""
+        lines = [
+            f"{'stage':<6} {'name':<26} {'count':>7} {'p50':>7} {'p99':>7} "
+            f"{'max':>8} {'total':>9}"
+        ]
+        for row_stage, name, histogram in self.rows(stage=stage)[:limit]:
+            lines.append(
+                f"{row_stage:<6} {name[:26]:<26} {histogram.count:>7} "
+                f"{histogram.percentile(50) / 1e6:>7.3f} "
+                f"{histogram.percentile(99) / 1e6:>7.3f} "
+                f"{histogram.max / 1e6:>8.2f} {histogram.total / 1e6:>9.1f}"
+            )
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        stages: dict[str, dict] = {}
+        for stage, name, histogram in self.rows():
+            stages.setdefault(stage, {})[name] = histogram.to_dict()
+        return {"started": self.started, "ended": time.time(), "stages": stages}
+
+    def dump(self, path: str = settings.PROFILE_PATH) -> None:
+        """Writes the profile to a JSON file, if anything was recorded."""
+        if self.histograms:
+            with open(path, "w") as file:
+                json.dump(self.to_dict(), file, indent=2)
+
+
+NULL_TIMER = NullTimer()
+
+profiler = Profiler()
@@ -0,0 +1,287 @@
+"""Career stats of the players and rollups of the guilds.
+
+Stats are kept in PlayerStatsModel and GuildStatsModel and updated
+incrementally when a game is created and when it ends. For history recorded
+before the stats tables existed, run the backfill job once:
+
+    python -m utils.stats
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterable, Optional
+
+from pypika import Table, functions
+from tortoise import connections
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.functions import Count
+from tortoise.transactions import in_transaction
+
+from utils import settings, storage
+from utils.models import GameModel, GuildStatsModel, PlayerModel, PlayerStatsModel
+
+# Guild id of the global stats rows
+GLOBAL = 0
+# Number of winners kept in the recent winners ring of a guild
+RECENT_WINNERS = 3
+
+
+@dataclass
+class Career:
+    """Stats of a single game, or the sum of several games."""
+
+    games: int = 0
+    wins: int = 0
+    kills: int = 0
+    deaths: int = 0
+    best_day: int = 0
+
+    def add(self, other: Career) -> None:
+        self.games += other.games
+        self.wins += other.wins
+        self.kills += other.kills
+        self.deaths += other.deaths
+        self.best_day = max(self.best_day, other.best_day)
+
+
+async def count_kills(
+    player_ids: list[int], using_db: Optional[BaseDBAsyncClient] = None
+) -> dict[int, int]:
+    """Returns the kill counts of the players, read from the kills join table.
+
+    Grouping over the self-referencing relation through the ORM emits ambiguous
+    aliases, so the join table is queried directly.
+    """
+    if not player_ids:
+        return {}
+
+    field = PlayerModel._meta.fields_map["killed_players"]
+    table = Table(field.through)
+    killer = table[field.backward_key]
+
+    connection = using_db or PlayerModel._meta.db
+    query = (
+        connection.query_class.from_(table)
+        .select(killer, functions.Count("*").as_("kills"))
+        .where(killer.isin(player_ids))
+        .groupby(killer)
+    )
+    rows = await connection.execute_query_dict(query.get_sql())
+    return {row[field.backward_key]: row["kills"] for row in rows}
+
+
+@dataclass
+class Rollup:
+    """Stats of the games of a guild."""
+
+    games: int = 0
+    finished: int = 0
+    kills: int = 0
+    # (ended at, winner) pairs, the newest winners are shown first
+    winners: list[tuple[datetime, dict]] = field(default_factory=list)
+
+    def add(self, other: Rollup) -> None:
+        self.games += other.games
+        self.finished += other.finished
+        self.kills += other.kills
+        self.winners = recent_winners(self.winners + other.winners)
+
+
+def recent_winners(winners: list[tuple[datetime, dict]]) -> list[tuple[datetime, dict]]:
+    """Returns the newest winners that fit in the ring."""
+    return sorted(winners, key=lambda winner: winner[0], reverse=True)[:RECENT_WINNERS]
+
+
+async def summarize_games(
+    games: Iterable[GameModel], using_db: Optional[BaseDBAsyncClient] = None
+) -> tuple[dict[tuple[int, int], Career], dict[int, Rollup]]:
+    """Returns the careers of the human players by (user, guild) and the
+    rollups by guild of ended games.
+    """
+    games = {game.id: game for game in games}
+    players = await PlayerModel.filter(game_id__in=list(games)).using_db(using_db)
+    kills = await count_kills([player.id for player in players], using_db)
+
+    rollups: dict[int, Rollup] = {}
+    for game in games.values():
+        rollups.setdefault(game.guild_id, Rollup()).finished += 1
+
+    careers: dict[tuple[int, int], Career] = {}
+    for player in players:
+        game = games[player.game_id]
+        rollup = rollups[game.guild_id]
+        rollup.kills += kills.get(player.id, 0)
+        if player.is_bot:
+            continue
+
+        if player.winner_of_id is not None:
+            rollup.winners.append(
+                (game.updated_at, {"user_id": player.user_id, "game_id": game.id})
+            )
+
+        career = Career(
+            games=1,
+            wins=int(player.winner_of_id is not None),
+            kills=kills.get(player.id, 0),
+            deaths=int(not player.is_alive),
+            best_day=player.current_day,
+        )
+        for guild_id in (game.guild_id, GLOBAL):
+            careers.setdefault((player.user_id, guild_id), Career()).add(career)
+    return careers, rollups
+
+
+async def apply_careers(
+    careers: dict[tuple[int, int], Career],
+    using_db: Optional[BaseDBAsyncClient] = None,
+) -> None:
+    """Adds the careers to the stored stats."""
+    if not careers:
+        return
+
+    rows = {
+        (row.user_id, row.guild_id): row
+        for row in await PlayerStatsModel.filter(
+            user_id__in={user_id for user_id, _ in careers},
+            guild_id__in={guild_id for _, guild_id in careers},
+        )
+        .select_for_update()
+        .using_db(using_db)
+    }
+
+    created = []
+    for (user_id, guild_id), career in careers.items():
+        row = rows.get((user_id, guild_id))
+        if not row:
+            row = PlayerStatsModel(user_id=user_id, guild_id=guild_id)
+            created.append(row)
+
+        row.games += career.games
+        row.wins += career.wins
+        row.kills += career.kills
+        row.deaths += career.deaths
+        row.best_day = max(row.best_day, career.best_day)
+
+    updated = [row for row in rows.values() if (row.user_id, row.guild_id) in careers]
+    if updated:
+        await PlayerStatsModel.bulk_update(
+            updated,
+            fields=("games", "wins", "kills", "deaths", "best_day", "updated_at"),
+            using_db=using_db,
+        )
+    if created:
+        await PlayerStatsModel.bulk_create(created, using_db=using_db)
+
+
+async def apply_rollups(
+    rollups: dict[int, Rollup], using_db: Optional[BaseDBAsyncClient] = None
+) -> None:
+    """Adds the rollups to the stored guild stats."""
+    if not rollups:
+        return
+
+    rows = {
+        row.guild_id: row
+        for row in await GuildStatsModel.filter(guild_id__in=list(rollups))
+        .select_for_update()
+        .using_db(using_db)
+    }
+
+    created = []
+    for guild_id, rollup in rollups.items():
+        row = rows.get(guild_id)
+        if not row:
+            row = GuildStatsModel(guild_id=guild_id)
+            created.append(row)
+
+        row.games += rollup.games
+        row.finished += rollup.finished
+        row.kills += rollup.kills
+        if rollup.winners:
+            winners = [winner for _, winner in recent_winners(rollup.winners)]
+            row.recent_winners = (winners + row.recent_winners)[:RECENT_WINNERS]
+
+    if rows:
+        await GuildStatsModel.bulk_update(
+            list(rows.values()),
+            fields=("games", "finished", "kills", "recent_winners", "updated_at"),
+            using_db=using_db,
+        )
+    if created:
+        await GuildStatsModel.bulk_create(created, using_db=using_db)
+
+
+async def record_created(
+    game: GameModel, using_db: Optional[BaseDBAsyncClient] = None
+) -> None:
+    """Counts a new game in the stats of its guild."""
+    await apply_rollups({game.guild_id: Rollup(games=1)}, using_db)
+
+
+async def record_deleted(
+    game: GameModel, using_db: Optional[BaseDBAsyncClient] = None
+) -> None:
+    """Takes a deleted game back out of the stats of its guild."""
+    await apply_rollups({game.guild_id: Rollup(games=-1)}, using_db)
+
+
+async def record_game(game: GameModel, using_db: BaseDBAsyncClient) -> None:
+    """Adds an ended game to the stats of its players and its guild."""
+    if game.is_debug:
+        return
+    careers, rollups = await summarize_games([game], using_db=using_db)
+    await apply_careers(careers, using_db)
+    await apply_rollups(rollups, using_db)
+
+
+async def backfill(batch_size: int = 500) -> int:
+    """Rebuilds the stats tables from all games, returns the ended game count."""
+    careers: dict[tuple[int, int], Career] = {}
+    rollups: dict[int, Rollup] = {}
+
+    created = (
+        await GameModel.filter(is_debug=False)
+        .annotate(count=Count("id"))
+        .group_by("guild_id")
+        .values_list("guild_id", "count")
+    )
+    for guild_id, count in created:
+        rollups[guild_id] = Rollup(games=count)
+
+    count, last_id = 0, 0
+    while (
+        games := await GameModel.filter(is_ended=True, is_debug=False, id__gt=last_id)
+        .order_by("id")
+        .limit(batch_size)
+    ):
+        game_careers, game_rollups = await summarize_games(games)
+        for key, career in game_careers.items():
+            careers.setdefault(key, Career()).add(career)
+        for guild_id, rollup in game_rollups.items():
+            rollups.setdefault(guild_id, Rollup()).add(rollup)
+        count += len(games)
+        last_id = games[-1].id
+
+    async with in_transaction(storage.WRITER) as connection:
+        await PlayerStatsModel.all().using_db(connection).delete()
+        await GuildStatsModel.all().using_db(connection).delete()
+        await apply_careers(careers, using_db=connection)
+        await apply_rollups(rollups, using_db=connection)
+
+    return count
+
+
+async def main() -> None:
+    await storage.init(db_url=settings.DB_URL)
+    await storage.generate_schemas()
+    try:
+        print(f"Backfilled the stats of {await backfill()} ended games.")
+    finally:
+        await connections.close_all()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,212 @@
+"""Database configuration, the single writer and the read pool.
+
+SQLite databases are opened in WAL mode with tuned pragmas. All writes go
+through one writer task that groups the queued writes into a transaction,
+while read-only commands use a small pool of query-only read connections,
+which WAL lets run next to the writer. PostgreSQL databases use a single
+asyncpg connection pool for both.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+from collections import deque
+from typing import Any, Awaitable, Callable, Optional, Type, TypeVar
+
+from tortoise import Tortoise, connections
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.backends.base.config_generator import expand_db_url
+from tortoise.models import Model
+from tortoise.transactions import in_transaction
+from tortoise.utils import generate_schema_for_client
+
+from utils import settings
+
+T = TypeVar("T")
+M = TypeVar("M", bound=Model)
+
+# A write receives the connection of the transaction it runs in
+Job = Callable[[BaseDBAsyncClient], Awaitable[T]]
+
+WRITER = "default"
+READER = "read_{}"
+
+SQLITE = "tortoise.backends.sqlite"
+POSTGRES = "tortoise.backends.asyncpg"
+
+
+def sqlite_pragmas() -> dict[str, Any]:
+    """Returns the pragmas of the SQLite connections."""
+    return {
+        "journal_mode": "WAL",
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "cache_size": -settings.SQLITE_CACHE_SIZE,
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT,
+        "temp_store": "MEMORY",
+        "foreign_keys": "ON",
+    }
+
+
+def tortoise_config(
+    db_url: str = settings.DB_URL, read_pool: int = settings.READ_POOL_SIZE
+) -> dict:
+    """Returns the Tortoise config of the database, with its read connections."""
+    writer = expand_db_url(db_url)
+    database = {WRITER: writer}
+
+    if writer["engine"] == POSTGRES:
+        writer["credentials"] = {
+            "minsize": settings.DB_POOL_MIN_SIZE,
+            "maxsize": settings.DB_POOL_MAX_SIZE,
+            **writer["credentials"],
+        }
+    elif writer["engine"] == SQLITE:
+        # Options of the URL win over the defaults
+        writer["credentials"] = {**sqlite_pragmas(), **writer["credentials"]}
+
+        # Every in-memory connection is a database of its own, it can't be shared
+        if writer["credentials"]["file_path"] != ":memory:":
+            for index in range(read_pool):
+                database[READER.format(index)] = {
+                    "engine": writer["engine"],
+                    "credentials": {**writer["credentials"], "query_only": "ON"},
+                }
+
+    return {
+        "connections": database,
+        "apps": {
+            "models": {
+                "models": ["utils.models"],
+                "default_connection": WRITER,
+            },
+        },
+    }
+
+
+_readers: list[str] = []
+_next_reader = itertools.count()
+
+
+async def init(db_url: str = settings.DB_URL, **kwargs: Any) -> None:
+    """Opens the database connections, kwargs are passed to Tortoise.init."""
+    config = tortoise_config(db_url=db_url)
+    await Tortoise.init(config=config, **kwargs)
+
+    _readers[:] = [name for name in config["connections"] if name != WRITER]
+
+
+async def generate_schemas() -> None:
+    """Creates the missing tables, the read connections can't write them."""
+    await generate_schema_for_client(connections.get(WRITER), safe=True)
+
+
+def read_db() -> BaseDBAsyncClient:
+    """Returns the next connection of the read pool, or the writer without one."""
+    if not _readers:
+        return connections.get(WRITER)
+    return connections.get(_readers[next(_next_reader) % len(_readers)])
+
+
+class Writer(object):
+    """Single writer of the database.
+
+    Queued writes run one after the other in a single transaction, so a burst
+    of game flushes costs one commit. If the transaction fails, its writes are
+    retried one by one so a bad write only fails itself. Writes may therefore
+    run twice and must only touch the database.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = settings.WRITE_BATCH_SIZE,
+        connection_name: str = WRITER,
+    ):
+        """Initializes the Writer.
+
+        Args:
+            batch_size (int): Maximum number of writes grouped in a transaction.
+            connection_name (str): Connection the writes run on.
+        """
+        self.batch_size = batch_size
+        self.connection_name = connection_name
+
+        self.queue: deque[tuple[Job, asyncio.Future]] = deque()
+        self._task: Optional[asyncio.Task] = None
+
+        # Metrics
+        self.writes = 0
+        self.transactions = 0
+
+    def write(self, job: Job[T]) -> asyncio.Future[T]:
+        """Queues a write and returns a future of its result."""
+        future = asyncio.get_running_loop().create_future()
+        self.queue.append((job, future))
+
+        if not self._task or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+        return future
+
+    async def _run(self) -> None:
+        # Exits once the queue is drained, `write` starts it again
+        while self.queue:
+            batch = []
+            while self.queue and len(batch) < self.batch_size:
+                batch.append(self.queue.popleft())
+
+            if len(batch) == 1:
+                await self._isolated(*batch[0])
+                continue
+
+            try:
+                results = await self._transaction(batch)
+            except Exception:
+                # Retry the writes one by one, so only the bad ones fail
+                for job, future in batch:
+                    await self._isolated(job, future)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def _transaction(self, batch: list[tuple[Job, asyncio.Future]]) -> list:
+        self.transactions += 1
+        async with in_transaction(self.connection_name) as connection:
+            results = [await job(connection) for job, _ in batch]
+        self.writes += len(batch)
+        return results
+
+    async def _isolated(self, job: Job, future: asyncio.Future) -> None:
+        try:
+            result = (await self._transaction([(job, future)]))[0]
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
+
+
+writer = Writer()
+
+
+async def write(job: Job[T]) -> T:
+    """Runs a write through the writer and returns its result."""
+    return await writer.write(job)
+
+
+async def save(*instances: Model) -> None:
+    """Saves the instances in the same transaction."""
+
+    async def job(connection: BaseDBAsyncClient) -> None:
+        for instance in instances:
+            await instance.save(using_db=connection)
+
+    await write(job)
+
+
+async def create(model: Type[M], **kwargs: Any) -> M:
+    """Creates an instance of the model."""
+    return await write(lambda connection: model.create(using_db=connection, **kwargs))